@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+"""
+Benchmarks of the main configmanager code paths on synthetic configurations.
+
+Usage::
+
+    python benchmarks/run.py --sizes 100 10000 --output results.json
+    python benchmarks/run.py --sizes 100 10000 --compare results.json
+
+Results are written as JSON so that runs against different versions can be compared.
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import configmanager  # noqa
+from configmanager import Config  # noqa
+
+
+#: Maximum number of items to access per run of the access benchmarks.
+SAMPLE_SIZE = 1000
+
+ENVVAR_PREFIX = 'CMBENCH'
+
+
+def generate_schema(num_items, width=10, depth=2):
+    """
+    Generate a schema of ``num_items`` items arranged in a tree of sections
+    in which every section has up to ``width`` sub-sections and items are declared
+    in sections ``depth`` levels deep.
+    """
+    num_leaves = width ** depth
+    items_per_leaf = max(1, -(-num_items // num_leaves))
+    counter = [0]
+
+    def generate_section(level):
+        section = collections.OrderedDict()
+        if level == depth:
+            for _ in range(items_per_leaf):
+                if counter[0] >= num_items:
+                    break
+                i = counter[0]
+                counter[0] += 1
+                section['item{}'.format(i)] = i if i % 2 else 'value{}'.format(i)
+        else:
+            for s in range(width):
+                if counter[0] >= num_items:
+                    break
+                section['section{}'.format(s)] = generate_section(level + 1)
+        return section
+
+    return generate_section(0)
+
+
+def sample_paths(config, sample_size=SAMPLE_SIZE):
+    paths = [path for path, _ in config.iter_items(recursive=True, key='path')]
+    step = max(1, len(paths) // sample_size)
+    return paths[::step][:sample_size]
+
+
+def bench_attribute_access(config, paths):
+    def run():
+        for path in paths:
+            obj = config
+            for name in path:
+                obj = getattr(obj, name)
+    return run
+
+
+def bench_get_item(config, paths):
+    def run():
+        for path in paths:
+            config.get_item(*path)
+    return run
+
+
+def bench_item_get(config, paths):
+    items = [config.get_item(*path) for path in paths]
+
+    def run():
+        for item in items:
+            item.get()
+    return run
+
+
+def bench_item_get_envvar(config, paths):
+    items = [config.get_item(*path) for path in paths]
+    for item in items:
+        item.envvar = '_'.join((ENVVAR_PREFIX,) + item.get_path()).upper()
+    for item in items[::2]:
+        os.environ[item.envvar] = str(item.default)
+
+    def run():
+        for item in items:
+            item.get()
+    return run
+
+
+def bench_iter_items(config, paths):
+    def run():
+        for _ in config.iter_items(recursive=True):
+            pass
+    return run
+
+
+def bench_dump_values(config, paths):
+    def run():
+        config.dump_values()
+    return run
+
+
+def bench_load_values(config, paths):
+    values = config.dump_values()
+
+    def run():
+        config.load_values(values)
+    return run
+
+
+def _adapter_benchmarks(adapter_name):
+    def bench_dumps(config, paths):
+        adapter = getattr(config, adapter_name)
+
+        def run():
+            adapter.dumps(with_defaults=True)
+        return run
+
+    def bench_loads(config, paths):
+        adapter = getattr(config, adapter_name)
+        string = adapter.dumps(with_defaults=True)
+
+        def run():
+            adapter.loads(string)
+        return run
+
+    return bench_dumps, bench_loads
+
+
+def _has_yaml():
+    try:
+        import yaml  # noqa
+        return True
+    except ImportError:
+        return False
+
+
+def _yaml_installed(options):
+    return _has_yaml()
+
+
+#: Benchmarks by name: benchmark function, condition on options under which it runs (or ``None``),
+#: and depth of the generated schema (or ``None`` for ``--depth``).
+benchmarks = collections.OrderedDict([
+    ('attribute_access', (bench_attribute_access, None, None)),
+    ('get_item', (bench_get_item, None, None)),
+    ('item_get', (bench_item_get, None, None)),
+    ('item_get_envvar', (bench_item_get_envvar, None, None)),
+    ('iter_items', (bench_iter_items, None, None)),
+    ('dump_values', (bench_dump_values, None, None)),
+    ('load_values', (bench_load_values, None, None)),
+])
+
+for _adapter_name, _condition, _depth in [
+    ('json', None, None),
+    ('yaml', _yaml_installed, None),
+    # INI files only hold items in sections (paths of two segments),
+    # so the INI adapter is always measured on a schema of depth 1.
+    ('configparser', None, 1),
+]:
+    _dumps, _loads = _adapter_benchmarks(_adapter_name)
+    benchmarks['{}_dumps'.format(_adapter_name)] = (_dumps, _condition, _depth)
+    benchmarks['{}_loads'.format(_adapter_name)] = (_loads, _condition, _depth)
+
+
+#: Benchmarks which access every sampled path once per run.
+_per_path_benchmarks = ('attribute_access', 'get_item', 'item_get', 'item_get_envvar')
+
+
+def run_benchmark(name, size, options):
+    bench, _, depth = benchmarks[name]
+    if depth is None:
+        depth = options.depth
+
+    schema = generate_schema(size, width=options.width, depth=depth)
+    config = Config(schema)
+    paths = sample_paths(config)
+
+    run = bench(config, paths)
+    try:
+        timings = timeit.repeat(run, repeat=options.repeat, number=options.number)
+    finally:
+        for key in list(os.environ):
+            if key.startswith(ENVVAR_PREFIX + '_'):
+                del os.environ[key]
+
+    return collections.OrderedDict([
+        ('benchmark', name),
+        ('items', size),
+        ('width', options.width),
+        ('depth', depth),
+        ('operations', len(paths) if name in _per_path_benchmarks else 1),
+        ('number', options.number),
+        ('best', min(timings) / options.number),
+        ('mean', sum(timings) / len(timings) / options.number),
+    ])
+
+
+def _result_key(result):
+    return result['benchmark'], result['items'], result['width'], result['depth']
+
+
+def compare_results(previous, current):
+    """
+    Print ratios of current best timings to previous best timings.
+    """
+    previous_timings = {_result_key(r): r['best'] for r in previous['results']}
+    for result in current['results']:
+        key = _result_key(result)
+        if key not in previous_timings:
+            continue
+        ratio = result['best'] / previous_timings[key] if previous_timings[key] else float('inf')
+        print('{:<20} {:>8} items  {:>6.2f}x'.format(result['benchmark'], result['items'], ratio), file=sys.stderr)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Numbers of items in generated configurations (up to 1000000)')
+    parser.add_argument('--width', type=int, default=10, help='Number of sub-sections of every section')
+    parser.add_argument('--depth', type=int, default=2,
+                        help='Depth of sections in which items are declared (INI benchmarks always use 1)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--number', type=int, default=1)
+    parser.add_argument('--only', nargs='+', choices=list(benchmarks), help='Run only these benchmarks')
+    parser.add_argument('--output', help='Write results to this file instead of stdout')
+    parser.add_argument('--compare', help='Compare results with previous results in this file')
+    options = parser.parse_args(args)
+
+    results = []
+    for size in options.sizes:
+        for name, (_, condition, _) in benchmarks.items():
+            if options.only and name not in options.only:
+                continue
+            if condition is not None and not condition(options):
+                print('{:<20} {:>8} items  skipped, {} is false'.format(name, size, condition.__name__),
+                      file=sys.stderr)
+                continue
+            result = run_benchmark(name, size, options)
+            print('{:<20} {:>8} items  {:.6f}s'.format(name, size, result['best']), file=sys.stderr)
+            results.append(result)
+
+    report = collections.OrderedDict([
+        ('configmanager', configmanager.__version__),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('results', results),
+    ])
+
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if options.compare:
+        with open(options.compare) as f:
+            compare_results(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,10 @@
 __version__ = '1.34.0'
 
 from .managers import Config
-from .items import Item
+from .items import Item, CompactItem
 from .exceptions import ConfigError, RequiredValueMissing, NotFound
 from .base import ItemAttribute
-from .persistence import ConfigPersistenceAdapter
+from .persistence import ConfigPersistenceAdapter, EnvvarSource
 from .item_types import Types
 from .sections import Section
 from .plain import PlainConfig
@@ -12,11 +12,13 @@ from .plain import PlainConfig
 
 all = [
     'Item',
+    'CompactItem',
     'Section',
     'Config',
     'PlainConfig',
     'ItemAttribute',
     'ConfigPersistenceAdapter',
+    'EnvvarSource',
     'Types',
     'ConfigError',
     'RequiredValueMissing',
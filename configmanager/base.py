@@ -31,12 +31,16 @@ class ItemAttribute(object):
     Class used in :class:`.Item` class to declare attributes of config items.
     """
 
-    def __init__(self, name, default=not_set, value=not_set, allow_dynamic_override=False):
+    def __init__(self, name, default=not_set, value=not_set, allow_dynamic_override=False, affects_value=False):
         self.name = name
         self.default = default
         self.value = value
         self.attr_name = '_{}'.format(self.name)
 
+        # If set to True, changing this attribute discards the cached effective value
+        # of the item (see cache_values setting).
+        self.affects_value = affects_value
+
         # If set to True, this becomes an expensive attribute because now when
         # its value is requested we will check for a registered
         # dynamic attribute with the same name and if available use the dynamic value instead of set value.
@@ -48,6 +52,8 @@ class ItemAttribute(object):
 
     def __set__(self, instance, value):
         setattr(instance, self.attr_name, value)
+        if self.affects_value:
+            instance._invalidate_cache(envvar_name=True)
 
     def __get__(self, instance, owner):
         if self.allow_dynamic_override:
@@ -21,20 +21,21 @@ class _ChangesetContext(object):
         if self._auto_reset:
             self.reset()
 
-    def _value_changed(self, item, old_value, new_value, old_raw_str_value, new_raw_str_value):
-        if old_value != new_value or old_raw_str_value != new_raw_str_value:
-            self._changes[item].append(_Change(old_value, new_value, old_raw_str_value, new_raw_str_value))
+    def _values_changed(self, changes):
+        for item, old_value, new_value, old_raw_str_value, new_raw_str_value in changes:
+            if old_value != new_value or old_raw_str_value != new_raw_str_value:
+                self._changes[item].append(_Change(old_value, new_value, old_raw_str_value, new_raw_str_value))
 
     def push(self):
         assert self.hook is None
-        self.hook = self.config.hooks.item_value_changed.register_hook(self._value_changed)
+        self.hook = self.config.hooks.item_values_changed.register_hook(self._values_changed)
         self.config._changeset_contexts.append(self)
         return self
 
     def pop(self):
         popped = self.config._changeset_contexts.pop()
         assert popped is self
-        self.config.hooks.unregister_hook(self.config.hooks.item_value_changed, self._value_changed)
+        self.config.hooks.unregister_hook(self.config.hooks.item_values_changed, self._values_changed)
         self.hook = None
 
     @property
@@ -78,6 +79,8 @@ class _ChangesetContext(object):
             if item is None or k is item:
                 k._value = k_changes[0].old_value
                 k.raw_str_value = k_changes[0].old_raw_str_value
+                k._invalidate_cache()
+                k._track_value()
 
         if item is None:
             self._changes.clear()
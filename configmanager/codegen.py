@@ -0,0 +1,145 @@
+"""
+Generates Python modules with classes which give fast attribute access to values of items
+of a built :class:`.Config`, for example ``accessor.uploads.db.user`` instead of ``config.uploads.db.user.value``.
+
+Every section is represented by a class with ``__slots__`` in which sub-sections are plain attributes
+and items are properties returning values of the items. The generated module does not depend on
+the configuration from which it was generated, so it can be written to disk with :func:`write_module`
+and imported like any other module, in which case Python caches its compiled code.
+
+Generated classes are bound to items of the configuration when instantiated, so an instance has to be
+created again if items or sections are added to the configuration afterwards.
+"""
+import hashlib
+import itertools
+import keyword
+import re
+import types
+
+from .persistence import _open_for_atomic_write
+
+
+_identifier_re = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+
+
+def _get_version():
+    from . import __version__
+    return __version__
+
+
+def _get_attribute_name(key):
+    """
+    Returns name of the attribute through which the item or section stored under ``key`` is accessed,
+    or ``None`` if it can't be accessed through an attribute.
+    """
+    if not _identifier_re.match(key):
+        return None
+    if keyword.iskeyword(key):
+        return key + '_'
+    return key
+
+
+def _iter_structure(section, path=()):
+    """
+    Iterate over ``(path, obj)`` pairs of all items and sections in ``section`` by their keys,
+    including items stored under both name and alias.
+    """
+    for key, obj in section._tree.items():
+        yield path + (key,), obj
+        if obj.is_section:
+            for pair in _iter_structure(obj, path + (key,)):
+                yield pair
+
+
+def get_fingerprint(config):
+    """
+    Returns a string which changes whenever items or sections are added to ``config``.
+    Modules generated from configurations with the same fingerprint are the same.
+    """
+    digest = hashlib.sha1(_get_version().encode('utf-8'))
+    for path, obj in _iter_structure(config):
+        digest.update(repr(('S' if obj.is_section else 'I',) + path).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def generate_module(config, class_name='ConfigAccessor'):
+    """
+    Returns source code of a module with accessor classes for ``config``.
+    The class of the root section is called ``class_name`` and takes the configuration as its only argument.
+    """
+    classes = []
+    class_names = ('_{}_{}'.format(class_name, i) for i in itertools.count(1))
+
+    def generate_class(section, name, path):
+        slots = []
+        init_lines = []
+        properties = []
+        used_names = set()
+
+        for key, obj in section._tree.items():
+            attr = _get_attribute_name(key)
+            if attr is None or attr in used_names:
+                continue
+            used_names.add(attr)
+
+            if obj.is_section:
+                sub_name = next(class_names)
+                generate_class(obj, sub_name, path + (key,))
+                slots.append(attr)
+                init_lines.append('        self.{} = {}(tree[{!r}])'.format(attr, sub_name, key))
+            else:
+                slots.append('_item_' + attr)
+                init_lines.append('        self._item_{} = tree[{!r}]'.format(attr, key))
+                properties.append(
+                    '    @property\n'
+                    '    def {attr}(self):\n'
+                    '        return self._item_{attr}.get()\n'.format(attr=attr)
+                )
+
+        lines = [
+            'class {}(object):'.format(name),
+            '    """{}"""'.format('.'.join(path) or '<root>'),
+            '',
+            '    __slots__ = ({})'.format(''.join('{!r}, '.format(slot) for slot in slots).rstrip()),
+            '',
+            '    def __init__(self, section):',
+        ]
+        if init_lines:
+            lines.append('        tree = section._tree')
+            lines.extend(init_lines)
+        else:
+            lines.append('        pass')
+
+        source = '\n'.join(lines) + '\n'
+        if properties:
+            source += '\n' + '\n'.join(properties)
+        classes.append(source)
+
+    generate_class(config, class_name, ())
+
+    header = (
+        '# Generated by configmanager {version}. Do not edit.\n'
+        '\n'
+        '#: Fingerprint of the configuration from which the module was generated (see configmanager.codegen).\n'
+        'FINGERPRINT = {fingerprint!r}\n'
+    ).format(version=_get_version(), fingerprint=get_fingerprint(config))
+
+    return header + ''.join('\n\n' + source for source in classes)
+
+
+def write_module(config, path, class_name='ConfigAccessor'):
+    """
+    Write module generated with :func:`generate_module` to file at ``path``.
+    """
+    with _open_for_atomic_write(path) as f:
+        f.write(generate_module(config, class_name=class_name))
+
+
+def build_accessor(config, class_name='ConfigAccessor'):
+    """
+    Generate accessor classes for ``config`` and return an instance of the root class bound to ``config``.
+    """
+    module = types.ModuleType('configmanager_generated_{}'.format(class_name))
+    exec(compile(generate_module(config, class_name=class_name), '<{}>'.format(module.__name__), 'exec'),
+         module.__dict__)
+    return getattr(module, class_name)(config)
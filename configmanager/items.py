@@ -1,4 +1,5 @@
 from builtins import str
+import collections
 import copy
 import os
 
@@ -7,7 +8,13 @@ import six
 from .base import ItemAttribute, BaseItem
 from .exceptions import RequiredValueMissing
 from .item_types import Types
-from .utils import not_set
+from .utils import not_set, deferred, _freeze, _thaw
+
+
+#: Record of a change of item's value, passed to ``item_values_changed`` hooks.
+ItemValueChange = collections.namedtuple('ItemValueChange', field_names=(
+    'item', 'old_value', 'new_value', 'old_raw_str_value', 'new_raw_str_value'
+))
 
 
 class Item(BaseItem):
@@ -40,7 +47,7 @@ class Item(BaseItem):
     name = ItemAttribute('name')
 
     #: Type of the config item's value, a callable. Defaults to string.
-    type = ItemAttribute('type', default=Types.str)
+    type = ItemAttribute('type', default=Types.str, affects_value=True)
 
     raw_str_value = ItemAttribute('raw_str_value')
 
@@ -52,11 +59,11 @@ class Item(BaseItem):
     #: If set to True, will use value of envvar_name as the name of environment variable to check for value override.
     #: If set to True and envvar_name is not set, will use auto-generated name based on item's path
     #: in the configuration tree: SECTION1_SECTION2_ITEMNAME.
-    envvar = ItemAttribute('envvar', default=None)
+    envvar = ItemAttribute('envvar', default=None, affects_value=True)
 
     #: See envvar.
     #: Note that you can override this so you don't have to specify name for each enabled envvar individually.
-    envvar_name = ItemAttribute('envvar_name', default=None, allow_dynamic_override=True)
+    envvar_name = ItemAttribute('envvar_name', default=None, allow_dynamic_override=True, affects_value=True)
 
     def _get_kwarg(self, name, kwargs):
         """
@@ -82,6 +89,14 @@ class Item(BaseItem):
 
         self._section = None
 
+        # Cached name of the environment variable and cached effective value,
+        # populated only if the item belongs to a Config with cache_values enabled.
+        self._cached_envvar_name = not_set
+        self._cached_value = not_set
+
+        # Set to True when the item is added to a Config with frozen_values enabled.
+        self._frozen = False
+
         if name is not not_set:
             if not isinstance(name, six.string_types):
                 raise TypeError('Item name must be a string, got {!r}'.format(type(name)))
@@ -149,7 +164,7 @@ class Item(BaseItem):
         if self.raw_str_value is not not_set:
             return self.raw_str_value
         if self._value is not not_set or self.default is not not_set:
-            return str(self.value)
+            return str(_thaw(self.value) if self._frozen else self.value)
         else:
             return repr(self)
 
@@ -170,18 +185,58 @@ class Item(BaseItem):
 
     @default.setter
     def default(self, value):
+        self._cached_value = not_set
         if value is not_set or value is None:
             self._default = value
             return
         self._default = self.type.deserialize(value)
+        if self._frozen:
+            self._default = _freeze(self._default)
 
-    def _get_envvar_value(self):
+    @property
+    def _is_caching(self):
+        return self._section is not None and self._section.settings.cache_values
+
+    def _set_frozen(self, frozen):
         """
-        Internal helper to get item value from an environment variable
-        if item is controlled by one, and if the variable is set.
+        Switch the item to (or from) storing its value and default in immutable form.
+        Frozen defaults are returned without copying.
+        """
+        convert = _freeze if frozen else _thaw
+        self._frozen = frozen
+        self._value = convert(self._value)
+        self._default = convert(self._default)
+        self._cached_value = not_set
 
-        Returns not_set otherwise.
+    def _invalidate_cache(self, envvar_name=False):
         """
+        Discard the cached effective value and, if ``envvar_name`` is ``True``,
+        the cached name of the environment variable.
+        """
+        self._cached_value = not_set
+        if envvar_name:
+            self._cached_envvar_name = not_set
+            if self._section is not None:
+                self._section._set_tracked('envvar', self.name, self, bool(self.envvar))
+
+    def _track_value(self, changed=True):
+        """
+        Update records of the section about this item having a custom value
+        and, if ``changed`` is ``True``, about the value having changed since the last save.
+        """
+        if self._section is not None:
+            self._section._set_tracked('value', self.name, self, self._value is not not_set)
+            if changed:
+                self._section._set_tracked('changed', self.name, self, True)
+
+    def _get_envvar_name(self):
+        """
+        Internal helper to get name of the environment variable
+        which controls the item's value, or ``None``.
+        """
+        if self._cached_envvar_name is not not_set:
+            return self._cached_envvar_name
+
         envvar_name = None
 
         if self.envvar is True:
@@ -191,11 +246,55 @@ class Item(BaseItem):
         elif self.envvar:
             envvar_name = self.envvar
 
+        if self._is_caching:
+            self._cached_envvar_name = envvar_name
+
+        return envvar_name
+
+    def _get_envvar_value(self):
+        """
+        Internal helper to get item value from an environment variable
+        if item is controlled by one, and if the variable is set.
+
+        Returns not_set otherwise.
+        """
+        envvar_name = self._get_envvar_name()
+
         if envvar_name and envvar_name in os.environ:
-            return self.type.deserialize(os.environ[envvar_name])
+            value = self.type.deserialize(os.environ[envvar_name])
+            return _freeze(value) if self._frozen else value
         else:
             return not_set
 
+    def _get_resolved_value(self):
+        """
+        Internal helper to get a ``(value, source)`` tuple where source is one of
+        ``'envvar'``, ``'value'``, ``'default'``, or ``None`` if the item has no value.
+
+        The result is cached if the item belongs to a Config with cache_values enabled.
+        """
+        if self._cached_value is not not_set:
+            return self._cached_value
+
+        envvar_value = self._get_envvar_value()
+        if envvar_value is not not_set:
+            resolved = envvar_value, 'envvar'
+        elif self._value is not not_set:
+            if self._value is deferred:
+                self._value = self._deserialize_raw_str_value(self.raw_str_value)
+                if self._section is not None and self._section.settings.drop_raw_str_values:
+                    self.raw_str_value = not_set
+            resolved = self._value, 'value'
+        elif self.default is not not_set:
+            resolved = self.default, 'default'
+        else:
+            resolved = not_set, None
+
+        if self._is_caching:
+            self._cached_value = resolved
+
+        return resolved
+
     def get(self, fallback=not_set):
         """
         Returns config value.
@@ -204,15 +303,12 @@ class Item(BaseItem):
             :meth:`.set` and :attr:`.value`
         """
 
-        envvar_value = self._get_envvar_value()
-        if envvar_value is not not_set:
-            return envvar_value
+        value, source = self._get_resolved_value()
 
-        if self.has_value:
-            if self._value is not not_set:
-                return self._value
-            else:
-                return copy.deepcopy(self.default)
+        if source == 'default' and not self._frozen:
+            return copy.deepcopy(value)
+        elif source is not None:
+            return value
         elif fallback is not not_set:
             return fallback
         elif self.required:
@@ -232,26 +328,56 @@ class Item(BaseItem):
         """
         Sets config value.
         """
+        change = self._set_value(value)
+        if change is not None and self.section:
+            self.section._dispatch_value_changes([change])
+
+    def _set_value(self, value, lazy=False):
+        """
+        Sets config value without notifying anyone.
+        Returns ``ItemValueChange`` or ``None`` if there is nothing to report.
+
+        If ``lazy`` is ``True`` and the item belongs to a Config with ``lazy_deserialization`` enabled,
+        a string value is stored as the raw string only and is deserialized when it is first read.
+        The change then reports ``deferred`` instead of the value, see :meth:`._resolve_change`.
+        """
         old_value = self._value
         old_raw_str_value = self.raw_str_value
 
-        self.type.set_item_value(self, value)
+        settings = self._section.settings if self._section is not None else None
 
-        new_value = self._value
-
-        if old_value is not_set and new_value is not_set:
+        if lazy and settings is not None and settings.lazy_deserialization and isinstance(value, six.string_types):
+            self._value = deferred
+            self.raw_str_value = value
+        else:
+            self.type.set_item_value(self, value)
+            if self._frozen:
+                self._value = _freeze(self._value)
+            if settings is not None and settings.drop_raw_str_values:
+                self.raw_str_value = not_set
+        self._cached_value = not_set
+
+        if old_value is not_set and self._value is not_set:
             # Nothing to report
-            return
+            return None
 
-        if self.section:
-            self.section.dispatch_event(
-                self.section.hooks.item_value_changed,
-                item=self,
-                old_value=old_value,
-                new_value=new_value,
-                old_raw_str_value=old_raw_str_value,
-                new_raw_str_value=self.raw_str_value
-            )
+        self._track_value()
+
+        return ItemValueChange(self, old_value, self._value, old_raw_str_value, self.raw_str_value)
+
+    def _deserialize_raw_str_value(self, raw_str_value):
+        value = self.type.deserialize(raw_str_value)
+        return _freeze(value) if self._frozen else value
+
+    def _resolve_change(self, change):
+        """
+        Returns ``change`` of this item with ``deferred`` values replaced with deserialized values.
+        """
+        if change.old_value is deferred:
+            change = change._replace(old_value=self._deserialize_raw_str_value(change.old_raw_str_value))
+        if change.new_value is deferred:
+            change = change._replace(new_value=self._deserialize_raw_str_value(change.new_raw_str_value))
+        return change
 
     def reset(self):
         """
@@ -262,22 +388,18 @@ class Item(BaseItem):
 
         self._value = not_set
         self.raw_str_value = not_set
-
-        new_value = self._value
+        self._cached_value = not_set
 
         if old_value is not_set:
             # Nothing to report
             return
 
+        self._track_value()
+
         if self.section:
-            self.section.dispatch_event(
-                self.section.hooks.item_value_changed,
-                item=self,
-                old_value=old_value,
-                new_value=new_value,
-                old_raw_str_value=old_raw_str_value,
-                new_raw_str_value=self.raw_str_value,
-            )
+            self.section._dispatch_value_changes([
+                ItemValueChange(self, old_value, self._value, old_raw_str_value, self.raw_str_value),
+            ])
 
     @property
     def is_default(self):
@@ -288,21 +410,18 @@ class Item(BaseItem):
         if the environment variable is set and is different to the
         default value of the item.
         """
-        envvar_value = self._get_envvar_value()
-        if envvar_value is not not_set:
-            return envvar_value == self.default
+        value, source = self._get_resolved_value()
+        if source in ('envvar', 'value'):
+            return value == self.default
         else:
-            return self._value is not_set or self._value == self.default
+            return True
 
     @property
     def has_value(self):
         """
         ``True`` if item has a default value or custom value set.
         """
-        if self._get_envvar_value() is not not_set:
-            return True
-        else:
-            return self.default is not not_set or self._value is not not_set
+        return self._get_resolved_value()[1] is not None
 
     @property
     def section(self):
@@ -332,3 +451,73 @@ class Item(BaseItem):
         """
         if self.required and not self.has_value:
             raise RequiredValueMissing(name=self.name, item=self)
+
+
+class _CompactItemMeta(type):
+    """
+    Metaclass of :class:`.CompactItem` which declares ``__slots__`` for all
+    :class:`.ItemAttribute` instances of the class (and its non-compact base classes)
+    unless the class declares ``__slots__`` itself.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        if '__slots__' not in namespace:
+            slotted = set()
+            declared = set()
+
+            for base in bases:
+                for klass in base.__mro__:
+                    slotted.update(getattr(klass, '__slots__', ()))
+                    if not isinstance(klass, _CompactItemMeta):
+                        declared.update(
+                            v.attr_name for v in vars(klass).values() if isinstance(v, ItemAttribute)
+                        )
+
+            declared.update(v.attr_name for v in namespace.values() if isinstance(v, ItemAttribute))
+            declared.update(namespace.pop('_extra_slots', ()))
+
+            namespace['__slots__'] = tuple(sorted(declared - slotted))
+
+        cls = super(_CompactItemMeta, mcs).__new__(mcs, name, bases, namespace)
+
+        cls._all_slots = tuple(sorted(set(
+            slot for klass in cls.__mro__ for slot in getattr(klass, '__slots__', ())
+        )))
+
+        return cls
+
+
+class CompactItem(six.with_metaclass(_CompactItemMeta, Item)):
+    """
+    A drop-in replacement for :class:`.Item` which stores its declared attributes
+    in ``__slots__`` instead of instance ``__dict__``. Use it as ``item_factory``
+    for configurations with very large number of items::
+
+        >>> config = Config(schema, item_factory=CompactItem)
+
+    Ad-hoc attributes (the ones not declared with :class:`.ItemAttribute`) are still supported,
+    they are stored in ``__dict__`` which is only allocated for items that have them.
+
+    Subclasses get slots for their own :class:`.ItemAttribute` declarations automatically.
+    """
+
+    _extra_slots = ('_section', '_value', '_default', '_cached_envvar_name', '_cached_value', '_frozen')
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        item = cls.__new__(cls)
+        memo[id(self)] = item
+
+        for name in cls._all_slots:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            setattr(item, name, copy.deepcopy(value, memo))
+
+        # Accessing __dict__ allocates it, but that only happens on the original.
+        extra_attributes = self.__dict__
+        if extra_attributes:
+            item.__dict__.update(copy.deepcopy(extra_attributes, memo))
+
+        return item
@@ -1,8 +1,10 @@
 from .changesets import _ChangesetContext
 from .meta import ConfigManagerSettings
-from .persistence import ConfigPersistenceAdapter, YamlReaderWriter, JsonReaderWriter, ConfigParserReaderWriter
+from .persistence import ConfigPersistenceAdapter, YamlReaderWriter, JsonReaderWriter, ConfigParserReaderWriter, \
+    IniReaderWriter, EnvvarReaderWriter, EnvvarSource, SourceCache, _LoadSession, _load_sources
 from .schema_parser import parse_config_schema
 from .sections import Section
+from .snapshots import dump_snapshot, load_snapshot
 from .utils import _get_persistence_adapter_for
 
 
@@ -102,6 +104,7 @@ class Config(Section):
 
         if not isinstance(configmanager_settings, ConfigManagerSettings):
             self._settings = ConfigManagerSettings(**configmanager_settings)
+        self._settings._on_change = self._setting_changed
 
         super(Config, self).__init__()
 
@@ -110,7 +113,9 @@ class Config(Section):
         self._configparser_adapter = None
         self._json_adapter = None
         self._yaml_adapter = None
+        self._envvars_adapter = None
         self._click_extension = None
+        self._source_cache = None
 
         if schema is not None:
             parse_config_schema(schema, root=self)
@@ -121,6 +126,31 @@ class Config(Section):
     def __repr__(self):
         return '<{cls} {alias} at {id}>'.format(cls=self.__class__.__name__, alias=self.alias, id=id(self))
 
+    def __getstate__(self):
+        state = super(Config, self).__getstate__()
+        state.update(
+            _changeset_contexts=[],
+            _configparser_adapter=None,
+            _json_adapter=None,
+            _yaml_adapter=None,
+            _envvars_adapter=None,
+            _click_extension=None,
+            _source_cache=None,
+        )
+        return state
+
+    def __setstate__(self, state):
+        super(Config, self).__setstate__(state)
+        self._settings._on_change = self._setting_changed
+
+    def _setting_changed(self, name):
+        """
+        Called whenever one of the settings of this configuration is set after initialisation.
+        """
+        if name == 'cache_values':
+            # Values cached while caching was enabled must not be served once it is disabled
+            self.refresh_environment()
+
     def __call__(self, values=None):
         """
         Returns a changeset context which auto-resets itself on exit.
@@ -141,6 +171,45 @@ class Config(Section):
     def settings(self):
         return self._settings
 
+    @classmethod
+    def from_snapshot(cls, path, key=None):
+        """
+        Load configuration tree from a snapshot created with :meth:`.dump_snapshot`.
+
+        Returns ``None`` if the snapshot does not exist, or was created with a different ``key``,
+        or any of the ``load_sources`` have changed since the snapshot was created.
+
+        Hooks and dynamic item attributes are not preserved in snapshots
+        so they have to be registered again.
+        """
+        return load_snapshot(path, key=key)
+
+    def dump_snapshot(self, path, key=None):
+        """
+        Write a snapshot of the configuration tree and its values which can be loaded with
+        :meth:`.Config.from_snapshot` much faster than the configuration can be built from schema
+        and loaded from sources.
+
+        Args:
+            path: path of the snapshot file, usually next to the configuration files.
+            key: any picklable object (for example, version of your application) identifying the schema.
+                Snapshot is only loaded if the same key is passed to :meth:`.Config.from_snapshot`.
+        """
+        dump_snapshot(self, path, key=key)
+
+    @property
+    def source_cache(self):
+        """
+        Cache of parsed contents of ``load_sources`` (with ``hits`` and ``misses`` counters),
+        or ``None`` if ``cache_sources`` setting is not enabled.
+
+        Returns:
+            SourceCache
+        """
+        if self._source_cache is None and self.settings.cache_sources:
+            self._source_cache = SourceCache(use_hash=self.settings.cache_sources == 'hash')
+        return self._source_cache
+
     def changeset_context(self, **options):
         """
         Returns:
@@ -151,18 +220,26 @@ class Config(Section):
     @property
     def configparser(self):
         """
-        Adapter to dump/load INI format strings and files using standard library's
-        ``ConfigParser`` (or the backported configparser module in Python 2).
+        Adapter to dump/load INI format strings and files.
+
+        Unless ``use_configparser=True`` setting is passed to the :class:`.Config`,
+        INI files are read and written without standard library's ``ConfigParser``
+        (or the backported configparser module in Python 2), which means
+        that values are not interpolated.
         
         Returns:
             ConfigPersistenceAdapter
         """
         if self._configparser_adapter is None:
+            if self.settings.use_configparser:
+                reader_writer = ConfigParserReaderWriter(
+                    config_parser_factory=self.settings.configparser_factory,
+                )
+            else:
+                reader_writer = IniReaderWriter()
             self._configparser_adapter = ConfigPersistenceAdapter(
                 config=self,
-                reader_writer=ConfigParserReaderWriter(
-                    config_parser_factory=self.settings.configparser_factory,
-                ),
+                reader_writer=reader_writer,
             )
         return self._configparser_adapter
 
@@ -177,7 +254,9 @@ class Config(Section):
         if self._json_adapter is None:
             self._json_adapter = ConfigPersistenceAdapter(
                 config=self,
-                reader_writer=JsonReaderWriter(),
+                reader_writer=JsonReaderWriter(
+                    streaming=self.settings.json_streaming,
+                ),
             )
         return self._json_adapter
 
@@ -196,6 +275,22 @@ class Config(Section):
             )
         return self._yaml_adapter
 
+    @property
+    def envvars(self):
+        """
+        Adapter to load values from environment variables with a common prefix,
+        for example ``config.envvars.load('MYAPP_')``. See :class:`.EnvvarSource`.
+
+        Returns:
+            ConfigPersistenceAdapter
+        """
+        if self._envvars_adapter is None:
+            self._envvars_adapter = ConfigPersistenceAdapter(
+                config=self,
+                reader_writer=EnvvarReaderWriter(),
+            )
+        return self._envvars_adapter
+
     @property
     def click(self):
         """
@@ -214,18 +309,42 @@ class Config(Section):
     def load(self):
         """
         Load user configuration based on settings.
-        """
 
+        Sources of nested :class:`.Config` instances are loaded first, and the sources
+        of this one last. A source listed by more than one of them is only parsed once.
+        Lazily parsed sections which declare nested :class:`.Config` instances are parsed
+        so that those are loaded too; other lazy sections are left alone.
+        """
         # Must reverse because we want the sources assigned to higher-up Config instances
         # to overrides sources assigned to lower Config instances.
-        for section in reversed(list(self.iter_sections(recursive=True, key=None))):
-            if section.is_config:
-                section.load()
+        configs = [config for _, config in reversed(list(self._iter_nested_configs()))]
+        configs.append(self)
+
+        loads = [(config, config._get_adapters_and_sources()) for config in configs]
+        session = _LoadSession([pair for _, pairs in loads for pair in pairs])
+
+        for config, adapters_and_sources in loads:
+            _load_sources(
+                adapters_and_sources,
+                workers=config.settings.load_workers,
+                executor=config.settings.load_executor,
+                cache=config.source_cache,
+                session=session,
+            )
 
+    def _get_adapters_and_sources(self):
+        """
+        Returns a list of ``(adapter, source)`` tuples of ``load_sources`` which exist.
+        """
+        adapters_and_sources = []
         for source in self.settings.load_sources:
-            adapter = getattr(self, _get_persistence_adapter_for(source))
+            if isinstance(source, EnvvarSource):
+                adapter = self.envvars
+            else:
+                adapter = getattr(self, _get_persistence_adapter_for(source))
             if adapter.store_exists(source):
-                adapter.load(source)
+                adapters_and_sources.append((adapter, source))
+        return adapters_and_sources
 
     def validate(self):
         for item in self.iter_items(recursive=True, key=None):
@@ -25,11 +25,19 @@ class ConfigManagerSettings(object):
             'key_setter': None,
             'auto_load': False,
             'load_sources': [],
+            'cache_values': False,  # if True, items cache their effective values until changed or refreshed
+            'frozen_values': False,  # if True, values are stored in immutable form and returned without copying
+            'lazy_schema': False,  # if True, contents of sub-sections are parsed from schema on first access
+            'json_streaming': False,  # if True, JSON documents are read in chunks, skipping values with no items
+            'use_configparser': False,  # if True, INI files are read and written with ConfigParser
+            'load_workers': None,  # if greater than 1, multiple sources are parsed concurrently
+            'load_executor': 'thread',  # 'thread' or 'process' -- kind of workers used to parse sources
+            'cache_sources': False,  # if True (or 'hash'), load() doesn't parse sources which haven't changed
+            'lazy_deserialization': False,  # if True, strings read from INI files and envvars are deserialized on read
+            'drop_raw_str_values': False,  # if True, items don't keep raw strings once they are deserialized
+            'not_found_cache_size': 0,  # if greater than 0, results of not_found hooks are cached per section
         }
-        self._factories = {
-            'configparser_factory': self.create_configparser_factory,
-            'section_factory': self.create_section_factory,
-        }
+        self._factories = self._get_default_factories()
 
         for k, v in settings_and_factories.items():
             if k.startswith('create_'):
@@ -37,18 +45,83 @@ class ConfigManagerSettings(object):
             else:
                 self._settings[k] = v
 
+        if 'use_configparser' not in settings_and_factories and (
+            'configparser_factory' in settings_and_factories
+            or 'create_configparser_factory' in settings_and_factories
+        ):
+            # Custom ConfigParser means user wants ConfigParser
+            self._settings['use_configparser'] = True
+
+        # Settings are stored as plain instance attributes so that reading a setting
+        # costs just an attribute lookup. The only exception are mutable values of immutable
+        # settings which are served by __getattr__ as deep copies.
+        for k, v in self._settings.items():
+            if not self._is_served_by_getattr(k, v):
+                self.__dict__[k] = v
+
         if self.app_name:
             self.load_sources.append(self.user_app_config)
 
+        #: Called with name of the setting whenever a setting is set (see :meth:`.Config._setting_changed`)
+        self._on_change = None
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            return super(ConfigManagerSettings, self).__setattr__(name, value)
+
+        # Settings set after initialisation must end up in the same places as those passed to __init__
+        self._settings[name] = value
+        if self._is_served_by_getattr(name, value):
+            self.__dict__.pop(name, None)
+        else:
+            self.__dict__[name] = value
+
+        if self._on_change is not None:
+            self._on_change(name)
+
     def __repr__(self):
         return '<ConfigManagerSettings {!r}>'.format(self._settings)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Owner re-registers its callback on unpickling.
+        state['_on_change'] = None
+        # Default factories are bound methods of this instance, they are re-created on unpickling.
+        state['_factories'] = {
+            k: v for k, v in self._factories.items()
+            if getattr(v, '__self__', None) is not self
+        }
+        return state
+
+    def __setstate__(self, state):
+        factories = state.pop('_factories')
+        self.__dict__.update(state)
+        self._factories = self._get_default_factories()
+        self._factories.update(factories)
+
+    def _get_default_factories(self):
+        return {
+            'configparser_factory': self.create_configparser_factory,
+            'section_factory': self.create_section_factory,
+        }
+
     def __str__(self):
         return '<ConfigManagerSettings {!r}>'.format(self._settings)
 
+    def _is_served_by_getattr(self, name, value):
+        if isinstance(getattr(self.__class__, name, None), property):
+            return True
+        return self._is_immutable and isinstance(value, (list, dict, set))
+
     def __getattr__(self, item):
+        # Only called for settings which haven't been stored as instance attributes (yet).
+        if item.startswith('_'):
+            raise AttributeError(item)
+
         if item not in self._settings and item in self._factories:
             self._settings[item] = self._factories[item]()
+            if not self._is_served_by_getattr(item, self._settings[item]):
+                self.__dict__[item] = self._settings[item]
 
         if item in self._settings:
             if self._is_immutable:
@@ -1,29 +1,382 @@
 import collections
-from io import open
+import contextlib
+import hashlib
+from io import open, StringIO
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import os.path
+import re
+import stat
+import uuid
 
 from builtins import str
 import configparser
 import six
 
+from .base import is_config_item
+from .utils import not_set
+
+
+def _create_reader_writer(cls, options):
+    return cls(**options)
+
+
+def _open_source(source):
+    if isinstance(source, six.string_types):
+        source = os.path.expanduser(source)
+    return open(source, encoding='utf-8')
+
+
+def _parse_source(task):
+    reader_writer, source, paths = task
+    return reader_writer.parse_source(source, paths=paths)
+
+
+@contextlib.contextmanager
+def _open_for_atomic_write(path, mode='w'):
+    """
+    Open a temporary file in the directory of ``path`` for writing. Once the block completes,
+    the file is flushed to disk and renamed to ``path``, so readers never see a partially written file.
+    If the block raises, the temporary file is removed and ``path`` is left untouched.
+
+    The file keeps the permissions of the file it replaces.
+    """
+    path = os.path.realpath(os.path.expanduser(path))
+    tmp_path = '{}.{}.tmp'.format(path, uuid.uuid4().hex[:8])
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        if os.path.exists(path):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+
+        with open(fd, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        if hasattr(os, 'replace'):
+            os.replace(tmp_path, path)
+        else:
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Make the rename itself durable
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(os.path.dirname(path), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+def _copy_containers(value):
+    """
+    Copy dictionaries and lists in ``value`` recursively, leaving all other objects as they are.
+    """
+    if isinstance(value, dict):
+        return value.__class__((k, _copy_containers(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
+def _get_path_tree(paths):
+    """
+    Build a tree of nested dictionaries of keys from ``paths`` (tuples of keys)
+    in which ``True`` marks a selected subtree. Returns ``True`` (everything is selected)
+    if ``paths`` is ``None``.
+    """
+    if paths is None:
+        return True
+    tree = {}
+    for path in paths:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+            if node is True:
+                break
+        else:
+            node[path[-1]] = True
+    return tree
+
+
+def _filter_values(values, tree):
+    """
+    Returns a copy of dictionary ``values`` (nested dictionaries of values) with only
+    the subtrees selected in ``tree`` (see :func:`_get_path_tree`).
+    """
+    if tree is True or not isinstance(values, dict):
+        return values
+    filtered = values.__class__()
+    for key, value in values.items():
+        subtree = tree.get(key)
+        if subtree is True:
+            filtered[key] = value
+        elif subtree is not None and isinstance(value, dict):
+            filtered[key] = _filter_values(value, subtree)
+    return filtered
+
+
+def _is_path_selected(tree, path):
+    for key in path:
+        if tree is True:
+            return True
+        tree = tree.get(key)
+        if tree is None:
+            return False
+    return tree is True
+
+
+def _create_pool(workers, executor):
+    if executor == 'process':
+        return multiprocessing.Pool(workers)
+    elif executor == 'thread':
+        return ThreadPool(workers)
+    else:
+        raise ValueError('Unsupported load_executor {!r}, expected \'thread\' or \'process\''.format(executor))
+
+
+class _LoadSession(object):
+    """
+    Parsed contents of sources which are loaded more than once during one :meth:`.Config.load`
+    of a configuration tree (for example, by several nested :class:`.Config` instances),
+    so that such sources are only parsed once.
+    """
+
+    def __init__(self, adapters_and_sources):
+        counts = collections.Counter(self._get_key(adapter._rw, source) for adapter, source in adapters_and_sources)
+        self._shared = set(key for key, count in counts.items() if key is not None and count > 1)
+        self._parsed = {}
+
+    def _get_key(self, reader_writer, source):
+        if isinstance(source, six.string_types):
+            source = os.path.abspath(os.path.expanduser(source))
+        elif not isinstance(source, EnvvarSource):
+            return None
+        return reader_writer.__class__, tuple(sorted(reader_writer._options.items())), source
+
+    def is_shared(self, reader_writer, source):
+        return self._get_key(reader_writer, source) in self._shared
+
+    def lookup(self, reader_writer, source):
+        """
+        Returns parsed contents of the source or ``not_set`` if it hasn't been parsed yet.
+        """
+        return self._parsed.get(self._get_key(reader_writer, source), not_set)
+
+    def store(self, reader_writer, source, parsed):
+        self._parsed[self._get_key(reader_writer, source)] = parsed
+
+
+def _load_sources(
+    adapters_and_sources, as_defaults=False, workers=None, executor='thread', cache=None, session=None, paths=None,
+):
+    """
+    Load sources with their persistence adapters in the specified order.
+
+    If ``workers`` is greater than 1, sources are first parsed concurrently in a pool of
+    ``workers`` threads (or processes if ``executor`` is ``'process'``), and then the parsed
+    contents are loaded in the specified order, so the result is the same as when loading
+    sources one by one.
+
+    If ``cache`` (a :class:`.SourceCache`) is passed, sources which haven't changed since
+    they were last parsed are not parsed again.
+
+    If ``session`` (a :class:`._LoadSession`) is passed, sources which are loaded more than once
+    in the session are only parsed the first time.
+
+    If ``paths`` (a list of tuples of keys) is passed, only values of the selected subtrees are loaded.
+    It cannot be combined with ``cache`` or ``session`` because parsed contents then depend on ``paths``.
+    """
+    concurrent = workers and workers > 1 and len(adapters_and_sources) > 1
+    shared = [
+        session is not None and session.is_shared(adapter._rw, source)
+        for adapter, source in adapters_and_sources
+    ]
+
+    if not concurrent and cache is None and not any(shared):
+        for adapter, source in adapters_and_sources:
+            adapter._rw.load_source(adapter._config, source, as_defaults=as_defaults, paths=paths)
+        return
+
+    parsed_sources = [not_set] * len(adapters_and_sources)
+    fingerprints = [None] * len(adapters_and_sources)
+
+    for i, (adapter, source) in enumerate(adapters_and_sources):
+        if shared[i]:
+            parsed_sources[i] = session.lookup(adapter._rw, source)
+        # Only files are cached
+        if parsed_sources[i] is not_set and cache is not None and isinstance(source, six.string_types):
+            fingerprints[i], parsed_sources[i] = cache.lookup(adapter._rw, source)
+
+    to_parse = [i for i, parsed in enumerate(parsed_sources) if parsed is not_set]
+    tasks = [(adapters_and_sources[i][0]._rw, adapters_and_sources[i][1], paths) for i in to_parse]
+
+    if concurrent and len(tasks) > 1:
+        pool = _create_pool(min(workers, len(tasks)), executor)
+        try:
+            results = pool.map(_parse_source, tasks)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_parse_source(task) for task in tasks]
+
+    for i, parsed in zip(to_parse, results):
+        parsed_sources[i] = parsed
+        if fingerprints[i] is not None:
+            adapter, source = adapters_and_sources[i]
+            cache.store(adapter._rw, source, fingerprints[i], parsed)
+
+    for (adapter, source), parsed, fingerprint, is_shared in zip(
+        adapters_and_sources, parsed_sources, fingerprints, shared
+    ):
+        if is_shared:
+            session.store(adapter._rw, source, parsed)
+        if fingerprint is not None or is_shared:
+            # Cached and shared contents must not end up shared with items
+            parsed = adapter._rw.copy_parsed(parsed)
+        adapter._rw.load_parsed(adapter._config, parsed, as_defaults=as_defaults, paths=paths)
+
+
+def _get_file_fingerprint(path, use_hash=False):
+    """
+    Returns a tuple of modification time and size of the file, and, if ``use_hash`` is ``True``,
+    hash of its contents.
+    """
+    st = os.stat(path)
+    fingerprint = (getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size)
+    if use_hash:
+        with open(path, 'rb') as f:
+            fingerprint += (hashlib.sha1(f.read()).hexdigest(),)
+    return fingerprint
+
+
+class SourceCache(object):
+    """
+    Cache of parsed contents of configuration files, used by :meth:`.Config.load`
+    when ``cache_sources`` setting is enabled.
+
+    A file is considered unchanged if its modification time and size
+    (and, if ``use_hash`` is ``True``, hash of its contents) are the same as when it was last parsed.
+    """
+
+    def __init__(self, use_hash=False):
+        self.use_hash = use_hash
+
+        #: Number of times a file didn't have to be parsed
+        self.hits = 0
+
+        #: Number of times a file had to be parsed
+        self.misses = 0
+
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get_key(self, reader_writer, source):
+        # Reader-writers with different options may parse the same file differently
+        return (
+            reader_writer.__class__,
+            tuple(sorted(reader_writer._options.items())),
+            os.path.abspath(os.path.expanduser(source)),
+        )
+
+    def lookup(self, reader_writer, source):
+        """
+        Returns a tuple of the current fingerprint of the source and its parsed contents,
+        or ``not_set`` instead of the contents if the source has to be parsed.
+        """
+        key = self._get_key(reader_writer, source)
+        fingerprint = _get_file_fingerprint(key[-1], use_hash=self.use_hash)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return fingerprint, entry[1]
+        self.misses += 1
+        return fingerprint, not_set
+
+    def store(self, reader_writer, source, fingerprint, parsed):
+        self._entries[self._get_key(reader_writer, source)] = (fingerprint, parsed)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
 
 class ConfigReaderWriter(object):
     def __init__(self, **options):
-        pass
+        #: Options with which the reader-writer was created. Used to re-create it in other processes.
+        self._options = options
+
+    def __reduce__(self):
+        return _create_reader_writer, (self.__class__, self._options)
+
+    def parse_file(self, file_obj, paths=None):
+        """
+        Parse contents of the file into an object that can be passed to :meth:`load_parsed`.
+        Must not depend on the configuration into which contents will be loaded
+        because parsing may happen in another thread or process.
+
+        If ``paths`` (a list of tuples of keys) is passed, contents outside the selected subtrees
+        may be left out.
+        """
+        return file_obj.read()
+
+    def parse_source(self, source, paths=None):
+        """
+        Parse contents of ``source`` (a path or a file object) like :meth:`parse_file` does.
+        """
+        with _open_source(source) as f:
+            return self.parse_file(f, paths=paths)
+
+    def load_source(self, config, source, as_defaults=False, paths=None):
+        """
+        Load contents of ``source`` (a path or a file object) into the configuration.
+        """
+        if isinstance(source, six.string_types):
+            with _open_source(source) as f:
+                self.load_config_from_file(config, f, as_defaults=as_defaults, paths=paths)
+        else:
+            self.load_config_from_file(config, source, as_defaults=as_defaults, paths=paths)
+
+    def load_parsed(self, config, parsed, as_defaults=False, paths=None):
+        """
+        Load contents parsed by :meth:`parse_file` into the configuration.
+        """
+        self.load_config_from_string(config, parsed, as_defaults=as_defaults, paths=paths)
+
+    def copy_parsed(self, parsed):
+        """
+        Returns a copy of contents parsed by :meth:`parse_file` that can be loaded
+        without the original contents ending up in configuration items.
+        Contents which cannot be modified may be returned as they are.
+        """
+        return parsed
 
     def store_exists(self, store):
         return os.path.exists(os.path.expanduser(store))
 
-    def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
+    def dump_config_to_file(self, config, file_obj, with_defaults=False, only_changed=False, **kwargs):
         raise NotImplementedError()
 
-    def dump_config_to_string(self, config, with_defaults=False, **kwargs):
+    def dump_config_to_string(self, config, with_defaults=False, only_changed=False, **kwargs):
         raise NotImplementedError()
 
-    def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
+    def load_config_from_string(self, config, string, as_defaults=False, paths=None, **kwargs):
         raise NotImplementedError()
 
-    def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
+    def load_config_from_file(self, config, file_obj, as_defaults=False, paths=None, **kwargs):
         raise NotImplementedError()
 
 
@@ -32,63 +385,94 @@ class ConfigPersistenceAdapter(object):
         self._config = config
         self._rw = reader_writer
 
-    def load(self, source, as_defaults=False):
+    def load(self, source, as_defaults=False, **kwargs):
         """
         Load configuration values from the specified source.
 
         Args:
             source:
             as_defaults (bool): if ``True``, contents of ``source`` will be treated as schema of configuration items.
+            paths (list): if specified, only the sections and items at these paths (strings or tuples of keys)
+                are loaded, and the rest of ``source`` is skipped.
 
         """
-        if isinstance(source, six.string_types):
-            source = os.path.expanduser(source)
-            with open(source, encoding='utf-8') as f:
-                self._rw.load_config_from_file(self._config, f, as_defaults=as_defaults)
-
-        elif isinstance(source, (list, tuple)):
-            for s in source:
-                with open(s, encoding='utf-8') as f:
-                    self._rw.load_config_from_file(self._config, f, as_defaults=as_defaults)
-
+        paths = self._get_paths(**kwargs)
+        if isinstance(source, (list, tuple)):
+            _load_sources(
+                [(self, s) for s in source],
+                as_defaults=as_defaults,
+                workers=self._config.settings.load_workers,
+                executor=self._config.settings.load_executor,
+                paths=paths,
+            )
         else:
-            self._rw.load_config_from_file(self._config, source, as_defaults=as_defaults)
+            self._rw.load_source(self._config, source, as_defaults=as_defaults, paths=paths)
 
-    def loads(self, config_str, as_defaults=False):
+    def loads(self, config_str, as_defaults=False, **kwargs):
         """
         Load configuration values from the specified source string.
 
         Args:
             config_str:
             as_defaults (bool): if ``True``, contents of ``source`` will be treated as schema of configuration items.
+            paths (list): if specified, only the sections and items at these paths (strings or tuples of keys)
+                are loaded, and the rest of ``config_str`` is skipped.
 
         """
-        self._rw.load_config_from_string(self._config, config_str, as_defaults=as_defaults)
+        self._rw.load_config_from_string(
+            self._config, config_str, as_defaults=as_defaults, paths=self._get_paths(**kwargs),
+        )
+
+    def _get_paths(self, paths=None):
+        """
+        Returns ``paths`` as a list of tuples of keys.
+        Only accepts ``paths`` as a keyword argument, so that sources passed as
+        separate positional arguments are still rejected.
+        """
+        if paths is None:
+            return None
+        if isinstance(paths, six.string_types):
+            paths = [paths]
+        separator = self._config.settings.str_path_separator
+        return [
+            tuple(path.split(separator)) if isinstance(path, six.string_types) else tuple(path)
+            for path in paths
+        ]
 
-    def dump(self, destination, with_defaults=False):
+    def dump(self, destination, with_defaults=False, only_changed=False):
         """
-        Write configuration values to the specified destination.
+        Write configuration values to the specified destination
+        and mark the configuration as saved (see :meth:`.Section.mark_saved`).
 
         Args:
             destination:
             with_defaults (bool): if ``True``, values of items with no custom values will be included in the output
                 if they have a default value set.
+            only_changed (bool): if ``True``, only values of items changed since the last save will be included
+                in the output.
         """
         if isinstance(destination, six.string_types):
-            with open(destination, 'w', encoding='utf-8') as f:
-                self._rw.dump_config_to_file(self._config, f, with_defaults=with_defaults)
+            with _open_for_atomic_write(destination) as f:
+                self._rw.dump_config_to_file(
+                    self._config, f, with_defaults=with_defaults, only_changed=only_changed,
+                )
         else:
-            self._rw.dump_config_to_file(self._config, destination, with_defaults=with_defaults)
+            self._rw.dump_config_to_file(
+                self._config, destination, with_defaults=with_defaults, only_changed=only_changed,
+            )
+        self._config.mark_saved()
 
-    def dumps(self, with_defaults=False):
+    def dumps(self, with_defaults=False, only_changed=False):
         """
         Generate a string representing all the configuration values.
 
         Args:
             with_defaults (bool): if ``True``, values of items with no custom values will be included in the output
                 if they have a default value set.
+            only_changed (bool): if ``True``, only values of items changed since the last save will be included
+                in the output.
         """
-        return self._rw.dump_config_to_string(self._config, with_defaults=with_defaults)
+        return self._rw.dump_config_to_string(self._config, with_defaults=with_defaults, only_changed=only_changed)
 
     def store_exists(self, store):
         """
@@ -97,24 +481,204 @@ class ConfigPersistenceAdapter(object):
         return self._rw.store_exists(store)
 
 
+class _JsonStreamLoader(object):
+    """
+    Loads values from a JSON document into a configuration tree, reading the document in chunks.
+
+    Only values of existing items are decoded, and they are applied once the whole document
+    has been read. Values for which there are no items or sections in the configuration tree,
+    or which are outside the subtrees selected by ``paths``, are skipped without being decoded.
+    """
+
+    chunk_size = 64 * 1024
+
+    _whitespace_re = re.compile(r'[ \t\n\r]*')
+    _structure_re = re.compile(r'["{}\[\]]')
+    _string_end_re = re.compile(r'["\\]')
+    _number_chars_re = re.compile(r'[0-9eE.+\-]*')
+
+    def __init__(self, file_obj, json_module, paths=None):
+        self._file = file_obj
+        self._decoder = json_module.JSONDecoder(object_pairs_hook=collections.OrderedDict)
+        self._path_tree = _get_path_tree(paths)
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def load(self, config):
+        # Values are only applied once the whole document has been read,
+        # so an invalid document leaves the configuration untouched.
+        values = []
+        self._load_section(config, values, self._path_tree)
+        if self._peek() != '':
+            raise self._error('Extra data')
+
+        changes = []
+        try:
+            for item, value in values:
+                change = item._set_value(value)
+                if change is not None:
+                    changes.append(change)
+        finally:
+            if changes:
+                config._dispatch_value_changes(changes)
+
+    def _error(self, msg):
+        return ValueError('{} in JSON document'.format(msg))
+
+    def _fill(self):
+        """
+        Discard consumed part of the buffer and read the next chunk.
+        Returns ``False`` if there was nothing more to read.
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """
+        Skip whitespace and return the next character, or an empty string at the end of document.
+        """
+        while True:
+            self._pos = self._whitespace_re.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        c = self._peek()
+        if not c or c not in chars:
+            raise self._error('Expected one of {!r}'.format(chars))
+        self._pos += 1
+        return c
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # The value may continue in the next chunk
+                if self._fill():
+                    continue
+                raise
+            if (
+                isinstance(value, (int, float))
+                and self._number_chars_re.match(self._buf, end).end() == len(self._buf)
+                and self._fill()
+            ):
+                # The number may continue in the next chunk
+                continue
+            self._pos = end
+            return value
+
+    def _skip_value(self):
+        if self._peek() not in ('{', '['):
+            self._decode_value()
+            return
+
+        depth = 0
+        while True:
+            match = self._structure_re.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error('Unexpected end')
+                continue
+            self._pos = match.end()
+            c = match.group()
+            if c == '"':
+                self._skip_string()
+            elif c in ('{', '['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string(self):
+        while True:
+            match = self._string_end_re.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+            elif match.group() == '"':
+                self._pos = match.end()
+                return
+            elif match.end() < len(self._buf):
+                # Skip the escaped character
+                self._pos = match.end() + 1
+                continue
+            else:
+                # Escape sequence continues in the next chunk
+                self._pos = match.start()
+            if not self._fill():
+                raise self._error('Unterminated string')
+
+    def _load_section(self, section, values, path_tree):
+        """
+        Read the object of ``section`` and collect ``(item, value)`` pairs of its items in ``values``.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, six.string_types):
+                raise self._error('Expected a string key')
+            self._expect(':')
+
+            subtree = path_tree if path_tree is True else path_tree.get(key)
+            obj = None if subtree is None else section.find(key)
+
+            if obj is None:
+                self._skip_value()
+            elif is_config_item(obj):
+                values.append((obj, self._decode_value()))
+            elif self._peek() == '{':
+                self._load_section(obj, values, subtree)
+            else:
+                self._skip_value()
+
+            if self._expect(',}') == '}':
+                return
+
+
 class JsonReaderWriter(ConfigReaderWriter):
-    def __init__(self, **options):
-        super(JsonReaderWriter, self).__init__(**options)
+    def __init__(self, streaming=False, **options):
+        super(JsonReaderWriter, self).__init__(streaming=streaming, **options)
         import json
         self.json = json
+        self.streaming = streaming
 
-    def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
-        # See comment in JsonReaderWriter.dump_config_to_string
-        file_obj.write(self.dump_config_to_string(config, with_defaults=with_defaults), **kwargs)
+    def dump_config_to_file(self, config, file_obj, with_defaults=False, only_changed=False, **kwargs):
+        # Write chunks as they are encoded instead of rendering the whole document first.
+        # See comment in JsonReaderWriter.dump_config_to_string about unicode.
+        encoder = self.json.JSONEncoder(ensure_ascii=False, indent=2, **kwargs)
+        values = config.dump_values(
+            with_defaults=with_defaults, dict_cls=collections.OrderedDict, only_changed=only_changed,
+        )
+        for chunk in encoder.iterencode(values):
+            file_obj.write(str(chunk))
 
-    def dump_config_to_string(self, config, with_defaults=False, **kwargs):
+    def dump_config_to_string(self, config, with_defaults=False, only_changed=False, **kwargs):
         # There is some inconsistent behaviour in Python 2's json.dump as described here:
         # http://stackoverflow.com/a/36008538/38611
         # and io.open which we use for file opening is very strict and fails if
         # the string we are trying to write is not unicode in Python 2
         # because we open files with encoding=utf-8.
         result = self.json.dumps(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
+            config.dump_values(
+                with_defaults=with_defaults, dict_cls=collections.OrderedDict, only_changed=only_changed,
+            ),
             ensure_ascii=False,
             indent=2,
             **kwargs
@@ -124,15 +688,48 @@ class JsonReaderWriter(ConfigReaderWriter):
         else:
             return result
 
-    def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
+    def parse_file(self, file_obj, paths=None):
+        # Contents parsed here are handed back from another thread or process (or kept in a cache),
+        # so there is nothing to stream into and the whole document is decoded even if streaming is enabled.
+        try:
+            parsed = self.json.load(file_obj, object_pairs_hook=collections.OrderedDict)
+        except ValueError as exc:
+            if self.streaming:
+                # Raise the same exception as the streaming loader does when loading sources one by one
+                raise ValueError('{} in JSON document'.format(exc))
+            raise
+        return _filter_values(parsed, _get_path_tree(paths))
+
+    def load_parsed(self, config, parsed, as_defaults=False, paths=None):
+        config.load_values(_filter_values(parsed, _get_path_tree(paths)), as_defaults=as_defaults)
+
+    def copy_parsed(self, parsed):
+        return _copy_containers(parsed)
+
+    def load_config_from_file(self, config, file_obj, as_defaults=False, paths=None, **kwargs):
+        # Selected subtrees are picked out while reading the document so that the rest of it isn't decoded
+        if (self.streaming or paths is not None) and not as_defaults and not kwargs:
+            _JsonStreamLoader(file_obj, self.json, paths=paths).load(config)
+            return
+
         config.load_values(
-            self.json.load(file_obj, object_pairs_hook=collections.OrderedDict, **kwargs),
+            _filter_values(
+                self.json.load(file_obj, object_pairs_hook=collections.OrderedDict, **kwargs),
+                _get_path_tree(paths),
+            ),
             as_defaults=as_defaults,
         )
 
-    def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
+    def load_config_from_string(self, config, string, as_defaults=False, paths=None, **kwargs):
+        if (self.streaming or paths is not None) and not as_defaults and not kwargs:
+            _JsonStreamLoader(StringIO(string), self.json, paths=paths).load(config)
+            return
+
         config.load_values(
-            self.json.loads(string, object_pairs_hook=collections.OrderedDict, **kwargs),
+            _filter_values(
+                self.json.loads(string, object_pairs_hook=collections.OrderedDict, **kwargs),
+                _get_path_tree(paths),
+            ),
             as_defaults=as_defaults,
         )
 
@@ -151,6 +748,10 @@ class YamlReaderWriter(ConfigReaderWriter):
         # The code to preserve order of items is taken from here:
         # https://stackoverflow.com/a/21048064/38611
         #
+        # Hooks are registered on our own subclasses of the safe loader and dumper
+        # (implemented in C if PyYAML has been built with libyaml) so that
+        # PyYAML's default Loader and Dumper are left untouched.
+        #
 
         _mapping_tag = yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG
 
@@ -158,121 +759,162 @@ class YamlReaderWriter(ConfigReaderWriter):
             return dumper.represent_dict(data.items())
 
         def dict_constructor(loader, node):
+            loader.flatten_mapping(node)
             return collections.OrderedDict(loader.construct_pairs(node))
 
-        yaml.add_representer(collections.OrderedDict, dict_representer)
-        yaml.add_constructor(_mapping_tag, dict_constructor)
+        class Loader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+            pass
+
+        class Dumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):
+            pass
+
+        Loader.add_constructor(_mapping_tag, dict_constructor)
+        Dumper.add_representer(collections.OrderedDict, dict_representer)
+        Dumper.add_representer(tuple, Dumper.represent_list)
 
         self.yaml = yaml
+        self.loader_cls = Loader
+        self.dumper_cls = Dumper
 
         self.default_dump_options = {
             'indent': 2,
             'default_flow_style': False,
+            'Dumper': self.dumper_cls,
         }
 
-    def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
+    def dump_config_to_file(self, config, file_obj, with_defaults=False, only_changed=False, **kwargs):
         for k, v in self.default_dump_options.items():
             kwargs.setdefault(k, v)
         self.yaml.dump(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
+            config.dump_values(
+                with_defaults=with_defaults, dict_cls=collections.OrderedDict, only_changed=only_changed,
+            ),
             file_obj,
             **kwargs
         )
 
-    def dump_config_to_string(self, config, with_defaults=False, **kwargs):
+    def dump_config_to_string(self, config, with_defaults=False, only_changed=False, **kwargs):
         for k, v in self.default_dump_options.items():
             kwargs.setdefault(k, v)
         return self.yaml.dump(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
+            config.dump_values(
+                with_defaults=with_defaults, dict_cls=collections.OrderedDict, only_changed=only_changed,
+            ),
             **kwargs
         )
 
-    def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
-        config.load_values(self.yaml.load(file_obj, **kwargs), as_defaults=as_defaults)
+    def parse_file(self, file_obj, paths=None):
+        return self._load(file_obj, paths)
 
-    def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
-        config.load_values(self.yaml.load(string, **kwargs), as_defaults=as_defaults)
+    def load_parsed(self, config, parsed, as_defaults=False, paths=None):
+        config.load_values(_filter_values(parsed, _get_path_tree(paths)), as_defaults=as_defaults)
 
+    def copy_parsed(self, parsed):
+        return _copy_containers(parsed)
 
-class ConfigParserReaderWriter(ConfigReaderWriter):
-    no_section = 'NO_SECTION'
+    def load_config_from_file(self, config, file_obj, as_defaults=False, paths=None, **kwargs):
+        config.load_values(self._load(file_obj, paths, **kwargs), as_defaults=as_defaults)
 
-    def __init__(self, config_parser_factory=None, **options):
-        super(ConfigParserReaderWriter, self).__init__(**options)
-        self.config_parser_factory = config_parser_factory or configparser.ConfigParser
+    def load_config_from_string(self, config, string, as_defaults=False, paths=None, **kwargs):
+        config.load_values(self._load(string, paths, **kwargs), as_defaults=as_defaults)
 
-    def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
-        cp = self.config_parser_factory()
-        self._load_config_into_config_parser(config, cp, with_defaults=with_defaults)
-        cp.write(file_obj)
+    def _load(self, stream, paths=None, Loader=None):
+        """
+        Load YAML document from ``stream``. If ``paths`` is passed, the document is only composed
+        into nodes, and Python objects are constructed only for the selected subtrees.
+        """
+        loader_cls = Loader or self.loader_cls
+        if paths is None:
+            return self.yaml.load(stream, Loader=loader_cls)
 
-    def dump_config_to_string(self, config, with_defaults=False, **kwargs):
-        from io import StringIO
-        f = StringIO()
-        self.dump_config_to_file(config, f, with_defaults=with_defaults)
-        return f.getvalue()
+        loader = loader_cls(stream)
+        try:
+            node = loader.get_single_node()
+            if node is None:
+                return None
+            return self._construct_selected(loader, node, _get_path_tree(paths))
+        finally:
+            loader.dispose()
 
-    def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
-        cp = self.config_parser_factory()
-        cp.read_file(file_obj)
-        self._load_config_from_config_parser(config, cp, as_defaults=as_defaults)
+    def _construct_selected(self, loader, node, path_tree):
+        if path_tree is True:
+            return loader.construct_object(node, deep=True)
 
-    def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
-        cp = self.config_parser_factory()
-        cp.read_string(string)
-        self._load_config_from_config_parser(config, cp, as_defaults=as_defaults)
+        values = collections.OrderedDict()
+        if not isinstance(node, self.yaml.MappingNode):
+            return values
 
-    def _load_config_from_config_parser(self, config, cp, as_defaults=False):
+        # Resolve merge keys (<<) first
+        loader.flatten_mapping(node)
+        for key_node, value_node in node.value:
+            if not isinstance(key_node, self.yaml.ScalarNode):
+                continue
+            key = loader.construct_object(key_node)
+            subtree = path_tree.get(key)
+            if subtree is True:
+                values[key] = loader.construct_object(value_node, deep=True)
+            elif subtree is not None and isinstance(value_node, self.yaml.MappingNode):
+                values[key] = self._construct_selected(loader, value_node, subtree)
+        return values
 
-        # TODO Clean up the repetition here!
 
-        # TODO Shouldn't really use create_item and create_section methods here,
-        # TODO should use load_values(..., as_defaults=True) instead!
+class IniReaderWriter(ConfigReaderWriter):
+    """
+    Reads and writes INI files without creating a ``ConfigParser``, following the rules of
+    ``ConfigParser``'s default dialect: option names are case-insensitive (stored in lower case),
+    ``=`` and ``:`` are both accepted as delimiters, values can span multiple indented lines,
+    and options of the ``[DEFAULT]`` section apply to all sections.
+    Values are not interpolated.
 
-        for option, value in cp.defaults().items():
-            if as_defaults:
-                if option not in config:
-                    config.add_item(option, config.create_item(option, default=value))
-                else:
-                    config[option].default = value
-            else:
-                if option not in config:
-                    continue
-                config[option].value = value
+    Items which are not in any section are stored in the ``[NO_SECTION]`` section.
+    """
 
-        for section in cp.sections():
-            if section == self.no_section:
-                for option in cp.options(section):
-                    value = cp.get(section, option)
-                    if as_defaults:
-                        if option not in config:
-                            config.add_item(option, config.create_item(option, default=value))
-                        else:
-                            config[option].default = value
-                    else:
-                        if option not in config:
-                            continue
-                        config[option].value = value
+    no_section = 'NO_SECTION'
+    default_section = 'DEFAULT'
+    comment_prefixes = ('#', ';')
+
+    _section_re = re.compile(r'\[(?P<header>.+)\]')
+    _option_re = re.compile(r'(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$')
+    _non_space_re = re.compile(r'\S')
+
+    def dump_config_to_file(self, config, file_obj, with_defaults=False, only_changed=False, **kwargs):
+        # Written section by section so that the whole document is never held in memory.
+        for section, options in self._get_ini_sections(config, with_defaults, only_changed).items():
+            if not options:
                 continue
+            lines = [u'[{}]\n'.format(section)]
+            for option, value in collections.OrderedDict((k.lower(), v) for k, v in options.items()).items():
+                lines.append(u'{} = {}\n'.format(option, value.replace('\n', '\n\t')))
+            lines.append(u'\n')
+            file_obj.write(u''.join(lines))
 
-            for option in cp.options(section):
-                value = cp.get(section, option)
-                if as_defaults:
-                    if section not in config:
-                        config.add_section(section, config.create_section())
-                    if option not in config[section]:
-                        config[section].add_item(option, config.create_item(option, default=value))
-                    else:
-                        config[section][option].default = value
-                else:
-                    if section not in config:
-                        continue
-                    if option not in config[section]:
-                        continue
-                    config[section][option].value = value
-
-    def _load_config_into_config_parser(self, config, cp, with_defaults=False):
-        for item_path, item in config.iter_items(recursive=True):
+    def dump_config_to_string(self, config, with_defaults=False, only_changed=False, **kwargs):
+        f = StringIO()
+        self.dump_config_to_file(config, f, with_defaults=with_defaults, only_changed=only_changed)
+        return f.getvalue()
+
+    def parse_file(self, file_obj, paths=None):
+        return self._read_ini(file_obj, getattr(file_obj, 'name', '<???>'), paths=paths)
+
+    def load_parsed(self, config, parsed, as_defaults=False, paths=None):
+        defaults, sections = self._filter_ini(parsed[0], parsed[1], _get_path_tree(paths))
+        self._load_config_from_ini(config, defaults, sections, as_defaults=as_defaults)
+
+    def load_config_from_file(self, config, file_obj, as_defaults=False, paths=None, **kwargs):
+        defaults, sections = self.parse_file(file_obj, paths=paths)
+        self._load_config_from_ini(config, defaults, sections, as_defaults=as_defaults)
+
+    def load_config_from_string(self, config, string, as_defaults=False, paths=None, **kwargs):
+        defaults, sections = self._read_ini(StringIO(string), '<string>', paths=paths)
+        self._load_config_from_ini(config, defaults, sections, as_defaults=as_defaults)
+
+    def _get_ini_sections(self, config, with_defaults=False, only_changed=False):
+        """
+        Returns an ordered dictionary of sections, each an ordered dictionary of options
+        and their string values. The ``DEFAULT`` section always comes first.
+        """
+        sections = collections.OrderedDict([(self.default_section, collections.OrderedDict())])
+        for item_path, item in config._iter_dumped_items(with_defaults=with_defaults, only_changed=only_changed):
             if len(item_path) > 2:
                 raise RuntimeError(
                     '{cls} with more than 2 path segments cannot be loaded into ConfigParser'.format(
@@ -287,6 +929,312 @@ class ConfigParserReaderWriter(ConfigReaderWriter):
                 section = self.no_section
                 option = item_path[0]
 
-            if not cp.has_section(section) and section != cp.default_section:
-                cp.add_section(section)
-            cp.set(section, option, item.str_value)
+            if section not in sections:
+                sections[section] = collections.OrderedDict()
+            sections[section][option] = item.str_value
+
+        return sections
+
+    def _read_ini(self, lines, source, paths=None):
+        """
+        Parse INI lines. Returns a tuple of an ordered dictionary of defaults and an ordered
+        dictionary of sections in which options of each section include the defaults.
+
+        If ``paths`` is passed, lines of sections outside the selected paths are skipped
+        without being parsed (so errors in them aren't reported either).
+        """
+        path_tree = _get_path_tree(paths)
+        skipped_section = False
+
+        defaults = collections.OrderedDict()
+        sections = collections.OrderedDict()
+        seen_options = set()
+        parsing_error = None
+
+        section_name = None
+        section = None
+        option = None
+        indent_level = 0
+
+        for lineno, line in enumerate(lines, start=1):
+            if skipped_section and line[:1] in (' ', '\t'):
+                # Indented lines never start a new section
+                continue
+
+            value = line.strip()
+            if skipped_section and not self._section_re.match(value):
+                continue
+
+            if not value:
+                if section is not None and option is not None:
+                    # Empty lines are part of a multi-line value unless they are trailing
+                    section[option].append('')
+                continue
+            if value.startswith(self.comment_prefixes):
+                continue
+
+            cur_indent_level = self._non_space_re.search(line).start()
+            if section is not None and option is not None and cur_indent_level > indent_level:
+                section[option].append(value)
+                continue
+
+            indent_level = cur_indent_level
+
+            match = self._section_re.match(value)
+            if match:
+                section_name = match.group('header')
+                skipped_section = (
+                    path_tree is not True
+                    and section_name not in path_tree
+                    and section_name not in (self.default_section, self.no_section)
+                )
+                if skipped_section:
+                    section = option = None
+                    continue
+                if section_name == self.default_section:
+                    section = defaults
+                elif section_name in sections:
+                    raise configparser.DuplicateSectionError(section_name, source, lineno)
+                else:
+                    section = sections[section_name] = collections.OrderedDict()
+                option = None
+                continue
+
+            if section is None:
+                raise configparser.MissingSectionHeaderError(source, lineno, line)
+
+            match = self._option_re.match(value)
+            if not match or not match.group('option'):
+                if parsing_error is None:
+                    parsing_error = configparser.ParsingError(source)
+                parsing_error.append(lineno, repr(line))
+                option = None
+                continue
+
+            option = match.group('option').rstrip().lower()
+            if (section_name, option) in seen_options:
+                raise configparser.DuplicateOptionError(section_name, option, source, lineno)
+            seen_options.add((section_name, option))
+            section[option] = [match.group('value').strip()]
+
+        if parsing_error is not None:
+            raise parsing_error
+
+        for options in [defaults] + list(sections.values()):
+            for k, v in options.items():
+                options[k] = '\n'.join(v).rstrip()
+
+        for options in sections.values():
+            for k, v in defaults.items():
+                options.setdefault(k, v)
+
+        return self._filter_ini(defaults, sections, path_tree)
+
+    def _filter_ini(self, defaults, sections, path_tree):
+        """
+        Returns a tuple of defaults and sections with only the options selected in ``path_tree``.
+        Options of ``DEFAULT`` and ``NO_SECTION`` sections are treated as top-level items.
+        """
+        if path_tree is True:
+            return defaults, sections
+
+        def filter_options(options, subtree):
+            if subtree is True:
+                return options
+            selected = set(k.lower() for k, v in subtree.items() if v is True)
+            return collections.OrderedDict((k, v) for k, v in options.items() if k.lower() in selected)
+
+        filtered_sections = collections.OrderedDict()
+        for section, options in sections.items():
+            subtree = path_tree if section == self.no_section else path_tree.get(section)
+            if subtree is not None:
+                filtered_sections[section] = filter_options(options, subtree)
+
+        return filter_options(defaults, path_tree), filtered_sections
+
+    def _load_config_from_ini(self, config, defaults, sections, as_defaults=False):
+
+        if not as_defaults:
+            # Values are applied in one batch so that listeners are notified once
+            values = collections.OrderedDict()
+            for option, value in defaults.items():
+                values[(option,)] = value
+            for section, options in sections.items():
+                for option, value in options.items():
+                    if section == self.no_section:
+                        values[(option,)] = value
+                    else:
+                        values[(section, option)] = value
+            config._update_values(values, flat=True, lazy=True)
+            return
+
+        # TODO Shouldn't really use create_item and create_section methods here,
+        # TODO should use load_values(..., as_defaults=True) instead!
+
+        for section, options in [(self.no_section, defaults)] + list(sections.items()):
+            if section == self.no_section:
+                target = config
+            else:
+                target = config.find(section)
+                if target is None:
+                    target = config.create_section()
+                    config.add_section(section, target)
+
+            for option, value in options.items():
+                item = target.find(option)
+                if item is None:
+                    target.add_item(option, config.create_item(option, default=value))
+                else:
+                    item.default = value
+
+
+class ConfigParserReaderWriter(IniReaderWriter):
+    """
+    Reads and writes INI files using standard library's ``ConfigParser``
+    (or the backported configparser module in Python 2), which supports value interpolation.
+    """
+
+    def __init__(self, config_parser_factory=None, **options):
+        super(ConfigParserReaderWriter, self).__init__(config_parser_factory=config_parser_factory, **options)
+        self.config_parser_factory = config_parser_factory or configparser.ConfigParser
+
+    def dump_config_to_file(self, config, file_obj, with_defaults=False, only_changed=False, **kwargs):
+        cp = self.config_parser_factory()
+        self._load_config_into_config_parser(config, cp, with_defaults=with_defaults, only_changed=only_changed)
+        cp.write(file_obj)
+
+    def parse_file(self, file_obj, paths=None):
+        # ConfigParser has to parse all sections because of interpolation
+        cp = self.config_parser_factory()
+        cp.read_file(file_obj)
+        return self._filter_ini(*self._get_config_parser_contents(cp), path_tree=_get_path_tree(paths))
+
+    def load_config_from_string(self, config, string, as_defaults=False, paths=None, **kwargs):
+        cp = self.config_parser_factory()
+        cp.read_string(string)
+        self.load_parsed(config, self._get_config_parser_contents(cp), as_defaults=as_defaults, paths=paths)
+
+    def _get_config_parser_contents(self, cp):
+        sections = collections.OrderedDict()
+        for section in cp.sections():
+            sections[section] = collections.OrderedDict(
+                (option, cp.get(section, option)) for option in cp.options(section)
+            )
+        return collections.OrderedDict(cp.defaults()), sections
+
+    def _load_config_into_config_parser(self, config, cp, with_defaults=False, only_changed=False):
+        for section, options in self._get_ini_sections(config, with_defaults, only_changed).items():
+            for option, value in options.items():
+                if not cp.has_section(section) and section != cp.default_section:
+                    cp.add_section(section)
+                cp.set(section, option, value)
+
+
+class EnvvarSource(object):
+    """
+    A source of configuration values in environment variables whose names start with ``prefix``.
+    Can be listed in ``load_sources`` setting together with paths of files, and is then loaded in its turn::
+
+        >>> config = Config(schema, load_sources=['~/.myapp.json', EnvvarSource('MYAPP_')], auto_load=True)
+
+    Names of environment variables without the prefix are matched case-insensitively against paths of items,
+    with path segments separated by underscores (or ``str_path_separator``), so ``MYAPP_UPLOADS_TMP_DIR``
+    sets the value of ``uploads.tmp_dir``. Values are deserialized as if they were read from a file.
+    Variables which don't match any item are ignored.
+
+    Unlike items with ``envvar`` set, which look up their environment variable on every read,
+    the environment is scanned once per load.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self.prefix)
+
+    def __eq__(self, other):
+        return isinstance(other, EnvvarSource) and other.prefix == self.prefix
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.__class__, self.prefix))
+
+    def read(self):
+        """
+        Returns an ordered dictionary of values of the matching environment variables
+        by their names without the prefix.
+        """
+        prefix_len = len(self.prefix)
+        return collections.OrderedDict(sorted(
+            (name[prefix_len:], value) for name, value in os.environ.items()
+            if name.startswith(self.prefix) and len(name) > prefix_len
+        ))
+
+
+class EnvvarReaderWriter(ConfigReaderWriter):
+    """
+    Loads values from environment variables described by :class:`.EnvvarSource` (or its prefix).
+    """
+
+    def _get_source(self, source):
+        if isinstance(source, EnvvarSource):
+            return source
+        return EnvvarSource(source)
+
+    def store_exists(self, store):
+        return True
+
+    def parse_source(self, source, paths=None):
+        return self._get_source(source).read()
+
+    def load_source(self, config, source, as_defaults=False, paths=None):
+        self.load_parsed(config, self.parse_source(source), as_defaults=as_defaults, paths=paths)
+
+    def load_parsed(self, config, parsed, as_defaults=False, paths=None):
+        separator = config.settings.str_path_separator
+        path_tree = _get_path_tree(paths)
+        upper_keys = {}
+
+        values = collections.OrderedDict()
+        for name, value in parsed.items():
+            path = self._resolve_path(config, name.replace(separator, '_').upper().split('_'), upper_keys)
+            if path is not None and _is_path_selected(path_tree, path):
+                values[path] = value
+
+        if as_defaults:
+            for path, value in values.items():
+                item = config.find(path)
+                item.default = item.type.deserialize(value)
+        else:
+            config._update_values(values, flat=True, lazy=True)
+
+    def _resolve_path(self, section, parts, upper_keys):
+        """
+        Find path of the item in ``section`` whose path in upper case joined with underscores
+        is the same as ``parts`` joined with underscores. Returns ``None`` if there is no such item.
+        Only sections along the candidate paths are inspected.
+        """
+        if id(section) not in upper_keys:
+            upper_keys[id(section)] = keys = {}
+            for key in section._tree:
+                keys.setdefault(key.upper(), key)
+
+        keys = upper_keys[id(section)]
+
+        for i in range(1, len(parts) + 1):
+            key = keys.get('_'.join(parts[:i]))
+            if key is None:
+                continue
+
+            obj = section._tree[key]
+            if i == len(parts):
+                if obj.is_item:
+                    return key,
+            elif obj.is_section:
+                rest = self._resolve_path(obj, parts[i:], upper_keys)
+                if rest is not None:
+                    return (key,) + rest
+
+        return None
@@ -1,7 +1,41 @@
+import copy
+
+import six
+
 from .managers import Config
+from .sections import Section
+
+
+class _PlainValuesMixin(object):
+    """
+    Looks up names of items and sections of the section itself directly in the tree,
+    returning values of items, instead of going through the generic lookup and ``key_getter`` dispatch.
+    Everything else (paths, names with underscore suffix, names handled by ``not_found`` hooks)
+    goes the long way.
+    """
+
+    def __getattr__(self, name):
+        if name[:1] != '_' and name[-1:] != '_':
+            obj = self._tree.get(name)
+            if obj is not None:
+                return obj.get() if obj.is_item else obj
+        return super(_PlainValuesMixin, self).__getattr__(name)
+
+    def __getitem__(self, key):
+        if isinstance(key, six.string_types) and key[-1:] != '_':
+            obj = self._tree.get(key)
+            if obj is not None:
+                return obj.get() if obj.is_item else obj
+        return super(_PlainValuesMixin, self).__getitem__(key)
+
+
+class PlainSection(_PlainValuesMixin, Section):
+    """
+    Section of a :class:`.PlainConfig`.
+    """
 
 
-class PlainConfig(Config):
+class PlainConfig(_PlainValuesMixin, Config):
     """
     If in your application code you don't need the rich features that configuration
     :class:`.Item` provides as an object, you can use :class:`.PlainConfig` which
@@ -23,14 +57,39 @@ class PlainConfig(Config):
         >>> config.dump_values()
         {'greeting': 'Hello', {'db': {'user': 'admin'}}}
 
+    Sub-sections are instances of :class:`.PlainSection` unless a custom ``section_factory`` is specified.
+    Values are then read straight from items, so combine it with ``cache_values=True`` and ``frozen_values=True``
+    for the cheapest reads.
+
     """
 
     def __init__(self, *args, **kwargs):
+        if 'configmanager_settings' not in kwargs and 'create_section_factory' not in kwargs:
+            kwargs.setdefault('section_factory', PlainSection)
+
         super(PlainConfig, self).__init__(*args, **kwargs)
 
         self.settings.key_setter = self.__key_setter
         self.settings.key_getter = self.__key_getter
 
+    def __getstate__(self):
+        state = super(PlainConfig, self).__getstate__()
+
+        # key_getter and key_setter are bound methods of this config which can't be unpickled
+        # before the config itself, so they are left out and set again in __setstate__.
+        settings = copy.copy(self._settings)
+        settings._settings = dict(self._settings._settings)
+        settings.key_setter = None
+        settings.key_getter = None
+        state['_settings'] = settings
+
+        return state
+
+    def __setstate__(self, state):
+        super(PlainConfig, self).__setstate__(state)
+        self.settings.key_setter = self.__key_setter
+        self.settings.key_getter = self.__key_getter
+
     def __key_setter(self, subject=None, value=None, default_key_setter=None, **kwargs):
         if subject.is_item:
             subject.value = value
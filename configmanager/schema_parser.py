@@ -4,6 +4,7 @@ import inspect
 import six
 
 from .base import BaseItem, BaseSection
+from .utils import not_set
 
 
 def parse_config_schema(schema, parent_section=None, root=None):
@@ -76,14 +77,76 @@ def parse_config_schema(schema, parent_section=None, root=None):
         # so no need to create a new section.
         section = root or parent_section.create_section()
 
-        for k, v in clean_schema:
-            obj = parse_config_schema(v, parent_section=section)
-            if obj.is_section:
-                section.add_section(k, obj)
-            else:
-                section.add_item(k, obj)
+        if root is None and section.settings.lazy_schema:
+            # Contents of the section will be parsed when they are first needed
+            section._set_lazy_schema(clean_schema)
+        else:
+            parse_section_schema(clean_schema, section)
 
         return section
 
     # Declaration of an item
     return parent_section.create_item(default=schema)
+
+
+def parse_section_schema(clean_schema, section):
+    """
+    Parse the contents of a section from a list of ``(name, schema)`` tuples
+    and add them to ``section``.
+    """
+    for k, v in clean_schema:
+        obj = parse_config_schema(v, parent_section=section)
+        if obj.is_section:
+            section.add_section(k, obj)
+        else:
+            section.add_item(k, obj)
+
+
+def get_schema_tracked_kinds(schema, kinds=None):
+    """
+    Returns a set of kinds of records kept by sections about their items (see ``Section._tracked``)
+    which items declared in ``schema`` (as accepted by :func:`parse_config_schema`, or a list of
+    ``(name, schema)`` tuples postponed by a lazy section) would be recorded as once parsed:
+    ``'value'`` and ``'changed'`` for items with preset values, and ``'envvar'`` for items
+    controlled by environment variables, and ``'config'`` for nested :class:`.Config` instances.
+    Nothing is parsed.
+    """
+    if kinds is None:
+        kinds = set()
+
+    if isinstance(schema, BaseSection):
+        if schema.is_config:
+            kinds.add('config')
+        if schema._lazy_schema is not None:
+            get_schema_tracked_kinds(schema._lazy_schema, kinds)
+        kinds.update(kind for kind, records in schema._tracked.items() if records)
+
+    elif isinstance(schema, BaseItem):
+        if schema._value is not not_set:
+            kinds.update(('value', 'changed'))
+        if schema.envvar:
+            kinds.add('envvar')
+
+    elif inspect.ismodule(schema):
+        get_schema_tracked_kinds(schema.__dict__, kinds)
+
+    elif isinstance(schema, collections.Mapping):
+        if '@value' in schema:
+            kinds.update(('value', 'changed'))
+        if schema.get('@envvar'):
+            kinds.add('envvar')
+        for k, v in schema.items():
+            if not k.startswith(('_', '@')):
+                get_schema_tracked_kinds(v, kinds)
+
+    elif (
+        isinstance(schema, collections.Sequence)
+        and not isinstance(schema, six.string_types)
+        and len(schema) > 0
+        and isinstance(schema[0], tuple)
+    ):
+        for k, v in schema:
+            if not k.startswith(('_', '@')):
+                get_schema_tracked_kinds(v, kinds)
+
+    return kinds
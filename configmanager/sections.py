@@ -6,10 +6,10 @@ import keyword
 import six
 from hookery import HookRegistry
 
-from .schema_parser import parse_config_schema
+from .schema_parser import parse_config_schema, parse_section_schema, get_schema_tracked_kinds
 from .meta import ConfigManagerSettings
 from .exceptions import NotFound
-from .utils import not_set
+from .utils import not_set, _thaw
 from .base import BaseSection, is_config_item, is_config_section
 
 
@@ -29,6 +29,12 @@ class _SectionHooks(HookRegistry):
         self.item_added_to_section = self.register_event('item_added_to_section')
         self.section_added_to_section = self.register_event('section_added_to_section')
         self.item_value_changed = self.register_event('item_value_changed')
+        self.item_values_changed = self.register_event('item_values_changed')
+
+    def unregister_hook(self, event_name, hook):
+        super(_SectionHooks, self).unregister_hook(event_name, hook)
+        # Cached not_found results may have come from the removed hook
+        Section._hooks_version += 1
 
 
 class Section(BaseSection):
@@ -42,6 +48,31 @@ class Section(BaseSection):
 
     _default_settings = ConfigManagerSettings(immutable=True)
 
+    #: Flat index of all items and sections in the tree by their paths (tuples).
+    #: Only built by :class:`.Config` instances, on the first lookup of a multi-key path.
+    _path_index = None
+
+    #: Schema of section contents which haven't been parsed yet (see lazy_schema setting).
+    _lazy_schema = None
+
+    #: Positions of keys in the tree, used to order tracked items. Discarded when keys are added.
+    _key_ranks = None
+
+    #: Incremented whenever an item or a section is added anywhere in this section's subtree.
+    #: Used by :class:`.ItemAccessor` to find out when it has to resolve its item again.
+    _structure_version = 0
+
+    #: Incremented whenever a hook is registered on any section. Used to discard cached ``not_found`` results.
+    _hooks_version = 0
+
+    #: ``(section, key)`` pairs of sections other than ``_section`` holding this section in their trees,
+    #: or under keys other than ``_section_alias``. Only set for sections added more than once.
+    _extra_holders = None
+
+    #: Results of ``not_found`` hooks by names, together with structure and hooks versions
+    #: at which they were cached (see ``not_found_cache_size`` setting).
+    _not_found_cache = None
+
     def __init__(self, schema=None, section=None):
         #: Actual contents of the section
         self._tree = collections.OrderedDict()
@@ -49,9 +80,18 @@ class Section(BaseSection):
         #: Section to which this section belongs (if any at all)
         self._section = section
 
+        #: Settings of the nearest Config up the tree, resolved on first access
+        self._resolved_settings = None
+
         #: Alias of this section with which it was added to its parent section
         self._section_alias = None
 
+        #: Items which have a custom value (``'value'``), are controlled by an environment variable
+        #: (``'envvar'``), or whose value has changed since the last save (``'changed'``),
+        #: nested :class:`.Config` instances (``'config'``), and sub-sections containing
+        #: any of these, by their keys in the tree.
+        self._tracked = {'value': {}, 'envvar': {}, 'changed': {}, 'config': {}}
+
         # Hooks registry
         self._hooks = _SectionHooks(self)
 
@@ -82,27 +122,23 @@ class Section(BaseSection):
         return '<{cls} {alias} at {id}>'.format(cls=self.__class__.__name__, alias=self.alias, id=id(self))
 
     def __contains__(self, key):
-        try:
-            _ = self._get_by_key(key, handle_not_found=False)
-            return True
-        except NotFound:
-            return False
+        return self._find_item_or_section(key) is not not_set
 
     def __setitem__(self, key, value):
         if isinstance(key, six.string_types):
             name = key
             rest = None
         elif isinstance(key, (tuple, list)) and len(key) > 0:
-            name = key[0]
+            name = key[-1]
             if len(key) == 1:
                 rest = None
             else:
-                rest = key[1:]
+                rest = key[:-1]
         else:
             raise TypeError('Expected either a string or a tuple as key, got {!r}'.format(key))
 
         if rest:
-            self[name][rest] = value
+            self._get_item_or_section(rest)[name] = value
             return
 
         self._set_key(name, value)
@@ -115,6 +151,8 @@ class Section(BaseSection):
             raise TypeError('Expected a string, got a {!r}'.format(type(name)))
 
         if name.startswith('_'):
+            if name == '_tree' and self._lazy_schema is not None:
+                return self._materialise()
             raise AttributeError(name)
 
         return self._get_by_key(name)
@@ -124,6 +162,25 @@ class Section(BaseSection):
             return super(Section, self).__setattr__(name, value)
         self._set_key(name, value)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # Hooks and dynamic item attributes are arbitrary callables so they are not pickled.
+        del state['_hooks']
+        state['_Section__item_attributes'] = {}
+        state['_resolved_settings'] = None
+        state.pop('_not_found_cache', None)
+
+        # The path index is rebuilt on first use.
+        state.pop('_path_index', None)
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._hooks = _SectionHooks(self)
+        self._hooks.hook_registered(self._hook_registered)
+
     def _default_key_setter(self, name, subject):
         """
         This method is used only when there is a custom key_setter set.
@@ -143,6 +200,40 @@ class Section(BaseSection):
                 )
             )
 
+    def _set_lazy_schema(self, schema):
+        """
+        Postpone parsing of the section contents until ``_tree`` is first accessed.
+        """
+        assert not self._tree
+        del self._tree
+        self._lazy_schema = schema
+
+    def _materialise(self):
+        """
+        Parse the postponed schema of the section contents.
+        """
+        schema = self._lazy_schema
+        self._lazy_schema = None
+        self._tree = collections.OrderedDict()
+        parse_section_schema(schema, self)
+        return self._tree
+
+    def _iter_materialised_items(self):
+        """
+        Iterate over items in this section and its sub-sections without triggering
+        parsing of lazy sections. May yield the same item more than once.
+        """
+        sections = [self]
+        while sections:
+            section = sections.pop()
+            if section._lazy_schema is not None:
+                continue
+            for obj in section._tree.values():
+                if obj.is_section:
+                    sections.append(obj)
+                else:
+                    yield obj
+
     def _set_key(self, key, value):
         """
         This method must NOT be called from outside the Section class.
@@ -194,35 +285,112 @@ class Section(BaseSection):
         This is needed when checking key existence -- the whole
         purpose of key existence checking is to avoid errors (and error handling).
         """
+        resolution = self._find_item_or_section(key)
+        if resolution is not not_set:
+            return resolution
+
+        # Walk the path again one key at a time so that not_found hooks are called by,
+        # and NotFound is raised for, the section in which the key is missing.
         if isinstance(key, six.string_types):
             if self.settings.str_path_separator in key:
-                return self._get_item_or_section(key.split(self.settings.str_path_separator))
+                return self._get_item_or_section(
+                    key.split(self.settings.str_path_separator), handle_not_found=handle_not_found
+                )
 
             if key.endswith('_') and keyword.iskeyword(key[:-1]):
                 key = key[:-1]
 
-            if key in self._tree:
-                resolution = self._tree[key]
-            else:
-                if handle_not_found:
-                    result = self.dispatch_event(self.hooks.not_found, name=key, section=self)
-                    if result is not None:
-                        resolution = result
-                    else:
-                        raise NotFound(key, section=self)
-                else:
-                    raise NotFound(key, section=self)
+            if handle_not_found:
+                result = self._handle_not_found(key)
+                if result is not None:
+                    return result
+            raise NotFound(key, section=self)
+
+        if len(key) == 1:
+            return self._get_item_or_section(key[0], handle_not_found=handle_not_found)
+        return self._get_item_or_section(
+            key[0], handle_not_found=handle_not_found
+        )._get_item_or_section(key[1:], handle_not_found=handle_not_found)
+
+    def _handle_not_found(self, name):
+        """
+        Dispatch ``not_found`` event for ``name`` and return the result.
+
+        If ``not_found_cache_size`` setting is set, up to that many results (including ``None``)
+        are cached until an item or a section is added to this section, any hook is registered or unregistered,
+        or ``hooks_enabled`` setting of this section or any section above it changes.
+        """
+        cache_size = self.settings.not_found_cache_size
+        if not cache_size or not self.settings.hooks_enabled:
+            return self.dispatch_event(self.hooks.not_found, name=name, section=self)
+
+        # Hooks of a section above this one are only called if hooks are enabled in that section
+        hooks_enabled = []
+        section = self.section
+        while section is not None:
+            hooks_enabled.append(bool(section.settings.hooks_enabled))
+            section = section.section
+
+        versions = (self._structure_version, Section._hooks_version, tuple(hooks_enabled))
+        if self._not_found_cache is None or self._not_found_cache[0] != versions:
+            self._not_found_cache = (versions, collections.OrderedDict())
+        results = self._not_found_cache[1]
+
+        if name in results:
+            return results[name]
+
+        result = self.dispatch_event(self.hooks.not_found, name=name, section=self)
+        if len(results) >= cache_size:
+            results.popitem(last=False)
+        results[name] = result
+        return result
+
+    def _find_item_or_section(self, key):
+        """
+        This method must NOT be called from outside the Section class.
+
+        Do not override this method.
+
+        Same as ``_get_item_or_section(key, handle_not_found=False)``, except that
+        ``not_set`` is returned instead of raising :class:`.NotFound`, so misses cost a dictionary lookup.
+        """
+        if isinstance(key, six.string_types):
+            if self.settings.str_path_separator in key:
+                return self._find_item_or_section(key.split(self.settings.str_path_separator))
+
+            if key.endswith('_') and keyword.iskeyword(key[:-1]):
+                key = key[:-1]
+
+            return self._tree.get(key, not_set)
 
         elif isinstance(key, (tuple, list)) and len(key) > 0:
-            if len(key) == 1:
-                resolution = self._get_item_or_section(key[0], handle_not_found=handle_not_found)
-            else:
-                resolution = self._get_item_or_section(
-                    key[0], handle_not_found=handle_not_found
-                )._get_item_or_section(key[1:], handle_not_found=handle_not_found)
+            if self.is_config and len(key) > 1:
+                resolution = self._get_path_index().get(tuple(key))
+                if resolution is not None:
+                    return resolution
+
+            resolution = self
+            for k in key:
+                if not resolution.is_section:
+                    return not_set
+                resolution = resolution._find_item_or_section(k)
+                if resolution is not_set:
+                    return not_set
+            return resolution
+
         else:
             raise TypeError('Expected either a string or a tuple as key, got {!r}'.format(key))
 
+    def find(self, key, default=None):
+        """
+        Returns the item or section at ``key`` (a name, an alias, or a path), or ``default`` if there is none.
+
+        Unlike :meth:`.get_item` and :meth:`.get_section`, doesn't raise :class:`.NotFound`
+        and doesn't call ``not_found`` hooks, so it is the cheapest way to look up keys which may not exist.
+        """
+        resolution = self._find_item_or_section(key)
+        if resolution is not_set:
+            return default
         return resolution
 
     def get_item(self, *key):
@@ -258,6 +426,17 @@ class Section(BaseSection):
         """
         return PathProxy(self, key)
 
+    def accessor(self, *key):
+        """
+        Get a callable which returns value of the item at ``key``. The item is looked up on the first call
+        and then only when items or sections have been added to this section since the previous lookup,
+        so calling it is much cheaper than accessing the item by its path every time.
+
+        Returns:
+            (:class:`.ItemAccessor`)
+        """
+        return ItemAccessor(self, key)
+
     @property
     def hooks(self):
         """
@@ -302,7 +481,7 @@ class Section(BaseSection):
                 'but {!r} does.'.format(self.settings.str_path_separator, item)
             )
 
-        self._tree[item.name] = item
+        self._replace_in_tree(item.name, item)
 
         if item.name != alias:
             if self.settings.str_path_separator in alias:
@@ -310,9 +489,18 @@ class Section(BaseSection):
                     'Item alias must not contain str_path_separator which is configured for this Config -- {!r} --'
                     'but {!r} used for {!r} does.'.format(self.settings.str_path_separator, alias, item)
                 )
-            self._tree[alias] = item
+            self._replace_in_tree(alias, item)
 
         item._section = self
+        item._invalidate_cache(envvar_name=True)
+        item._track_value(changed=item._value is not not_set)
+
+        if item._frozen != self.settings.frozen_values:
+            item._set_frozen(self.settings.frozen_values)
+
+        self._update_path_indexes(item.name, item)
+        if item.name != alias:
+            self._update_path_indexes(alias, item)
 
         self.dispatch_event(self.hooks.item_added_to_section, alias=alias, section=self, subject=item)
 
@@ -323,7 +511,7 @@ class Section(BaseSection):
         if not isinstance(alias, six.string_types):
             raise TypeError('Section name must be a string, got a {!r}'.format(type(alias)))
 
-        self._tree[alias] = section
+        self._replace_in_tree(alias, section)
 
         if self.settings.str_path_separator in alias:
             raise ValueError(
@@ -331,11 +519,210 @@ class Section(BaseSection):
                 'but {!r} does.'.format(self.settings.str_path_separator, alias)
             )
 
+        was_frozen = section.settings.frozen_values
+        had_caches = section._has_value_caches()
+
+        if section._section_alias is not None:
+            # The section stays in the trees of its other holders, so their records have to be kept up to date too
+            holders = list(section._extra_holders or ())
+            holders.append((section._section, section._section_alias))
+            section._extra_holders = [
+                (holder, key) for holder, key in holders
+                if holder._tree.get(key) is section and not (holder is self and key == alias)
+            ] or None
+
         section._section = self
         section._section_alias = alias
 
+        for kind, records in section._tracked.items():
+            if records:
+                self._set_tracked(kind, alias, section, True)
+
+        if section.is_config:
+            self._set_tracked('config', alias, section, True)
+
+        # Items of lazy sections aren't tracked until they are parsed, so sections
+        # whose schema declares items with preset values or controlled by environment variables,
+        # or nested configs, are tracked instead.
+        if section._lazy_schema is not None:
+            for kind in get_schema_tracked_kinds(section._lazy_schema):
+                self._set_tracked(kind, alias, section, True)
+
+        if not section.is_config and section._resolved_settings is not self.settings:
+            section._reset_resolved_settings()
+
+        # Items cache their environment variable names which depend on the path
+        # so the caches have to be discarded when the section moves. Nested configs
+        # may cache values even if the settings which apply here don't.
+        if had_caches or section._has_value_caches():
+            section.refresh_environment()
+
+        if was_frozen != section.settings.frozen_values:
+            for item in section._iter_materialised_items():
+                item._set_frozen(item.section.settings.frozen_values)
+
+        self._update_path_indexes(alias, section)
+
         self.dispatch_event(self.hooks.section_added_to_section, alias=alias, section=self, subject=section)
 
+    def _replace_in_tree(self, key, obj):
+        """
+        Put ``obj`` in the tree under ``key``, dropping whatever section was there before
+        from path indexes.
+        """
+        existing = self._tree.get(key)
+        if existing is None:
+            self._key_ranks = None
+        elif existing is not obj:
+            for kind in self._tracked:
+                self._set_tracked(kind, key, existing, False)
+            if existing.is_section:
+                self._update_path_indexes(key, existing, remove=True)
+        self._tree[key] = obj
+
+    def _get_key_ranks(self):
+        """
+        Returns a dictionary of positions of keys in the tree.
+        """
+        if self._key_ranks is None:
+            self._key_ranks = {key: i for i, key in enumerate(self._tree)}
+        return self._key_ranks
+
+    def _set_tracked(self, kind, key, obj, tracked):
+        """
+        Record (or, if ``tracked`` is ``False``, forget) that ``obj`` stored under ``key``
+        in this section is of the ``kind`` (see ``_tracked``), and update records of all sections up the tree
+        which hold this one.
+        """
+        records = self._tracked[kind]
+        if tracked:
+            if records.get(key) is obj:
+                return
+            records[key] = obj
+        else:
+            if records.get(key) is not obj:
+                return
+            del records[key]
+            # A config is recorded as such by its holders even if it has no nested configs left
+            if records or (kind == 'config' and self.is_config):
+                return
+        for holder, alias in self._iter_holders():
+            holder._set_tracked(kind, alias, self, tracked)
+
+    def _iter_holders(self):
+        """
+        Iterate over ``(section, key)`` pairs of sections which hold this section in their trees.
+        A section added to more than one section, or under more than one key, has more than one holder.
+        """
+        if self._section is not None and self._section_alias is not None:
+            if self._section._tree.get(self._section_alias) is self:
+                yield self._section, self._section_alias
+        if self._extra_holders:
+            for holder, key in self._extra_holders:
+                if holder._tree.get(key) is self:
+                    yield holder, key
+
+    def _iter_tracked_items(self, *kinds):
+        """
+        Iterate over ``(path, item)`` pairs of items in this section and its sub-sections
+        tracked as any of the ``kinds``, in the order of the tree.
+        Takes time proportional to the number of tracked items, not the size of the tree.
+        """
+        records = {}
+        for kind in kinds:
+            records.update(self._tracked[kind])
+        if not records:
+            return
+
+        for key in sorted(records, key=self._get_key_ranks().__getitem__):
+            obj = records[key]
+            if obj.is_section:
+                if obj._lazy_schema is not None:
+                    obj._materialise()
+                for path, item in obj._iter_tracked_items(*kinds):
+                    yield (key,) + path, item
+            else:
+                yield (key,), obj
+
+    def _iter_nested_configs(self, materialise=True):
+        """
+        Iterate over ``(path, config)`` pairs of :class:`.Config` instances nested in this section
+        and its sub-sections, in the order of the tree. Takes time proportional to the number
+        of sections leading to nested configs, not the size of the tree.
+
+        Lazy sections which declare nested configs are parsed, unless ``materialise`` is ``False``,
+        in which case they are skipped.
+        """
+        records = self._tracked['config']
+        if not records:
+            return
+
+        for key in sorted(records, key=self._get_key_ranks().__getitem__):
+            obj = records[key]
+            if obj._lazy_schema is not None:
+                if not materialise:
+                    continue
+                obj._materialise()
+            if obj.is_config:
+                yield (key,), obj
+            for path, config in obj._iter_nested_configs(materialise=materialise):
+                yield (key,) + path, config
+
+    def _iter_dumped_items(self, with_defaults=True, only_changed=False):
+        """
+        Iterate over ``(path, item)`` pairs of all items that may have to be dumped.
+        """
+        if only_changed:
+            return self._iter_tracked_items('changed')
+        elif with_defaults:
+            return self.iter_items(recursive=True)
+        else:
+            return self._iter_tracked_items('value', 'envvar')
+
+    def _update_path_indexes(self, alias, obj, remove=False):
+        """
+        Add ``obj`` (and everything it contains) which is stored under ``alias`` in this section to path indexes
+        of all :class:`.Config` instances up the tree which have built one. If ``remove`` is ``True``, remove it instead.
+
+        Sections which haven't been added to their parent sections yet don't propagate
+        the change any further -- the whole subtree is indexed when they are added.
+
+        Structure versions of all sections along the way are incremented.
+        """
+        path = (alias,)
+        section = self
+        while True:
+            section._structure_version += 1
+            if section._path_index is not None:
+                section._index_paths(path, obj, remove=remove)
+            if section._section is None or section._section_alias is None:
+                break
+            path = (section._section_alias,) + path
+            section = section._section
+
+    def _index_paths(self, path, obj, remove=False):
+        index = self._path_index
+        stack = [(path, obj)]
+        while stack:
+            path, obj = stack.pop()
+            if remove:
+                if index.get(path) is obj:
+                    del index[path]
+            else:
+                index[path] = obj
+            if obj.is_section and obj._lazy_schema is None:
+                stack.extend((path + (k,), v) for k, v in obj._tree.items())
+
+    def _get_path_index(self):
+        """
+        Returns the path index of this section, building it on first use.
+        """
+        if self._path_index is None:
+            self._path_index = {}
+            for key, obj in self._tree.items():
+                self._index_paths((key,), obj)
+        return self._path_index
+
     def _get_str_path_separator(self, override=None):
         if override is None or override is not_set:
             return self.settings.str_path_separator
@@ -357,10 +744,6 @@ class Section(BaseSection):
         else:
             clean_path = path
 
-        # This is to raise NotFound in case path doesn't exist and to have it
-        # handled by not_found hook callbacks.
-        self._get_by_key(path)
-
         return clean_path
 
     def _get_recursive_iterator(self, recursive=False):
@@ -403,7 +786,8 @@ class Section(BaseSection):
     def _get_path_iterator(self, path=None, recursive=False):
         clean_path = self._parse_path(path=path)
 
-        config = self[clean_path] if clean_path else self
+        # Raises NotFound in case path doesn't exist, after not_found hook callbacks have had a go.
+        config = self._get_item_or_section(clean_path) if clean_path else self
 
         if clean_path:
             yield clean_path, config
@@ -489,7 +873,7 @@ class Section(BaseSection):
         Recursively resets values of all items contained in this section
         and its subsections to their default values.
         """
-        for _, item in self.iter_items(recursive=True):
+        for _, item in list(self._iter_tracked_items('value')):
             item.reset()
 
     @property
@@ -498,17 +882,45 @@ class Section(BaseSection):
         ``True`` if values of all config items in this section and its subsections
         have their values equal to defaults or have no value set.
         """
-        for _, item in self.iter_items(recursive=True):
+        for _, item in self._iter_tracked_items('value', 'envvar'):
             if not item.is_default:
                 return False
         return True
 
-    def dump_values(self, with_defaults=True, dict_cls=dict, flat=False):
+    def mark_saved(self):
+        """
+        Forget which items of this section and its sub-sections have changed
+        since the last save (see ``only_changed`` argument of :meth:`.dump_values`).
+
+        Persistence adapters call this after writing configuration to a file.
+        """
+        sections = [self]
+        while sections:
+            records = sections.pop()._tracked['changed']
+            for obj in records.values():
+                if obj.is_section:
+                    # Otherwise preset values would be recorded as changed once the section is parsed
+                    if obj._lazy_schema is not None:
+                        obj._materialise()
+                    sections.append(obj)
+            records.clear()
+
+        for holder, alias in list(self._iter_holders()):
+            holder._set_tracked('changed', alias, self, False)
+
+    def dump_values(self, with_defaults=True, dict_cls=dict, flat=False, only_changed=False):
         """
         Export values of all items contained in this section to a dictionary.
 
         Items with no values set (and no defaults set if ``with_defaults=True``) will be excluded.
 
+        Unless ``with_defaults`` is ``True``, this takes time proportional to the number of items
+        with custom values rather than the size of the tree.
+
+        Args:
+            only_changed: if ``True``, only items whose values have been set or reset since
+                the last save (see :meth:`.mark_saved`) will be included.
+
         Returns:
             dict: A dictionary of key-value pairs, where for sections values are dictionaries
             of their contents.
@@ -516,11 +928,21 @@ class Section(BaseSection):
         """
         values = dict_cls()
 
-        if flat:
-            for str_path, item in self.iter_items(recursive=True, key='str_path'):
+        if flat or only_changed or not with_defaults:
+            separator = self.settings.str_path_separator
+            for path, item in self._iter_dumped_items(with_defaults=with_defaults, only_changed=only_changed):
                 if item.has_value:
                     if with_defaults or not item.is_default:
-                        values[str_path] = item.value
+                        value = _thaw(item.value) if item._frozen else item.value
+                        if flat:
+                            values[separator.join(path)] = value
+                            continue
+                        section_values = values
+                        for name in path[:-1]:
+                            if name not in section_values:
+                                section_values[name] = dict_cls()
+                            section_values = section_values[name]
+                        section_values[path[-1]] = value
         else:
             for item_name, item in self._tree.items():
                 if is_config_section(item):
@@ -530,7 +952,7 @@ class Section(BaseSection):
                 else:
                     if item.has_value:
                         if with_defaults or not item.is_default:
-                            values[item.name] = item.value
+                            values[item.name] = _thaw(item.value) if item._frozen else item.value
         return values
 
     def load_values(self, dictionary, as_defaults=False, flat=False):
@@ -548,6 +970,10 @@ class Section(BaseSection):
             dictionary:
             as_defaults: if ``True``, the imported values will be set as defaults.
         """
+        if not as_defaults:
+            self.update_values(dictionary, flat=flat)
+            return
+
         if flat:
             # Deflatten the dictionary and then pass on to the normal case.
             separator = self.settings.str_path_separator
@@ -565,23 +991,124 @@ class Section(BaseSection):
                         c = c[kp]
 
         for name, value in dictionary.items():
-            if name not in self:
+            obj = self._find_item_or_section(name)
+            if obj is not_set:
                 if as_defaults:
                     if isinstance(value, dict):
-                        self[name] = self.create_section()
-                        self[name].load_values(value, as_defaults=as_defaults)
+                        section = self.create_section()
+                        self[name] = section
+                        section.load_values(value, as_defaults=as_defaults)
                     else:
                         self[name] = self.create_item(name, default=value)
                 else:
                     # Skip unknown names if not interpreting dictionary as defaults
                     continue
-            elif is_config_item(self[name]):
+            elif is_config_item(obj):
                 if as_defaults:
-                    self[name].default = value
+                    obj.default = value
                 else:
-                    self[name].value = value
+                    obj.value = value
+            else:
+                obj.load_values(value, as_defaults=as_defaults)
+
+    def update_values(self, dictionary, flat=False):
+        """
+        Set values of items from a dictionary, skipping unknown names.
+
+        Unlike setting values one by one, listeners are notified only once all values are set:
+        ``item_values_changed`` hooks are called once per section with the list of all
+        changes of items in that section and its sub-sections. Each change is a named tuple
+        of ``item``, ``old_value``, ``new_value``, ``old_raw_str_value``, and ``new_raw_str_value``.
+
+        Args:
+            dictionary: nested dictionary of values or, if ``flat`` is ``True``,
+                a dictionary of values by paths (tuples or str_paths).
+        """
+        self._update_values(dictionary, flat=flat)
+
+    def _update_values(self, dictionary, flat=False, lazy=False):
+        """
+        Implementation of :meth:`.update_values`. Persistence adapters of text formats pass ``lazy=True``
+        so that string values may be deserialized on first read (see ``lazy_deserialization`` setting).
+        """
+        changes = []
+        try:
+            self._collect_value_changes(dictionary, changes, flat=flat, lazy=lazy)
+        finally:
+            # Values set before a failure stay set, so listeners must hear about them.
+            if changes:
+                self._dispatch_value_changes(changes)
+
+    def _collect_value_changes(self, dictionary, changes, flat=False, lazy=False):
+        for key, value in dictionary.items():
+            obj = self._find_item_or_section(key)
+            if obj is not_set:
+                continue
+
+            if is_config_item(obj):
+                change = obj._set_value(value, lazy=lazy)
+                if change is not None:
+                    changes.append(change)
             else:
-                self[name].load_values(value, as_defaults=as_defaults)
+                obj._collect_value_changes(value, changes, lazy=lazy)
+
+    def _dispatch_value_changes(self, changes):
+        """
+        Notify listeners of ``item_value_changed`` about every change and listeners of
+        ``item_values_changed`` about all changes under their section at once.
+
+        The section tree is walked once per distinct section of changed items
+        rather than once per changed item.
+        """
+        listeners = {}
+        batches = collections.OrderedDict()
+
+        for change in changes:
+            section = change.item.section
+            if section is None:
+                continue
+
+            if id(section) not in listeners:
+                listeners[id(section)] = section._get_value_change_listeners()
+            has_item_listeners, batch_listeners = listeners[id(section)]
+
+            if has_item_listeners or batch_listeners:
+                change = change.item._resolve_change(change)
+
+            if has_item_listeners:
+                section.dispatch_event(
+                    section.hooks.item_value_changed,
+                    item=change.item,
+                    old_value=change.old_value,
+                    new_value=change.new_value,
+                    old_raw_str_value=change.old_raw_str_value,
+                    new_raw_str_value=change.new_raw_str_value,
+                )
+
+            for listener in batch_listeners:
+                batches.setdefault(id(listener), (listener, []))[1].append(change)
+
+        for listener, listener_changes in batches.values():
+            listener.hooks.dispatch_event(listener.hooks.item_values_changed, changes=listener_changes)
+
+    def _get_value_change_listeners(self):
+        """
+        Returns a tuple of a flag indicating whether any section up the tree
+        has ``item_value_changed`` hooks, and a list of sections up the tree
+        which have ``item_values_changed`` hooks.
+        """
+        has_item_listeners = False
+        batch_listeners = []
+        section = self
+        while section is not None:
+            if section.settings.hooks_enabled:
+                hooks = section.hooks
+                if hooks[hooks.item_value_changed]:
+                    has_item_listeners = True
+                if hooks[hooks.item_values_changed]:
+                    batch_listeners.append(section)
+            section = section.section
+        return has_item_listeners, batch_listeners
 
     def create_item(self, *args, **kwargs):
         """
@@ -624,10 +1151,24 @@ class Section(BaseSection):
         For section objects which haven't been added to a manager yet,
         this points to default settings which are the same for all such free-floating sections.
         """
-        if self._section:
-            return self._section.settings
-        else:
-            return self._default_settings
+        if self._resolved_settings is None:
+            if self._section:
+                self._resolved_settings = self._section.settings
+            else:
+                self._resolved_settings = self._default_settings
+        return self._resolved_settings
+
+    def _reset_resolved_settings(self):
+        """
+        Forget the resolved settings of this section and all its sub-sections
+        which don't have their own settings.
+        """
+        self._resolved_settings = None
+        if self._lazy_schema is not None:
+            return
+        for obj in self._tree.values():
+            if obj.is_section and not obj.is_config:
+                obj._reset_resolved_settings()
 
     def add_schema(self, schema):
         """
@@ -673,6 +1214,8 @@ class Section(BaseSection):
             if attr_name.startswith('_'):
                 raise RuntimeError('Invalid dynamic item attribute name -- should not start with an underscore')
             self.__item_attributes[attr_name] = func
+            if self._has_value_caches():
+                self.refresh_environment()
             return func
 
         if f is None:
@@ -680,6 +1223,29 @@ class Section(BaseSection):
         else:
             return decorator(f)
 
+    def refresh_environment(self):
+        """
+        Discard cached environment variable names and effective values of all items
+        in this section and its sub-sections.
+
+        Only relevant if ``cache_values`` setting is enabled -- call this after changing
+        environment variables that the items are controlled by.
+        """
+        for item in self._iter_materialised_items():
+            item._invalidate_cache(envvar_name=True)
+
+    def _has_value_caches(self):
+        """
+        ``True`` if items of this section or of configs nested in it may have cached
+        their values (see ``cache_values`` setting).
+
+        Configs in unparsed lazy sections are skipped -- their caches are discarded
+        when they are added to the tree.
+        """
+        if self.settings.cache_values:
+            return True
+        return any(config.settings.cache_values for _, config in self._iter_nested_configs(materialise=False))
+
     def get_item_attribute(self, item, name):
         """
         Method called by item when an attribute is not found.
@@ -692,6 +1258,7 @@ class Section(BaseSection):
             raise AttributeError(name)
 
     def _hook_registered(self):
+        Section._hooks_version += 1
         if self.settings.hooks_enabled is None:
             self.settings.hooks_enabled = True
 
@@ -735,3 +1302,38 @@ class PathProxy(object):
 
     def __getattr__(self, name):
         return getattr(self._get_real_object(), name)
+
+
+class ItemAccessor(object):
+    """
+    Callable returned by :meth:`.Section.accessor` which returns value of the item at a path.
+    """
+
+    __slots__ = ('_section', '_key', '_item', '_version')
+
+    def __init__(self, section, key):
+        self._section = section
+        self._key = key
+        self._item = None
+        self._version = None
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, self._key)
+
+    def __call__(self):
+        if self._version != self._section._structure_version:
+            self._resolve()
+        return self._item.get()
+
+    @property
+    def item(self):
+        """
+        The item whose value the accessor returns.
+        """
+        if self._version != self._section._structure_version:
+            self._resolve()
+        return self._item
+
+    def _resolve(self):
+        self._item = self._section.get_item(*self._key)
+        self._version = self._section._structure_version
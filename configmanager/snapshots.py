@@ -0,0 +1,163 @@
+"""
+Snapshots are files holding a fully built :class:`.Config` (its sections, items, and their values)
+which can be loaded without parsing the schema and the configuration files again.
+
+A snapshot is only loaded if it was created by the same version of *configmanager*
+and Python, with the same ``key``, and if none of the ``load_sources`` of the snapshotted
+configuration have changed since the snapshot was created.
+
+Snapshots are pickles, so loading one runs code chosen by whoever wrote it. A snapshot is
+therefore refused if it isn't owned by the current user or can be written by other users.
+"""
+import hashlib
+import io
+import os.path
+import stat
+import sys
+
+from six.moves import cPickle as pickle
+
+from .persistence import EnvvarSource, _get_file_fingerprint, _open_for_atomic_write
+
+
+#: Bytes with which every snapshot file starts.
+SNAPSHOT_MAGIC = b'CMSNAPSHOT1\n'
+
+
+def _get_version():
+    from . import __version__
+    return __version__
+
+
+def _get_envvars_fingerprint(source):
+    """
+    Returns hash of the environment variables read by ``source`` so that their values
+    (which may be secrets) aren't written to the snapshot.
+    """
+    return hashlib.sha256(repr(list(source.read().items())).encode('utf-8')).hexdigest()
+
+
+def _is_file_trusted(file_obj):
+    """
+    Returns ``True`` if the open file is owned by the current user and no one else can write to it.
+    Always ``True`` on platforms without POSIX file ownership.
+    """
+    if not hasattr(os, 'getuid'):
+        return True
+    st = os.fstat(file_obj.fileno())
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _get_sources_fingerprints(config):
+    fingerprints = []
+    for section in [config] + list(config.iter_sections(recursive=True, key=None)):
+        if not section.is_config:
+            continue
+        for source in section.settings.load_sources:
+            if isinstance(source, EnvvarSource):
+                fingerprints.append((source, _get_envvars_fingerprint(source)))
+                continue
+            path = os.path.abspath(os.path.expanduser(source))
+            if os.path.exists(path):
+                fingerprints.append((path, _get_file_fingerprint(path, use_hash=True)))
+            else:
+                fingerprints.append((path, None))
+    return fingerprints
+
+
+def _is_source_unchanged(path, fingerprint):
+    if isinstance(path, EnvvarSource):
+        return _get_envvars_fingerprint(path) == fingerprint
+
+    if fingerprint is None:
+        return not os.path.exists(path)
+
+    try:
+        current = _get_file_fingerprint(path)
+    except OSError:
+        return False
+
+    if current == fingerprint[:2]:
+        return True
+
+    # File may have been touched without being changed
+    return current[1] == fingerprint[1] and _get_file_fingerprint(path, use_hash=True)[2] == fingerprint[2]
+
+
+def dump_snapshot(config, path, key=None):
+    """
+    Write snapshot of ``config`` to file at ``path``.
+
+    Hooks and dynamic item attributes are not included in the snapshot.
+
+    Args:
+        config (:class:`.Config`): configuration tree which does not belong to another section.
+        key: any picklable object identifying the schema (for example, a version number)
+            which must be passed to :func:`load_snapshot` for the snapshot to be loaded.
+    """
+    if config.section is not None:
+        raise ValueError('Cannot create a snapshot of {!r} because it belongs to another section'.format(config))
+
+    # Values of environment variables may change before the snapshot is loaded, so they must not be cached
+    config.refresh_environment()
+
+    header = {
+        'configmanager': _get_version(),
+        'python': tuple(sys.version_info[:2]),
+        'key': key,
+        'sources': _get_sources_fingerprints(config),
+    }
+
+    with _open_for_atomic_write(path, 'wb') as f:
+        if hasattr(os, 'fchmod'):
+            # Snapshots which other users can write to are refused by load_snapshot
+            os.fchmod(f.fileno(), stat.S_IMODE(os.fstat(f.fileno()).st_mode) & ~(stat.S_IWGRP | stat.S_IWOTH))
+        f.write(SNAPSHOT_MAGIC)
+        pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+        pickle.dump(config, f, pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(path, key=None):
+    """
+    Load configuration tree from a snapshot created with :func:`dump_snapshot`.
+
+    Returns:
+        :class:`.Config` or ``None`` if the snapshot does not exist, is out of date,
+        or is not owned by the current user or can be written by other users.
+    """
+    try:
+        with open(os.path.expanduser(path), 'rb') as f:
+            # Nothing is unpickled from files which someone else could have written
+            if not _is_file_trusted(f):
+                return None
+            data = f.read()
+    except (IOError, OSError):
+        return None
+
+    if not data.startswith(SNAPSHOT_MAGIC):
+        return None
+
+    stream = io.BytesIO(data)
+    stream.seek(len(SNAPSHOT_MAGIC))
+
+    try:
+        header = pickle.load(stream)
+    except Exception:
+        return None
+
+    if (
+        not isinstance(header, dict)
+        or header.get('configmanager') != _get_version()
+        or header.get('python') != tuple(sys.version_info[:2])
+        or header.get('key') != key
+    ):
+        return None
+
+    for source_path, fingerprint in header['sources']:
+        if not _is_source_unchanged(source_path, fingerprint):
+            return None
+
+    try:
+        return pickle.load(stream)
+    except Exception:
+        return None
@@ -1,3 +1,4 @@
+import collections
 import os.path
 
 
@@ -30,10 +31,147 @@ class _NotSet(object):
     def __copy__(self):
         return self
 
+    def __reduce__(self):
+        # Unpickle as the one and only instance
+        return 'not_set'
+
 
 not_set = _NotSet()
 
 
+class _Deferred(object):
+    """
+    Value of an item which has only been loaded as a raw string and will be deserialized
+    when it is first read (see ``lazy_deserialization`` setting).
+    """
+
+    instance = None
+
+    def __init__(self):
+        if self.__class__.instance is not None:
+            raise RuntimeError('An instance of {} already initialised'.format(self.__class__.__name__))
+        self.__class__.instance = self
+
+    def __repr__(self):
+        return '<Deferred>'
+
+    def __deepcopy__(self, memodict):
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __reduce__(self):
+        # Unpickle as the one and only instance
+        return 'deferred'
+
+
+deferred = _Deferred()
+
+
+class _FrozenMapping(object):
+    """
+    Base of read-only mappings used to hold dictionary values of items in ``frozen_values`` mode.
+    Subclasses set ``_mapping_cls`` to the mutable mapping class they are based on.
+    """
+
+    __slots__ = ()
+
+    _mapping_cls = dict
+
+    def __init__(self, items=()):
+        if getattr(self, '_initialised', False):
+            self._read_only()
+        # Mutating methods of the subclass are blocked, so contents are set through the base class.
+        self._mapping_cls.__init__(self)
+        for k, v in items:
+            self._mapping_cls.__setitem__(self, k, v)
+        self._initialised = True
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('{} is read-only'.format(self.__class__.__name__))
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (list(self.items()),)
+
+    def __deepcopy__(self, memodict):
+        return self
+
+    def __copy__(self):
+        return self
+
+
+class _FrozenDict(_FrozenMapping, dict):
+    """
+    A read-only dictionary used to hold dictionary values of items in ``frozen_values`` mode.
+    """
+
+    __slots__ = ('_initialised',)
+
+
+class _FrozenOrderedDict(_FrozenMapping, collections.OrderedDict):
+    """
+    A read-only ordered dictionary used to hold ``OrderedDict`` values of items in ``frozen_values`` mode,
+    so that they keep their order and are thawed as ``OrderedDict`` instances.
+    """
+
+    __slots__ = ('_initialised',)
+
+    _mapping_cls = collections.OrderedDict
+
+
+class _FrozenList(tuple):
+    """
+    A tuple used to hold list values of items in ``frozen_values`` mode,
+    so that they can be told apart from values which were tuples to begin with.
+    """
+
+
+class _FrozenSet(frozenset):
+    """
+    A frozenset used to hold set values of items in ``frozen_values`` mode,
+    so that they can be told apart from values which were frozensets to begin with.
+    """
+
+
+def _freeze(value):
+    """
+    Returns an immutable equivalent of ``value``: dictionaries become read-only dictionaries,
+    lists become tuples, and sets become frozensets.
+    """
+    if isinstance(value, (_FrozenMapping, _FrozenList, _FrozenSet)):
+        return value
+    elif isinstance(value, collections.OrderedDict):
+        return _FrozenOrderedDict((k, _freeze(v)) for k, v in value.items())
+    elif isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    elif isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, set):
+        return _FrozenSet(value)
+    return value
+
+
+def _thaw(value):
+    """
+    Reverse of :func:`_freeze`. Returns mutable copies of values frozen by :func:`_freeze`,
+    leaving tuples and frozensets which weren't created by it as they are.
+    """
+    if isinstance(value, _FrozenMapping):
+        return value._mapping_cls((k, _thaw(v)) for k, v in value.items())
+    elif isinstance(value, _FrozenList):
+        return [_thaw(v) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(_thaw(v) for v in value)
+    elif isinstance(value, _FrozenSet):
+        return set(value)
+    return value
+
+
 _file_ext_to_adapter_name = {
     '.json': 'json',
     '.yaml': 'yaml',
@@ -0,0 +1,165 @@
+import collections
+
+import pytest
+
+from configmanager import Config, Item
+from configmanager.sections import Section
+
+
+@pytest.fixture
+def config():
+    return Config(collections.OrderedDict([
+        ('greeting', 'Hello'),
+        ('uploads', collections.OrderedDict([
+            ('enabled', False),
+            ('threads', 1),
+            ('db', collections.OrderedDict([
+                ('user', 'root'),
+                ('password', Item()),
+            ])),
+        ])),
+        ('downloads', {'threads': Item(default=2, envvar=True)}),
+    ]))
+
+
+@pytest.fixture
+def no_full_walks(monkeypatch):
+    def iter_items(*args, **kwargs):
+        raise AssertionError('Should not walk all items')
+    monkeypatch.setattr(Section, 'iter_items', iter_items)
+
+
+def test_items_with_custom_values_are_tracked(config):
+    assert config._tracked['value'] == {}
+
+    config.uploads.db.user.value = 'admin'
+    config.uploads.threads.value = 5
+    assert config._tracked['value'] == {'uploads': config.uploads}
+    assert config.uploads._tracked['value'] == {'threads': config.uploads.threads, 'db': config.uploads.db}
+
+    config.uploads.db.user.reset()
+    assert config.uploads._tracked['value'] == {'threads': config.uploads.threads}
+
+    config.update_values({'uploads': {'threads': 1, 'enabled': True}})
+    config.reset()
+    assert config._tracked['value'] == {}
+    assert config.uploads._tracked['value'] == {}
+
+
+def test_dump_values_reset_and_is_default_do_not_walk_all_items(config, no_full_walks, monkeypatch):
+    assert config.is_default
+    assert config.dump_values(with_defaults=False) == {}
+
+    config.uploads.db.password.value = 'secret'
+    config.uploads.enabled.value = True
+    config.greeting.value = 'Hello'  # same as default
+
+    assert not config.is_default
+    assert config.uploads.db.is_default is False
+    assert list(config.dump_values(with_defaults=False, dict_cls=collections.OrderedDict).items()) == [
+        ('uploads', collections.OrderedDict([('enabled', True), ('db', {'password': 'secret'})])),
+    ]
+    assert list(config.dump_values(with_defaults=False, flat=True, dict_cls=collections.OrderedDict).items()) == [
+        ('uploads.enabled', True),
+        ('uploads.db.password', 'secret'),
+    ]
+
+    monkeypatch.setenv('DOWNLOADS_THREADS', '3')
+    assert not config.downloads.is_default
+    assert config.downloads.dump_values(with_defaults=False) == {'threads': 3}
+
+    config.reset()
+    assert config.uploads.db.password.value is not None
+    assert config.dump_values(with_defaults=False) == {'downloads': {'threads': 3}}
+
+
+def test_changed_values_are_tracked_until_saved(config, tmpdir):
+    config.uploads.threads.value = 5
+    config.uploads.db.user.value = 'admin'
+
+    assert config.dump_values(only_changed=True) == {'uploads': {'threads': 5, 'db': {'user': 'admin'}}}
+
+    config.json.dump(tmpdir.join('config.json').strpath)
+    assert config.dump_values(only_changed=True) == {}
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 5, 'db': {'user': 'admin'}}}
+
+    config.uploads.db.user.reset()
+    config.greeting.value = 'Hi'
+    assert config.dump_values(only_changed=True, with_defaults=True) == {
+        'greeting': 'Hi',
+        'uploads': {'db': {'user': 'root'}},
+    }
+
+    config.uploads.mark_saved()
+    assert config.dump_values(only_changed=True) == {'greeting': 'Hi'}
+    assert config.json.dumps(only_changed=True) == '{\n  "greeting": "Hi"\n}'
+    assert config.configparser.dumps(only_changed=True) == '[NO_SECTION]\ngreeting = Hi\n\n'
+
+
+def test_tracking_follows_sections_and_items_added_to_tree():
+    db = Config({'user': Item(default='root', value='admin'), 'password': 'secret'})
+    assert db.dump_values(with_defaults=False) == {'user': 'admin'}
+
+    config = Config({'uploads': {'threads': 1}})
+    config.uploads.db = db
+    assert config.dump_values(with_defaults=False) == {'uploads': {'db': {'user': 'admin'}}}
+    assert config.dump_values(only_changed=True) == {'uploads': {'db': {'user': 'admin'}}}
+
+    config.uploads.db = Config({'user': 'root'})
+    assert config.dump_values(with_defaults=False) == {}
+    assert config.is_default
+
+
+def test_changeset_reset_updates_tracking(config):
+    with config.changeset_context() as ctx:
+        config.uploads.threads.value = 5
+
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 5}}
+
+    ctx.reset()
+    assert config.dump_values(with_defaults=False) == {}
+    assert config.is_default
+
+
+def test_sections_added_under_more_than_one_key_or_to_more_than_one_config_are_tracked():
+    config = Config({'s': {'a': 1}})
+    config.add_section('t', config.s)
+    config.s.a.value = 2
+
+    assert config.dump_values(with_defaults=False) == {'s': {'a': 2}, 't': {'a': 2}}
+
+    other = Config()
+    other.add_section('u', config.s)
+    config.s.a.value = 3
+
+    assert config.dump_values(with_defaults=False) == {'s': {'a': 3}, 't': {'a': 3}}
+    assert other.dump_values(with_defaults=False) == {'u': {'a': 3}}
+
+    config.s.a.reset()
+    assert config.is_default
+    assert other.is_default
+
+    config.s = Section({'b': 1})
+    config.t.a.value = 4
+    assert config.dump_values(with_defaults=False) == {'t': {'a': 4}}
+    assert other.dump_values(with_defaults=False) == {'u': {'a': 4}}
+
+
+def test_preset_values_in_unparsed_lazy_sections_are_tracked():
+    config = Config({
+        'db': {'user': Item(default='a', value='b')},
+        'uploads': {'nested': Config({'threads': Item(default=1, value=2)})},
+        'downloads': {'threads': 1},
+    }, lazy_schema=True)
+
+    assert not config.is_default
+    assert config.dump_values(with_defaults=False) == {'db': {'user': 'b'}, 'uploads': {'nested': {'threads': 2}}}
+    assert config.dump_values(only_changed=True) == {'db': {'user': 'b'}, 'uploads': {'nested': {'threads': 2}}}
+    assert config.downloads._lazy_schema is not None
+
+    config.mark_saved()
+    assert config.dump_values(only_changed=True) == {}
+
+    config.reset()
+    assert config.is_default
+    assert config.db.user.value == 'a'
@@ -1,3 +1,7 @@
+import collections
+
+import pytest
+
 from configmanager import Config
 from configmanager.utils import not_set
 
@@ -387,3 +391,31 @@ def test_calling_config_returns_changeset_context_which_resets_itself_on_exit():
 
     assert config.uploads.threads.value == 1
     assert config.uploads.db.user.value == 'root'
+
+
+def test_changeset_context_records_batch_updates():
+    config = Config({'greeting': 'Hello', 'db': {'user': 'root'}})
+
+    with config.changeset_context() as ctx:
+        config.update_values({'greeting': 'Hey', 'db': {'user': 'admin'}})
+        config.load_values({'db.user': 'Administrator'}, flat=True)
+
+    assert ctx.values == {config.greeting: 'Hey', config.db.user: 'Administrator'}
+    assert ctx.changes[config.db.user].old_value is not_set
+
+    ctx.reset()
+    assert config.dump_values() == {'greeting': 'Hello', 'db': {'user': 'root'}}
+
+
+def test_changeset_context_records_values_set_before_an_invalid_value_in_batch():
+    config = Config({'a': 'default', 'b': 1})
+
+    with config.changeset_context() as ctx:
+        with pytest.raises(ValueError):
+            config.load_values(collections.OrderedDict([('a', 'changed'), ('b', 'notanint')]))
+
+    assert config.a.value == 'changed'
+    assert ctx.values == {config.a: 'changed'}
+
+    ctx.reset()
+    assert config.a.value == 'default'
@@ -0,0 +1,61 @@
+import pytest
+
+from configmanager import Config, Item
+from configmanager.codegen import build_accessor, generate_module, get_fingerprint, write_module
+
+
+@pytest.fixture
+def config():
+    return Config({
+        'greeting': 'Hello',
+        'class': 'first',
+        'not-an-identifier': 1,
+        'uploads': {
+            'threads': 1,
+            'db': {
+                'user': 'root',
+            },
+        },
+        'api': Config({
+            'port': 8080,
+        }),
+    })
+
+
+def test_accessor_exposes_values_of_items_through_attributes(config):
+    accessor = build_accessor(config)
+
+    assert accessor.greeting == 'Hello'
+    assert accessor.class_ == 'first'
+    assert accessor.uploads.threads == 1
+    assert accessor.uploads.db.user == 'root'
+    assert accessor.api.port == 8080
+    assert not hasattr(accessor, '__dict__')
+
+    config.uploads.db.user.value = 'admin'
+    config.api.port.value = '8000'
+    assert accessor.uploads.db.user == 'admin'
+    assert accessor.api.port == 8000
+
+    with pytest.raises(AttributeError):
+        accessor.uploads.threads = 5
+
+
+def test_generated_module_can_be_written_and_imported(config, tmpdir, monkeypatch):
+    path = tmpdir.join('generated_config_accessor.py').strpath
+    write_module(config, path, class_name='AppConfig')
+
+    monkeypatch.syspath_prepend(tmpdir.strpath)
+    module = __import__('generated_config_accessor')
+
+    assert module.FINGERPRINT == get_fingerprint(config)
+    accessor = module.AppConfig(config)
+    assert accessor.uploads.db.user == 'root'
+
+    config.uploads.add_item('enabled', Item(default=False))
+    assert get_fingerprint(config) != module.FINGERPRINT
+
+    # Generated code only depends on the structure of the configuration
+    other = Config(config.dump_values(with_defaults=True))
+    other.greeting.value = 'Hey'
+    assert generate_module(other, class_name='AppConfig') == generate_module(config, class_name='AppConfig')
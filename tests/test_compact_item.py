@@ -0,0 +1,98 @@
+import copy
+
+import pytest
+
+from configmanager import Config, CompactItem, Item, ItemAttribute, Types
+from configmanager.utils import not_set
+
+
+def test_compact_item_is_an_item_without_instance_dict_for_declared_attributes():
+    item = CompactItem('threads', default=5, envvar=True, required=True)
+
+    assert isinstance(item, Item)
+    assert item.name == 'threads'
+    assert item.type == Types.int
+    assert item.default == 5
+    assert item.value == 5
+    assert item.envvar is True
+    assert item.required is True
+    assert item.envvar_name is None
+    assert item.raw_str_value is not_set
+
+    assert '_name' in CompactItem.__slots__
+    assert '_value' in CompactItem.__slots__
+    assert not item.__dict__
+
+
+def test_compact_item_stores_ad_hoc_attributes_in_dict():
+    item = CompactItem(default=5, comment='I was here')
+    assert item.comment == 'I was here'
+    assert item.__dict__ == {'comment': 'I was here'}
+
+    copied = copy.deepcopy(item)
+    assert copied.comment == 'I was here'
+    assert copied.default == 5
+
+
+def test_compact_item_as_item_factory():
+    config = Config({
+        'uploads': {
+            'threads': 1,
+            'db': {'user': 'root'},
+        },
+    }, item_factory=CompactItem)
+
+    assert isinstance(config.uploads.threads, CompactItem)
+    assert config.uploads.threads.get_path() == ('uploads', 'threads')
+
+    config.uploads.threads.value = '5'
+    assert config.uploads.threads.value == 5
+    assert config.uploads.threads.raw_str_value == '5'
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 5}}
+
+    config.reset()
+    assert config.uploads.threads.value == 1
+
+    @config.item_attribute
+    def help(item=None, **kwargs):
+        return 'Help for {}'.format(item.name)
+
+    assert config.uploads.db.user.help == 'Help for user'
+
+    with pytest.raises(AttributeError):
+        _ = config.uploads.db.user.nonexistent
+
+
+def test_compact_item_subclasses_get_slots_for_their_attributes():
+    class CustomItem(CompactItem):
+        is_custom = ItemAttribute(name='is_custom', default=True)
+
+    assert CustomItem.__slots__ == ('_is_custom',)
+
+    item = CustomItem(default=1)
+    assert item.is_custom is True
+
+    item.is_custom = False
+    assert item.is_custom is False
+    assert not item.__dict__
+
+    copied = copy.deepcopy(item)
+    assert copied.is_custom is False
+
+
+def test_compact_items_take_less_memory_than_items():
+    tracemalloc = pytest.importorskip('tracemalloc')
+
+    def measure(item_factory):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            items = [copy.deepcopy(item_factory(name='item', default=i)) for i in range(1000)]
+            return tracemalloc.get_traced_memory()[0] - before, items
+        finally:
+            tracemalloc.stop()
+
+    compact_size, _ = measure(CompactItem)
+    item_size, _ = measure(Item)
+
+    assert compact_size < item_size
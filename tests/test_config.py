@@ -446,6 +446,37 @@ def test__contains__handles_str_paths(simple_config, plain_config):
     assert 'uploads/db/user' not in plain_config
 
 
+def test_find_returns_items_and_sections_or_default_without_calling_not_found_hooks(simple_config, plain_config):
+    calls = []
+
+    @simple_config.hooks.not_found
+    def not_found(name=None, section=None):
+        calls.append(name)
+
+    assert simple_config.find('uploads') is simple_config.uploads
+    assert simple_config.find('uploads.db.user') is simple_config.uploads.db.user
+    assert simple_config.find(('uploads', 'db', 'user')) is simple_config.uploads.db.user
+    assert simple_config.uploads.find('db').find('user') is simple_config.uploads.db.user
+    assert plain_config.find('uploads.db.user') is plain_config.get_item('uploads', 'db', 'user')
+
+    assert simple_config.find('downloads') is None
+    assert simple_config.find('uploads.db.user.name') is None
+    assert simple_config.find(('uploads', 'nonexistent'), default=not_set) is not_set
+    assert calls == []
+
+    with pytest.raises(TypeError):
+        simple_config.find(5)
+
+
+def test_load_values_into_plain_config(plain_config):
+    plain_config.load_values({'uploads': {'threads': '5', 'db': {'user': 'admin'}}, 'downloads': {'x': 1}})
+    assert plain_config.uploads.threads == 5
+    assert plain_config.uploads.db.user == 'admin'
+
+    plain_config.load_values({'uploads': {'tmp_dir': '/tmp'}}, as_defaults=True)
+    assert plain_config.uploads.tmp_dir == '/tmp'
+
+
 def test_can_use__setitem__to_create_new_deep_paths():
     config = Config()
     config['uploads'] = Config({'enabled': True})
@@ -558,6 +589,22 @@ def test_config_accepts_and_respects_str_path_separator_setting(simple_config):
     }
 
 
+def test_settings_set_after_initialisation_are_recorded_and_applied(simple_config):
+    simple_config.settings.str_path_separator = '/'
+
+    assert simple_config.settings._settings['str_path_separator'] == '/'
+    assert "'str_path_separator': '/'" in repr(simple_config.settings)
+
+    assert simple_config['uploads/db/user'] is simple_config.uploads.db.user
+    assert 'uploads.db.user' not in simple_config
+
+    # The callback survives pickling
+    import pickle
+    config = pickle.loads(pickle.dumps(simple_config))
+    config.settings.str_path_separator = ':'
+    assert config['uploads:db:user'] is config.uploads.db.user
+
+
 def test_config_of_configs():
     uploads = Config({
         'threads': 1,
@@ -625,6 +672,37 @@ def test_nested_section_settings_are_the_settings_of_the_nearest_manager_in_tree
     assert c.main.b1.b2.b3.b4.b5.settings is c.main.b1.b2.b3.b4.settings
 
 
+def test_resolved_section_settings_follow_section_when_it_is_moved():
+    uploads = Section({'db': Section({'api': Section()})})
+    assert uploads.db.api.settings is Section._default_settings
+
+    first = Config({'x': 1})
+    first.add_section('uploads', uploads)
+    assert uploads.settings is first.settings
+    assert uploads.db.api.settings is first.settings
+
+    second = Config({'x': 1})
+    second.add_section('uploads', uploads)
+    assert uploads.settings is second.settings
+    assert uploads.db.api.settings is second.settings
+
+
+def test_settings_are_plain_attributes_except_mutable_immutable_defaults():
+    config = Config(str_path_separator='/')
+    assert config.settings.__dict__['str_path_separator'] == '/'
+    assert config.settings.__dict__['load_sources'] is config.settings.load_sources
+
+    defaults = Section._default_settings
+    assert defaults.__dict__['str_path_separator'] == '.'
+    assert 'load_sources' not in defaults.__dict__
+    assert defaults.load_sources is not defaults.load_sources
+
+    # Lazily created settings are stored as attributes on first access
+    assert 'section_factory' not in config.settings.__dict__
+    assert config.settings.section_factory is Section
+    assert config.settings.__dict__['section_factory'] is Section
+
+
 def test_get_item_and_get_section_for_rich_config():
     config = Config({
         'uploads': Section({
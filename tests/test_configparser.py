@@ -283,3 +283,120 @@ def test_writes_to_and_reads_from_default_section_transparently(tmpdir):
     config2.configparser.load(config_ini, as_defaults=True)
 
     assert config1.dump_values() == config2.dump_values() == {'greeting': 'Hello', 'name': 'World'}
+
+
+ini_documents = [
+    '',
+    '[a]\nx = 1\ny: two words \n',
+    '[DEFAULT]\nx = default\n\n[a]\ny = 2\n[b]\nx = b\n',
+    '[a]\nX = upper\n; comment\n# comment\n\n[NO_SECTION]\ngreeting = hi = there\n',
+    '[a]\nx = first line\n  second line\n\n  third line\n\ny = 1\n\n\n',
+    '[a]\nx =\ny = 1\n',
+    '[a]\nx = 1\n[DEFAULT]\ny = late default\n',
+]
+
+
+@pytest.mark.parametrize('document', ini_documents)
+def test_native_ini_reader_is_compatible_with_configparser(document):
+    schema = {
+        'greeting': 'hello',
+        'x': '', 'y': '',
+        'a': {'x': '', 'y': ''},
+        'b': {'x': '', 'y': ''},
+    }
+
+    native = Config(schema)
+    cp = Config(schema, use_configparser=True)
+    native.configparser.loads(document)
+    cp.configparser.loads(document)
+    assert native.dump_values() == cp.dump_values()
+
+    native = Config()
+    cp = Config(use_configparser=True)
+    native.configparser.loads(document, as_defaults=True)
+    cp.configparser.loads(document, as_defaults=True)
+    assert native.dump_values() == cp.dump_values()
+
+    assert native.configparser.dumps(with_defaults=True) == cp.configparser.dumps(with_defaults=True)
+
+
+@pytest.mark.parametrize('document,exception', [
+    ('x = 1\n', 'MissingSectionHeaderError'),
+    ('[a]\n[a]\n', 'DuplicateSectionError'),
+    ('[a]\nx = 1\nX = 2\n', 'DuplicateOptionError'),
+    ('[a]\nx\n', 'ParsingError'),
+    ('[a]\n= 1\n', 'ParsingError'),
+])
+def test_native_ini_reader_raises_configparser_exceptions(document, exception):
+    import configparser
+
+    for config in (Config(), Config(use_configparser=True)):
+        with pytest.raises(getattr(configparser, exception)):
+            config.configparser.loads(document)
+
+
+def test_native_ini_writer_is_compatible_with_configparser():
+    schema = collections.OrderedDict([
+        ('greeting', 'hello'),
+        ('DEFAULT', {'x': 'default'}),
+        ('a', collections.OrderedDict([('Name', 'Bob'), ('text', 'two\nlines')])),
+    ])
+
+    native = Config(schema)
+    cp = Config(schema, use_configparser=True)
+
+    assert native.configparser.dumps(with_defaults=True) == cp.configparser.dumps(with_defaults=True) == (
+        '[DEFAULT]\n'
+        'x = default\n'
+        '\n'
+        '[NO_SECTION]\n'
+        'greeting = hello\n'
+        '\n'
+        '[a]\n'
+        'name = Bob\n'
+        'text = two\n'
+        '\tlines\n'
+        '\n'
+    )
+
+
+def test_configparser_is_used_on_request_or_with_custom_factory():
+    import configparser
+    from configmanager.persistence import ConfigParserReaderWriter, IniReaderWriter
+
+    assert type(Config().configparser._rw) is IniReaderWriter
+    assert type(Config(use_configparser=True).configparser._rw) is ConfigParserReaderWriter
+    assert type(Config(configparser_factory=configparser.RawConfigParser).configparser._rw) is ConfigParserReaderWriter
+
+    config = Config({'a': {'x': '', 'y': ''}}, use_configparser=True)
+    config.configparser.loads('[a]\nx = 1\ny = %(x)s2\n')
+    assert config.a.y.value == '12'
+
+
+@pytest.mark.parametrize('use_configparser', [False, True])
+def test_load_with_paths_loads_only_selected_sections_and_options(use_configparser):
+    config = Config({
+        'name': '',
+        'a': {'x': '', 'y': ''},
+        'b': {'x': ''},
+    }, use_configparser=use_configparser)
+
+    config.configparser.loads(
+        '[NO_SECTION]\n'
+        'name = Bob\n'
+        '\n'
+        '[b]\n'
+        'x = skipped\n'
+        '  [a]\n'
+        '\n'
+        '[a]\n'
+        'X = 1\n'
+        'y = 2\n',
+        paths=['a.x', ('b', 'z')],
+    )
+    assert config.dump_values(with_defaults=False) == {'a': {'x': '1'}}
+
+    if not use_configparser:
+        # Syntax errors in skipped sections are not reported
+        config.configparser.loads('[a]\ny = 3\n[c]\nnot an option\n', paths=['a'])
+        assert config.dump_values(with_defaults=False) == {'a': {'x': '1', 'y': '3'}}
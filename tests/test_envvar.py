@@ -1,4 +1,4 @@
-from configmanager import Section
+from configmanager import Config, EnvvarSource, Section
 
 
 def test_envvar_attribute_enables_value_override_via_envvars(monkeypatch):
@@ -68,3 +68,64 @@ def test_dynamic_override_of_envvar_name(monkeypatch):
 
     monkeypatch.setenv('OTHER_UPLOADS_THREADS', '42')
     assert config.uploads.threads.value == 42
+
+
+def test_envvar_source_loads_values_by_prefix(monkeypatch, tmpdir):
+    json_path = tmpdir.join('config.json').strpath
+    with open(json_path, 'w') as f:
+        f.write('{"uploads": {"threads": 3, "tmp_dir": "/var/tmp"}}')
+
+    monkeypatch.setenv('TESTAPP_UPLOADS_THREADS', '5')
+    monkeypatch.setenv('TESTAPP_UPLOADS_ENABLED', 'yes')
+    monkeypatch.setenv('TESTAPP_UPLOADS_DB_USER', 'admin')
+    monkeypatch.setenv('TESTAPP_UPLOADS_UNKNOWN', 'x')
+    monkeypatch.setenv('TESTAPP_', 'x')
+    monkeypatch.setenv('UPLOADS_THREADS', '7')
+
+    schema = {
+        'uploads': {
+            'threads': 1,
+            'enabled': False,
+            'tmp_dir': '/tmp',
+            'db': {'user': 'root'},
+        },
+    }
+
+    config = Config(schema, load_sources=[EnvvarSource('TESTAPP_'), json_path], auto_load=True)
+    assert config.uploads.threads.value == 3
+    assert config.uploads.enabled.value is True
+    assert config.uploads.db.user.value == 'admin'
+    assert config.uploads.tmp_dir.value == '/var/tmp'
+
+    config = Config(schema, load_sources=[json_path, EnvvarSource('TESTAPP_')], auto_load=True)
+    assert config.uploads.threads.value == 5
+    assert config.uploads.threads.raw_str_value == '5'
+
+    monkeypatch.setenv('TESTAPP_UPLOADS_TMP_DIR', '/home/tmp')
+    monkeypatch.delenv('TESTAPP_UPLOADS_ENABLED')
+    monkeypatch.setenv('TESTAPP_UPLOADS.ENABLED', 'no')
+    config.load()
+    assert config.uploads.tmp_dir.value == '/home/tmp'
+    assert config.uploads.enabled.value is False
+
+
+def test_envvar_source_does_not_parse_lazy_sections_it_does_not_need(monkeypatch):
+    monkeypatch.setenv('TESTAPP_UPLOADS_THREADS', '5')
+
+    config = Config({'uploads': {'threads': 1}, 'downloads': {'threads': 1}}, lazy_schema=True)
+    config.envvars.load('TESTAPP_')
+
+    assert config.uploads.threads.value == 5
+    assert config.downloads._lazy_schema is not None
+
+
+def test_envvar_source_loads_defaults(monkeypatch):
+    monkeypatch.setenv('TESTAPP_THREADS', '5')
+    monkeypatch.setenv('TESTAPP_ENABLED', 'no')
+
+    config = Config({'threads': 1, 'enabled': True})
+    config.envvars.load(EnvvarSource('TESTAPP_'), as_defaults=True)
+
+    assert config.threads.default == 5
+    assert config.enabled.default is False
+    assert config.is_default
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from configmanager import Config, Item, Section
+
+
+@pytest.fixture
+def schema():
+    return {
+        'hosts': ['a', 'b'],
+        'db': {
+            'options': {'@type': 'dict', '@default': {'timeout': 5, 'retries': [1, 2]}},
+            'threads': 1,
+        },
+    }
+
+
+def test_default_mode_returns_copies_of_defaults(schema):
+    config = Config(schema)
+
+    config.hosts.value.append('c')
+    assert config.hosts.value == ['a', 'b']
+    assert config.hosts.value is not config.hosts.value
+
+
+def test_frozen_values_are_returned_without_copying(schema):
+    config = Config(schema, frozen_values=True)
+
+    assert config.hosts.value == ('a', 'b')
+    assert config.hosts.value is config.hosts.value
+
+    options = config.db.options.value
+    assert options == {'timeout': 5, 'retries': (1, 2)}
+    assert options is config.db.options.value
+
+    with pytest.raises(TypeError):
+        options['timeout'] = 10
+
+    with pytest.raises(TypeError):
+        options.__ior__({'timeout': 10})
+
+    with pytest.raises(TypeError):
+        options.__init__({'timeout': 10})
+
+    assert config.db.options.default == {'timeout': 5, 'retries': (1, 2)}
+
+    with pytest.raises(AttributeError):
+        config.hosts.value.append('c')
+
+
+def test_frozen_values_are_frozen_on_set_and_default_change(schema):
+    config = Config(schema, frozen_values=True)
+
+    config.hosts.value = ['x', 'y']
+    assert config.hosts.value == ('x', 'y')
+    assert not config.hosts.is_default
+
+    config.hosts.default = ['x', 'y']
+    assert config.hosts.default == ('x', 'y')
+    assert config.hosts.is_default
+
+    config.db.threads.value = '5'
+    assert config.db.threads.value == 5
+
+
+def test_dump_values_thaws_frozen_values(schema):
+    config = Config(schema, frozen_values=True)
+
+    values = config.dump_values()
+    assert values['hosts'] == ['a', 'b']
+    assert type(values['db']['options']) is dict
+    assert values['db']['options']['retries'] == [1, 2]
+
+    assert json.loads(config.json.dumps(with_defaults=True)) == {
+        'hosts': ['a', 'b'],
+        'db': {'options': {'timeout': 5, 'retries': [1, 2]}, 'threads': 1},
+    }
+
+
+def test_items_are_frozen_and_thawed_when_moved():
+    uploads = Section({'hosts': ['a', 'b']})
+    assert uploads.hosts.value == ['a', 'b']
+
+    frozen = Config(frozen_values=True)
+    frozen.add_section('uploads', uploads)
+    assert uploads.hosts.value == ('a', 'b')
+
+    frozen.add_item('ports', Item(default=[80, 443]))
+    assert frozen.ports.value == (80, 443)
+
+    plain = Config()
+    plain.add_section('uploads', uploads)
+    assert uploads.hosts.value == ['a', 'b']
+
+
+def test_thawing_restores_lists_and_sets_but_keeps_tuples_and_frozensets():
+    from configmanager.utils import _freeze, _thaw
+
+    value = {'pair': (1, [2, {'x': 3}]), 'tags': {'a'}, 'fixed_tags': frozenset(['b'])}
+    thawed = _thaw(_freeze(value))
+    assert thawed == value
+    assert type(thawed['pair']) is tuple
+    assert type(thawed['pair'][1]) is list
+    assert type(thawed['pair'][1][1]) is dict
+    assert type(thawed['tags']) is set
+    assert type(thawed['fixed_tags']) is frozenset
+
+    config = Config({'options': Item(default={'pair': (1, 2)}), 'hosts': ['a', 'b']}, frozen_values=True)
+    assert config.dump_values() == {'options': {'pair': (1, 2)}, 'hosts': ['a', 'b']}
+    assert type(config.dump_values()['options']['pair']) is tuple
+
+    section = Section()
+    section.add_item('options', config.options)
+    assert type(section.options.value['pair']) is tuple
+
+
+def test_thawing_keeps_ordered_dicts_in_order():
+    import collections
+    import pickle
+
+    from configmanager.utils import _freeze, _thaw
+
+    value = collections.OrderedDict([('z', 1), ('a', collections.OrderedDict([('y', 2), ('b', 3)])), ('m', 4)])
+    frozen = _freeze(value)
+    assert list(frozen) == ['z', 'a', 'm']
+    assert list(pickle.loads(pickle.dumps(frozen))) == ['z', 'a', 'm']
+
+    with pytest.raises(TypeError):
+        frozen['x'] = 5
+
+    thawed = _thaw(frozen)
+    assert type(thawed) is collections.OrderedDict
+    assert type(thawed['a']) is collections.OrderedDict
+    assert list(thawed) == ['z', 'a', 'm']
+    assert list(thawed['a']) == ['y', 'b']
+
+
+def test_str_value_of_frozen_values_is_that_of_thawed_values(schema):
+    config = Config(schema, frozen_values=True)
+    assert config.hosts.str_value == str(['a', 'b'])
+    assert 'hosts = {}'.format(['a', 'b']) in config.configparser.dumps(with_defaults=True)
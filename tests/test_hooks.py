@@ -444,3 +444,139 @@ def test_not_found_hook_handled_in_iterators(simple_config):
         list(simple_config.iter_paths(path='uploads.downloads.leftloads.rightloads', recursive=True))
 
     assert len(calls) == 2
+
+
+def test_item_values_changed_hook_called_once_per_update():
+    config = Config({
+        'greeting': 'Hello',
+        'uploads': {
+            'threads': 1,
+            'db': {
+                'user': 'root',
+            },
+        },
+    })
+
+    root_calls = []
+    uploads_calls = []
+
+    @config.hooks.item_values_changed
+    def root_values_changed(changes):
+        root_calls.append([(c.item.name, c.old_value, c.new_value) for c in changes])
+
+    @config.uploads.hooks.item_values_changed
+    def uploads_values_changed(changes):
+        uploads_calls.append([c.item.name for c in changes])
+
+    config.update_values({
+        'greeting': 'Hey',
+        'uploads': {'threads': 5, 'db': {'user': 'admin'}, 'nonexistent': True},
+    })
+
+    assert root_calls == [[('greeting', not_set, 'Hey'), ('threads', not_set, 5), ('user', not_set, 'admin')]]
+    assert uploads_calls == [['threads', 'user']]
+
+    config.update_values({'uploads.db.user': 'Administrator', ('uploads', 'threads'): 6, 'x.y': 1}, flat=True)
+    assert root_calls[-1] == [('user', 'admin', 'Administrator'), ('threads', 5, 6)]
+    assert len(uploads_calls) == 2
+
+    config.greeting.set('Hi')
+    assert root_calls[-1] == [('greeting', 'Hey', 'Hi')]
+    assert len(uploads_calls) == 2
+
+
+def test_update_values_calls_item_value_changed_hooks_for_each_item():
+    config = Config({'uploads': {'threads': 1, 'enabled': False}})
+    calls = []
+
+    @config.uploads.hooks.item_value_changed
+    def item_value_changed(item, old_value, new_value):
+        calls.append((item.name, config.uploads.enabled.value))
+
+    config.update_values({'uploads': {'threads': 5, 'enabled': True}})
+
+    # Hooks are called once all values are set
+    assert calls == [('threads', True), ('enabled', True)]
+
+
+def test_update_values_does_not_dispatch_events_without_hooks(monkeypatch):
+    config = Config({'uploads': {'threads': 1, 'db': {'user': 'root'}}})
+    dispatched = []
+
+    def dispatch_event(self, event_, **kwargs):
+        dispatched.append(event_.name)
+
+    monkeypatch.setattr(Section, 'dispatch_event', dispatch_event)
+
+    config.update_values({'uploads': {'db': {'user': 'admin'}}})
+    assert dispatched == []
+    assert config.uploads.db.user.value == 'admin'
+
+
+def test_not_found_results_are_not_returned_from_cache_when_hooks_are_disabled():
+    config = Config({'uploads': {'threads': 1}}, not_found_cache_size=2)
+
+    @config.hooks.not_found
+    def not_found(name=None, section=None):
+        return section.create_item(name, default=name)
+
+    assert config.uploads.dynamic.value == 'dynamic'
+
+    config.settings.hooks_enabled = False
+    with pytest.raises(NotFound):
+        _ = config.uploads.dynamic
+    with pytest.raises(NotFound):
+        _ = config.other
+
+    config.settings.hooks_enabled = True
+    assert config.uploads.dynamic.value == 'dynamic'
+
+
+def test_not_found_results_are_not_returned_from_cache_after_hook_is_unregistered():
+    config = Config({'uploads': {'threads': 1}}, not_found_cache_size=2)
+
+    def not_found(name=None, section=None):
+        return section.create_item(name, default=name)
+
+    config.hooks.not_found(not_found)
+    assert config.uploads.dynamic.value == 'dynamic'
+
+    config.hooks.unregister_hook(config.hooks.not_found, not_found)
+    with pytest.raises(NotFound):
+        _ = config.uploads.dynamic
+
+
+def test_not_found_results_are_cached_if_enabled():
+    config = Config({'uploads': {'threads': 1}}, not_found_cache_size=2)
+    calls = []
+
+    @config.hooks.not_found
+    def not_found(name=None, section=None):
+        calls.append(name)
+        if name.startswith('dynamic'):
+            return section.create_item(name, default=name)
+
+    assert config.uploads.dynamic1.value == 'dynamic1'
+    assert config.uploads.dynamic1 is config.uploads.dynamic1
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            _ = config.uploads.missing
+    assert calls == ['dynamic1', 'missing']
+
+    # Oldest result is discarded once there are more than not_found_cache_size names
+    assert config.uploads.dynamic2.value == 'dynamic2'
+    assert config.uploads.dynamic1.value == 'dynamic1'
+    assert calls == ['dynamic1', 'missing', 'dynamic2', 'dynamic1']
+
+    # Adding items discards the cache
+    config.uploads.add_item('enabled', Item(default=True))
+    assert config.uploads.dynamic1.value == 'dynamic1'
+    assert calls[-1] == 'dynamic1' and len(calls) == 5
+
+    # So does registering hooks
+    @config.uploads.hooks.not_found
+    def missing_found(name=None, section=None):
+        if name == 'missing':
+            return section.create_item(name, default=0)
+
+    assert config.uploads.missing.value == 0
@@ -1,4 +1,6 @@
 import json
+import os
+import stat
 
 import collections
 import pytest
@@ -115,6 +117,41 @@ def test_json_writes_with_defaults_false_by_default(user_json_path):
     assert d.greeting.value == 'Hey!'
 
 
+def test_json_dump_replaces_file_atomically(user_json_path, monkeypatch):
+    os.chmod(user_json_path, 0o640)
+    with open(user_json_path) as f:
+        original = f.read()
+
+    c = Config({'uploads': {'threads': 1}})
+    c.uploads.threads.value = 3
+
+    written = []
+
+    class Encoder(json.JSONEncoder):
+        def iterencode(self, o, _one_shot=False):
+            for chunk in super(Encoder, self).iterencode(o, _one_shot=_one_shot):
+                with open(user_json_path) as f:
+                    written.append(f.read())
+                yield chunk
+            raise IOError('Disk full')
+
+    monkeypatch.setattr(c.json._rw.json, 'JSONEncoder', Encoder)
+    with pytest.raises(IOError):
+        c.json.dump(user_json_path)
+
+    assert written and all(w == original for w in written)
+    assert os.listdir(os.path.dirname(user_json_path)) == ['user.json']
+    with open(user_json_path) as f:
+        assert f.read() == original
+
+    monkeypatch.undo()
+    c.json.dump(user_json_path)
+    with open(user_json_path) as f:
+        assert json.load(f) == {'uploads': {'threads': 3}}
+    assert stat.S_IMODE(os.stat(user_json_path).st_mode) == 0o640
+    assert os.listdir(os.path.dirname(user_json_path)) == ['user.json']
+
+
 def test_json_reads_and_writes_strings():
     c = Config({'greeting': 'Hello'})
     assert c.json.dumps() == '{}'
@@ -150,3 +187,134 @@ def test_json_reads_and_writes_preserve_order(tmpdir):
 
     item_names = list(item.name for _, item in config2.iter_items())
     assert item_names == ['a', 'b', 'c', 'x', 'y', 'z', 'm', 'n']
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 64 * 1024])
+def test_json_streaming_load_matches_normal_load(monkeypatch, chunk_size):
+    from configmanager.persistence import _JsonStreamLoader
+    monkeypatch.setattr(_JsonStreamLoader, 'chunk_size', chunk_size)
+
+    schema = {
+        'uploads': {
+            'threads': 1,
+            'tmp_dir': '/tmp',
+            'limits': {'@default': {'size': 1}, '@type': dict},
+            'db': {'user': 'root'},
+        },
+        'ratio': 0.5,
+        'enabled': False,
+    }
+    document = json.dumps(collections.OrderedDict([
+        ('uploads', collections.OrderedDict([
+            ('threads', 12345),
+            ('unknown', {'nested': ['}', '"', {'a': [1, 2]}]}),
+            ('tmp_dir', 'C:\\Temp \u00e9 "quoted"'),
+            ('limits', {'size': [1, 2]}),
+            ('db', {'password': 'secret', 'user': 'admin'}),
+        ])),
+        ('ratio', -1.5e-3),
+        ('enabled', True),
+        ('unknown', [1, ']', None]),
+    ]))
+
+    expected = Config(schema)
+    expected.json.loads(document)
+
+    config = Config(schema, json_streaming=True)
+    config.json.loads(document)
+
+    assert config.dump_values() == expected.dump_values()
+    assert config.uploads.threads.value == 12345
+    assert config.ratio.value == -1.5e-3
+    assert config.uploads.db.user.value == 'admin'
+
+
+def test_json_streaming_load_notifies_listeners_once(tmpdir):
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'uploads': {'threads': 5, 'enabled': True}}, f)
+
+    config = Config({'uploads': {'threads': 1, 'enabled': False}}, json_streaming=True)
+    calls = []
+
+    @config.hooks.item_values_changed
+    def item_values_changed(changes):
+        calls.append([c.item.name for c in changes])
+
+    config.json.load(path)
+
+    assert calls == [['threads', 'enabled']]
+    assert config.dump_values() == {'uploads': {'threads': 5, 'enabled': True}}
+
+
+@pytest.mark.parametrize('document', [
+    '{"uploads": {"threads": 5}',
+    '{"uploads": {"threads": 5}} {}',
+    '[]',
+    '{"unknown": "unterminated',
+])
+def test_json_streaming_load_raises_value_error_for_invalid_documents(document):
+    config = Config({'uploads': {'threads': 1}}, json_streaming=True)
+    with pytest.raises(ValueError):
+        config.json.loads(document)
+
+
+def test_json_streaming_load_of_truncated_document_changes_nothing(tmpdir):
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        f.write('{"uploads": {"threads": 5, "enabled": true')
+
+    config = Config({'uploads': {'threads': 1, 'enabled': False}}, json_streaming=True)
+    calls = []
+
+    @config.hooks.item_values_changed
+    def item_values_changed(changes):
+        calls.append(changes)
+
+    with pytest.raises(ValueError):
+        config.json.load(path)
+
+    assert config.uploads.threads.value == 1
+    assert config.uploads.enabled.value is False
+    assert calls == []
+
+
+def test_json_load_with_paths_loads_only_selected_subtrees(tmpdir):
+    schema = {'uploads': {'threads': 1, 'db': {'user': 'root'}}, 'downloads': {'threads': 1}, 'debug': False}
+    document = collections.OrderedDict([
+        ('downloads', {'threads': 'not even a number', 'nested': [{'x': '}'}]}),
+        ('uploads', {'threads': 5, 'db': {'user': 'admin'}}),
+        ('debug', True),
+    ])
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump(document, f)
+
+    config = Config(schema)
+    config.json.load(path, paths=['uploads.db', ('debug',)])
+    assert config.dump_values(with_defaults=False) == {'uploads': {'db': {'user': 'admin'}}, 'debug': True}
+
+    config = Config(schema)
+    config.json.loads(json.dumps(document), paths='uploads')
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 5, 'db': {'user': 'admin'}}}
+
+    config = Config(schema, load_workers=2)
+    config.json.load([path, path], paths=['debug'])
+    assert config.dump_values(with_defaults=False) == {'debug': True}
+
+    config = Config()
+    config.json.load(path, as_defaults=True, paths=['uploads.threads'])
+    assert config.dump_values(with_defaults=True) == {'uploads': {'threads': 5}}
+
+
+def test_json_streaming_load_notifies_listeners_of_values_set_before_an_invalid_value():
+    config = Config({'uploads': {'threads': 1, 'enabled': False}}, json_streaming=True)
+
+    with config.changeset_context() as ctx:
+        with pytest.raises(ValueError):
+            config.json.loads('{"uploads": {"enabled": true, "threads": "notanint"}}')
+
+    assert ctx.values == {config.uploads.enabled: True}
+
+    ctx.reset()
+    assert config.uploads.enabled.value is False
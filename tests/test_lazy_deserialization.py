@@ -0,0 +1,87 @@
+import pytest
+
+from configmanager import Config
+from configmanager.utils import deferred, not_set
+
+
+ini = '[uploads]\nthreads = 5\nenabled = yes\nretries = many\n'
+
+
+def create_config(**settings):
+    return Config({'uploads': {'threads': 1, 'enabled': False, 'retries': 3, 'tmp_dir': '/tmp'}}, **settings)
+
+
+def test_values_are_deserialized_when_loaded_by_default():
+    config = create_config()
+    with pytest.raises(ValueError):
+        config.configparser.loads(ini)
+
+
+def test_lazily_loaded_values_are_deserialized_on_first_read():
+    config = create_config(lazy_deserialization=True)
+    config.configparser.loads(ini)
+
+    threads = config.uploads.threads
+    assert threads._value is deferred
+    assert threads.raw_str_value == '5'
+    assert threads.str_value == '5'
+    assert not threads.is_default
+
+    assert threads.value == 5
+    assert threads._value == 5
+    assert threads.raw_str_value == '5'
+
+    assert config.uploads.enabled._value is deferred
+
+    # Invalid values fail when read
+    with pytest.raises(ValueError):
+        config.uploads.retries.get()
+
+    # Values set directly are never deferred
+    config.uploads.retries.value = '4'
+    assert config.uploads.retries._value == 4
+
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 5, 'enabled': True, 'retries': 4}}
+
+
+def test_raw_str_values_can_be_dropped_after_deserialization():
+    config = create_config(lazy_deserialization=True, drop_raw_str_values=True)
+    config.configparser.loads(ini)
+
+    threads = config.uploads.threads
+    assert threads.raw_str_value == '5'
+    assert threads.value == 5
+    assert threads.raw_str_value is not_set
+    assert threads.str_value == '5'
+
+    config = create_config(drop_raw_str_values=True)
+    config.configparser.loads('[uploads]\nthreads = 5\n')
+    assert config.uploads.threads._value == 5
+    assert config.uploads.threads.raw_str_value is not_set
+
+
+def test_listeners_are_notified_of_deserialized_values(monkeypatch):
+    config = create_config(lazy_deserialization=True)
+    config.configparser.loads('[uploads]\nthreads = 5\n')
+    monkeypatch.setenv('TESTAPP_UPLOADS_THREADS', '6')
+
+    item_calls = []
+    batches = []
+
+    @config.hooks.item_value_changed
+    def item_value_changed(item, old_value, new_value):
+        item_calls.append((item.name, old_value, new_value))
+
+    @config.hooks.item_values_changed
+    def item_values_changed(changes):
+        batches.append([(c.old_value, c.new_value) for c in changes])
+
+    with config.changeset_context() as ctx:
+        config.envvars.load('TESTAPP_')
+
+    assert item_calls == [('threads', 5, 6)]
+    assert batches == [[(5, 6)]]
+    assert ctx.values == {config.uploads.threads: 6}
+
+    ctx.reset()
+    assert config.uploads.threads.value == 5
@@ -0,0 +1,113 @@
+from configmanager import Config, Item
+
+
+def lazy_config(**kwargs):
+    return Config({
+        'uploads': {
+            'threads': 1,
+            'db': {
+                'user': 'root',
+            },
+        },
+        'downloads': {
+            'enabled': True,
+        },
+        'greeting': 'Hello',
+    }, lazy_schema=True, **kwargs)
+
+
+def is_materialised(section):
+    return section._lazy_schema is None
+
+
+def test_sub_sections_are_not_parsed_until_accessed():
+    config = lazy_config()
+
+    assert config.greeting.value == 'Hello'
+    assert not is_materialised(config.uploads)
+    assert not is_materialised(config.downloads)
+
+    assert config.uploads.threads.value == 1
+    assert is_materialised(config.uploads)
+    assert not is_materialised(config.uploads.db)
+    assert not is_materialised(config.downloads)
+
+    assert config['uploads.db.user'].value == 'root'
+    assert is_materialised(config.uploads.db)
+
+
+def test_lazy_config_behaves_like_eager_config():
+    config = lazy_config()
+    eager = Config(config.dump_values())
+
+    assert config.dump_values() == eager.dump_values()
+    assert list(config.iter_paths(recursive=True)) == list(eager.iter_paths(recursive=True))
+    assert config['uploads', 'db', 'user'].get_path() == ('uploads', 'db', 'user')
+
+
+def test_load_values_materialises_only_sections_being_loaded():
+    config = lazy_config()
+
+    config.load_values({'uploads': {'threads': 5}})
+
+    assert config.uploads.threads.value == 5
+    assert not is_materialised(config.uploads.db)
+    assert not is_materialised(config.downloads)
+
+
+def test_walks_over_tree_do_not_materialise_lazy_sections():
+    config = lazy_config(cache_values=True)
+
+    config.refresh_environment()
+    assert not is_materialised(config.uploads)
+
+    root = Config(frozen_values=True)
+    root.add_section('app', config)
+    assert not is_materialised(config.uploads)
+
+    assert root['app.uploads.db.user'].value == 'root'
+
+
+def test_lazily_parsed_items_see_settings_and_hooks_of_the_tree(monkeypatch):
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+
+    config = Config({
+        'uploads': {
+            'threads': Item(default=1, envvar=True),
+        },
+    }, lazy_schema=True)
+
+    added = []
+
+    @config.hooks.item_added_to_section
+    def item_added_to_section(subject=None, **kwargs):
+        added.append(subject.name)
+
+    assert added == []
+    assert config.uploads.threads.value == 23
+    assert added == ['threads']
+
+
+def test_items_controlled_by_envvars_in_unparsed_sections_are_dumped(monkeypatch):
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+
+    config = Config({
+        'uploads': {
+            'threads': Item(default=1, envvar=True),
+            'db': {
+                'user': 'root',
+            },
+        },
+        'downloads': {
+            'enabled': True,
+        },
+    }, lazy_schema=True)
+
+    assert not config.is_default
+    assert config.dump_values(with_defaults=False) == {'uploads': {'threads': 23}}
+    assert config.json.dumps() == Config({
+        'uploads': {
+            'threads': Item(default=1, envvar=True),
+        },
+    }).json.dumps()
+    assert not is_materialised(config.downloads)
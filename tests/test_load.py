@@ -2,7 +2,9 @@ import json
 
 import pytest
 
-from configmanager import Config
+from configmanager import Config, Section
+from configmanager.persistence import JsonReaderWriter, SourceCache
+from configmanager.utils import not_set
 
 
 @pytest.fixture
@@ -67,3 +69,279 @@ def test_load_sources_setting(config, tmpdir):
     assert wrapper.main.uploads.db.user.value == 'admin'
     assert wrapper.main.uploads.db.password.value == 'SECRET'
     assert wrapper.main.greeting.value == 'Hey!'
+
+
+@pytest.fixture
+def layered_sources(tmpdir):
+    paths = []
+
+    def write(name, content):
+        path = tmpdir.join(name).strpath
+        with open(path, 'w') as f:
+            f.write(content)
+        paths.append(path)
+
+    write('system.json', json.dumps({'uploads': {'enabled': True, 'threads': 2}, 'greeting': 'Hi'}))
+    write('site.ini', '[uploads]\nthreads = 3\n')
+    write('host.yaml', 'uploads:\n  db:\n    user: admin\n')
+    write('user.json', json.dumps({'uploads': {'threads': 4, 'db': {'password': 'x'}}}))
+
+    return paths + [tmpdir.join('nonexistent.json').strpath]
+
+
+def layered_schema():
+    return {
+        'uploads': {
+            'enabled': False,
+            'threads': 1,
+            'db': {'user': 'root', 'password': 'secret'},
+        },
+        'greeting': 'Hello',
+    }
+
+
+@pytest.mark.parametrize('load_executor', ['thread', 'process'])
+def test_load_sources_parsed_concurrently_are_applied_in_order(layered_sources, load_executor):
+    sequential = Config(layered_schema(), load_sources=layered_sources, auto_load=True)
+
+    concurrent = Config(
+        layered_schema(), load_sources=layered_sources, auto_load=True,
+        load_workers=4, load_executor=load_executor,
+    )
+
+    assert concurrent.dump_values() == sequential.dump_values() == {
+        'uploads': {
+            'enabled': True,
+            'threads': 4,
+            'db': {'user': 'admin', 'password': 'x'},
+        },
+        'greeting': 'Hi',
+    }
+
+
+@pytest.mark.parametrize('json_streaming', [False, True])
+def test_adapter_loads_list_of_sources_concurrently(tmpdir, json_streaming):
+    paths = []
+    for i in range(5):
+        paths.append(tmpdir.join('config{}.json'.format(i)).strpath)
+        with open(paths[-1], 'w') as f:
+            json.dump({'uploads': {'threads': i}} if i % 2 else {'greeting': 'Hello {}'.format(i)}, f)
+
+    config = Config(layered_schema(), load_workers=3, json_streaming=json_streaming)
+    calls = []
+
+    @config.hooks.item_values_changed
+    def item_values_changed(changes):
+        calls.append(len(changes))
+
+    config.json.load(paths)
+
+    assert config.uploads.threads.value == 3
+    assert config.greeting.value == 'Hello 4'
+    assert calls == [1, 1, 1, 1, 1]
+
+
+@pytest.mark.parametrize('json_streaming', [False, True])
+def test_invalid_source_raises_same_error_when_parsed_concurrently(tmpdir, json_streaming):
+    paths = [tmpdir.join('valid.json').strpath, tmpdir.join('invalid.json').strpath]
+    with open(paths[0], 'w') as f:
+        json.dump({'greeting': 'Hi'}, f)
+    with open(paths[1], 'w') as f:
+        f.write('{"greeting": "Hello"')
+
+    errors = []
+    for kwargs in [{}, {'load_workers': 2}, {'load_workers': 2, 'load_executor': 'process'}]:
+        config = Config(layered_schema(), json_streaming=json_streaming, **kwargs)
+        with pytest.raises(ValueError) as exc_info:
+            config.json.load(paths)
+        errors.append(exc_info.type)
+
+    assert len(set(errors)) == 1
+
+
+def test_unsupported_load_executor_raises_value_error(layered_sources):
+    with pytest.raises(ValueError):
+        Config(layered_schema(), load_sources=layered_sources, auto_load=True, load_workers=2, load_executor='fork')
+
+
+@pytest.mark.parametrize('cache_sources', [True, 'hash'])
+def test_unchanged_sources_are_not_parsed_again(layered_sources, cache_sources):
+    config = Config(layered_schema(), load_sources=layered_sources, cache_sources=cache_sources)
+    assert Config(layered_schema()).source_cache is None
+
+    config.load()
+    assert (config.source_cache.hits, config.source_cache.misses) == (0, 4)
+
+    config.uploads.threads.value = 100
+    config.load()
+    assert (config.source_cache.hits, config.source_cache.misses) == (4, 4)
+
+    # Values of unchanged sources are still applied
+    assert config.uploads.threads.value == 4
+
+    with open(layered_sources[-2], 'w') as f:
+        json.dump({'uploads': {'threads': 555}}, f)
+
+    config.load()
+    assert (config.source_cache.hits, config.source_cache.misses) == (7, 5)
+    assert config.uploads.threads.value == 555
+
+
+def test_cached_contents_are_not_shared_with_items(tmpdir):
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'hosts': ['a', ['b', 'c']]}, f)
+
+    config = Config({'hosts': []}, load_sources=[path], cache_sources=True)
+    config.load()
+    config.hosts.value[1].append('d')
+
+    config.load()
+    assert config.source_cache.hits == 1
+    assert config.hosts.value == ['a', ['b', 'c']]
+
+
+def test_source_cache_does_not_share_contents_between_reader_writers_with_different_options(tmpdir):
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'greeting': 'Hi'}, f)
+
+    cache = SourceCache()
+    fingerprint, parsed = cache.lookup(JsonReaderWriter(), path)
+    assert parsed is not_set
+    cache.store(JsonReaderWriter(), path, fingerprint, {'greeting': 'Hi'})
+
+    assert cache.lookup(JsonReaderWriter(), path)[1] == {'greeting': 'Hi'}
+    assert cache.lookup(JsonReaderWriter(streaming=True), path)[1] is not_set
+
+
+def test_hash_detects_changes_which_dont_change_mtime_or_size(tmpdir):
+    import os
+
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'greeting': 'Hi'}, f)
+    stat = os.stat(path)
+
+    by_stat = Config(layered_schema(), load_sources=[path], cache_sources=True)
+    by_hash = Config(layered_schema(), load_sources=[path], cache_sources='hash')
+    by_stat.load()
+    by_hash.load()
+
+    with open(path, 'w') as f:
+        json.dump({'greeting': 'Yo'}, f)
+    if hasattr(stat, 'st_mtime_ns'):
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    else:
+        os.utime(path, (stat.st_atime, stat.st_mtime))
+
+    by_stat.load()
+    by_hash.load()
+
+    assert by_stat.greeting.value == 'Hi'
+    assert by_hash.greeting.value == 'Yo'
+
+
+def test_source_shared_by_nested_configs_is_parsed_once(tmpdir, monkeypatch):
+    from configmanager.persistence import JsonReaderWriter
+
+    path = tmpdir.join('shared.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'user': 'admin', 'hosts': ['a']}, f)
+
+    parsed = []
+    parse_file = JsonReaderWriter.parse_file
+
+    def counting_parse_file(self, file_obj, **kwargs):
+        parsed.append(file_obj.name)
+        return parse_file(self, file_obj, **kwargs)
+
+    monkeypatch.setattr(JsonReaderWriter, 'parse_file', counting_parse_file)
+
+    db = Config({'user': 'root', 'hosts': []}, load_sources=[path])
+    other_db = Config({'user': 'root', 'hosts': []}, load_sources=[path])
+    config = Config({
+        'uploads': {'db': db},
+        'downloads': {'db': other_db},
+        'user': 'nobody',
+        'hosts': [],
+    }, load_sources=[path])
+
+    config.load()
+
+    assert parsed == [path]
+    assert config.user.value == 'admin'
+    assert config.uploads.db.user.value == 'admin'
+    assert config.downloads.db.user.value == 'admin'
+    assert config.downloads.db.hosts.value == ['a']
+
+    config.uploads.db.hosts.value.append('b')
+    assert config.downloads.db.hosts.value == ['a']
+    assert config.hosts.value == ['a']
+
+
+def test_nested_configs_are_loaded_in_tree_order(tmpdir):
+    paths = []
+    for i in range(3):
+        paths.append(tmpdir.join('config{}.json'.format(i)).strpath)
+        with open(paths[-1], 'w') as f:
+            json.dump({'db': {'user': 'user{}'.format(i)}}, f)
+
+    inner = Config({'user': 'root'})
+    middle = Config({'db': inner}, load_sources=[paths[0]])
+    config = Config({'uploads': middle, 'greeting': 'Hello'}, load_sources=[paths[1]])
+    assert [path for path, _ in config._iter_nested_configs()] == [('uploads',), ('uploads', 'db')]
+    assert [path for path, _ in middle._iter_nested_configs()] == [('db',)]
+
+    # Sources of higher-up configs override sources of lower ones
+    inner.settings.load_sources.append(paths[2])
+    with open(paths[2], 'w') as f:
+        json.dump({'user': 'inner'}, f)
+    config.load()
+    assert inner.user.value == 'user0'
+
+    config.uploads = Config({'db': Config({'user': 'root'})})
+    assert [path for path, _ in config._iter_nested_configs()] == [('uploads',), ('uploads', 'db')]
+    assert config['uploads', 'db'] is not inner
+
+    # Configs stay in the index when configs nested in them are replaced
+    config.uploads.db = Section({'user': 'root'})
+    assert [path for path, _ in config._iter_nested_configs()] == [('uploads',)]
+
+
+def test_load_does_not_parse_lazy_sections(tmpdir):
+    path = tmpdir.join('config.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'uploads': {'threads': 5}}, f)
+
+    config = Config(
+        {'uploads': {'threads': 1}, 'downloads': {'threads': 1}},
+        lazy_schema=True, load_sources=[path], auto_load=True,
+    )
+
+    assert config.uploads.threads.value == 5
+    assert config.downloads._lazy_schema is not None
+
+
+def test_load_loads_nested_configs_declared_in_lazy_sections(tmpdir):
+    path = tmpdir.join('db.json').strpath
+    with open(path, 'w') as f:
+        json.dump({'user': 'admin'}, f)
+
+    config = Config({
+        'uploads': {
+            'threads': 1,
+            'db': Config({'user': 'root'}, load_sources=[path]),
+        },
+        'downloads': {'threads': 1},
+    }, lazy_schema=True)
+
+    assert config.uploads._lazy_schema is not None
+    assert list(config._iter_nested_configs(materialise=False)) == []
+    assert config.uploads._lazy_schema is not None
+
+    config.load()
+
+    assert config.uploads.db.user.value == 'admin'
+    assert config.downloads._lazy_schema is not None
+    assert list(config._iter_nested_configs()) == [(('uploads', 'db'), config.uploads.db)]
@@ -0,0 +1,125 @@
+import pytest
+
+from configmanager import Config, Item, Section, NotFound
+
+
+@pytest.fixture
+def config():
+    return Config({
+        'uploads': {
+            'enabled': False,
+            'db': {
+                'user': 'root',
+            },
+        },
+        'greeting': 'Hello',
+    })
+
+
+def test_config_builds_index_of_tuple_paths_on_first_path_lookup(config):
+    assert config._path_index is None
+    assert config.uploads.enabled.value is False
+    assert config._path_index is None
+
+    assert config['uploads.db.user'] is config.uploads.db.user
+    index = config._path_index
+
+    assert index[('uploads',)] is config.uploads
+    assert index[('uploads', 'db', 'user')] is config.uploads.db.user
+    assert index[('greeting',)] is config.greeting
+
+    assert len(index) == 5
+
+
+def test_plain_sections_do_not_maintain_index():
+    section = Section({'uploads': {'enabled': True}})
+    assert section._path_index is None
+    assert section['uploads.enabled'].value is True
+
+
+def test_index_is_updated_when_items_and_sections_are_added(config):
+    config._get_path_index()
+
+    config.uploads.db.add_item('password', Item(default='secret'))
+    assert config._path_index[('uploads', 'db', 'password')] is config.uploads.db.password
+
+    config.uploads.add_section('api', Section({'host': 'localhost'}))
+    assert config._path_index[('uploads', 'api', 'host')] is config.uploads.api.host
+
+    config.uploads.tmp = Item(default='/tmp', name='tmp_dir')
+    assert config['uploads.tmp'] is config['uploads.tmp_dir']
+    assert config._path_index[('uploads', 'tmp')] is config.uploads.tmp_dir
+
+
+def test_replaced_section_is_removed_from_index(config):
+    config._get_path_index()
+
+    config.uploads.db = Section({'host': 'localhost'})
+
+    assert ('uploads', 'db', 'user') not in config._path_index
+    assert ('uploads', 'db', 'user') not in config
+    assert config['uploads.db.host'].value == 'localhost'
+
+    config.uploads.db = Item(default='sqlite')
+    assert ('uploads', 'db', 'host') not in config._path_index
+    assert config['uploads.db'].value == 'sqlite'
+
+
+def test_nested_configs_index_paths_relative_to_themselves():
+    db = Config({'user': 'root'})
+    config = Config({'uploads': {'db': db}})
+
+    assert config['uploads.db.user'] is db.user
+    assert config._path_index[('uploads', 'db', 'user')] is db.user
+    assert db._path_index is None
+
+    db.add_item('password', Item(default='secret'))
+    assert config._path_index[('uploads', 'db', 'password')] is db.password
+
+    db._get_path_index()
+    assert db._path_index[('password',)] is db.password
+
+
+def test_path_lookups_use_index(config):
+    assert config['uploads.db.user'] is config.uploads.db.user
+    assert config['uploads', 'db', 'user'] is config.uploads.db.user
+    assert config.get_item('uploads', 'db', 'user') is config.uploads.db.user
+    assert config.get_item('uploads.db.user') is config.uploads.db.user
+    assert config.get_section('uploads.db') is config.uploads.db
+
+    config['uploads', 'db', 'password'] = Item(default='secret')
+    assert config['uploads.db.password'].value == 'secret'
+
+    with pytest.raises(NotFound):
+        _ = config['uploads.db.host']
+
+
+def test_index_respects_custom_str_path_separator():
+    config = Config({'a.b': {'c': 1}}, str_path_separator='/')
+    assert config['a.b/c'].value == 1
+    assert config._path_index[('a.b', 'c')] is config['a.b', 'c']
+
+
+def test_index_is_not_pickled():
+    import pickle
+
+    config = Config({'uploads': {'db': {'user': 'root'}}})
+    assert config['uploads.db.user'].value == 'root'
+
+    config = pickle.loads(pickle.dumps(config))
+    assert config._path_index is None
+    assert config['uploads.db.user'] is config.uploads.db.user
+
+
+def test_flat_load_values_resolves_paths_directly(config):
+    config.load_values({
+        'uploads.db.user': 'admin',
+        'uploads.enabled': True,
+        'uploads.nonexistent': 5,
+        'greeting': 'Hey',
+    }, flat=True)
+
+    assert config.dump_values(with_defaults=False) == {
+        'uploads': {'db': {'user': 'admin'}, 'enabled': True},
+        'greeting': 'Hey',
+    }
@@ -99,3 +99,30 @@ def test_hooks_work(schema):
 
     config.uploads.db.user = 'admin'
     assert calls == ['enabled', 'user']
+
+
+def test_sections_of_plain_config_are_plain_sections(schema):
+    from configmanager.plain import PlainSection
+
+    config = PlainConfig(schema, lazy_schema=True)
+    assert isinstance(config.uploads, PlainSection)
+    assert isinstance(config['uploads']['db'], PlainSection)
+    assert config.uploads.db.user == 'root'
+    assert config['uploads']['db']['user'] == 'root'
+
+    config.uploads.db.user = 'admin'
+    assert config.uploads.db.user == 'admin'
+    assert config.dump_values(with_defaults=False) == {'uploads': {'db': {'user': 'admin'}}}
+
+
+def test_plain_config_resolves_keyword_names_and_dynamic_items_like_other_configs():
+    config = PlainConfig({'class': 'first'})
+
+    @config.hooks.not_found
+    def not_found(name=None, section=None):
+        if name == 'dynamic':
+            return Item(name=name, default=42)
+
+    assert config.class_ == 'first'
+    assert config.dynamic == 42
+    assert config['dynamic'] == 42
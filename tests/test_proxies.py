@@ -1,3 +1,6 @@
+import pytest
+
+from configmanager import Config, Item, NotFound
 from configmanager.sections import PathProxy
 
 
@@ -42,3 +45,30 @@ def test_get_proxy_handles_both_sections_and_items(simple_config):
 
     assert downloads_enabled.is_item
     assert downloads_enabled.value is True
+
+
+def test_accessor_returns_item_value_and_resolves_item_again_after_structure_changes(simple_config):
+    threads = simple_config.accessor('uploads.threads')
+    assert threads() == 1
+
+    simple_config.uploads.threads.value = 5
+    assert threads() == 5
+    item = threads.item
+
+    simple_config.uploads.add_item('threads', Item(default=3))
+    assert threads.item is not item
+    assert threads() == 3
+
+    simple_config.add_section('uploads', Config({'threads': 7}))
+    assert threads() == 7
+
+    user = simple_config.uploads.accessor('db', 'user')
+    with pytest.raises(NotFound):
+        user()
+
+    simple_config.uploads.add_schema({'db': {'user': 'admin'}})
+    assert user() == 'admin'
+    assert user.item is simple_config.uploads.db.user
+
+    with pytest.raises(RuntimeError):
+        simple_config.accessor('uploads')()
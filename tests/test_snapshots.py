@@ -0,0 +1,191 @@
+import json
+import os
+import stat
+
+import pytest
+
+from configmanager import Config, Item, CompactItem, EnvvarSource, PlainConfig
+from configmanager.utils import not_set
+
+
+@pytest.fixture
+def sources(tmpdir):
+    json_path = tmpdir.join('config.json').strpath
+    with open(json_path, 'w') as f:
+        json.dump({'uploads': {'threads': 5}}, f)
+    return [json_path, tmpdir.join('missing.ini').strpath]
+
+
+def create_config(sources, **settings):
+    return Config({
+        'uploads': {
+            'threads': 1,
+            'enabled': Item(type=bool, default=False, envvar=True),
+            'db': Config({'user': 'root', 'password': Item()}),
+        },
+        'hosts': ['a', 'b'],
+    }, load_sources=sources, auto_load=True, **settings)
+
+
+def test_snapshot_round_trip(sources, tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    config = create_config(sources, item_factory=CompactItem)
+    config.dump_snapshot(snapshot_path)
+
+    loaded = Config.from_snapshot(snapshot_path)
+
+    assert loaded is not config
+    assert loaded.dump_values() == config.dump_values()
+    assert loaded.uploads.threads.value == 5
+    assert not loaded.uploads.threads.is_default
+    assert loaded.uploads.threads.default == 1
+    assert loaded.uploads.db.password.value is not_set
+    assert isinstance(loaded.uploads.threads, CompactItem)
+    assert loaded['uploads.db.user'] is loaded.uploads.db.user
+    assert loaded.uploads.db.settings.load_sources == []
+    assert loaded.settings.load_sources == sources
+
+
+def test_plain_config_snapshot_round_trip(tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    config = PlainConfig({'greeting': 'Hello', 'db': {'user': 'root'}})
+    config.db.user = 'admin'
+    config.dump_snapshot(snapshot_path)
+
+    loaded = Config.from_snapshot(snapshot_path)
+
+    assert isinstance(loaded, PlainConfig)
+    assert loaded.greeting == 'Hello'
+    assert loaded.db.user == 'admin'
+    assert loaded['db.user'] == 'admin'
+    loaded.greeting = 'Hi'
+    assert loaded.greeting == 'Hi'
+    assert config.greeting == 'Hello'
+    assert config['db.user'] == 'admin'
+
+
+def test_snapshot_with_broken_contents_is_not_loaded(sources, tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    create_config(sources).dump_snapshot(snapshot_path)
+
+    with open(snapshot_path, 'rb') as f:
+        data = f.read()
+    with open(snapshot_path, 'wb') as f:
+        f.write(data[:-20])
+
+    assert Config.from_snapshot(snapshot_path) is None
+
+
+def test_snapshot_does_not_preserve_hooks_but_allows_registering_them_again(sources, tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    config = create_config(sources)
+
+    @config.hooks.item_value_changed
+    def item_value_changed(item):
+        raise AssertionError('Should not be called')
+
+    config.dump_snapshot(snapshot_path)
+    loaded = Config.from_snapshot(snapshot_path)
+
+    calls = []
+
+    @loaded.hooks.item_value_changed
+    def record(item):
+        calls.append(item.name)
+
+    loaded.uploads.threads.value = 6
+    assert calls == ['threads']
+
+
+def test_environment_is_consulted_after_snapshot_is_loaded(sources, tmpdir, monkeypatch):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    config = create_config(sources, cache_values=True)
+    assert config.uploads.enabled.value is False
+    config.dump_snapshot(snapshot_path)
+
+    monkeypatch.setenv('UPLOADS_ENABLED', 'yes')
+    assert Config.from_snapshot(snapshot_path).uploads.enabled.value is True
+
+
+def test_snapshot_is_not_loaded_if_sources_or_key_changed(sources, tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+
+    assert Config.from_snapshot(snapshot_path) is None
+
+    create_config(sources).dump_snapshot(snapshot_path, key='v1')
+    assert Config.from_snapshot(snapshot_path) is None
+    assert Config.from_snapshot(snapshot_path, key='v2') is None
+    assert Config.from_snapshot(snapshot_path, key='v1') is not None
+
+    # Touching a file without changing it doesn't invalidate the snapshot
+    stat = os.stat(sources[0])
+    os.utime(sources[0], (stat.st_atime + 10, stat.st_mtime + 10))
+    assert Config.from_snapshot(snapshot_path, key='v1') is not None
+
+    with open(sources[0], 'w') as f:
+        json.dump({'uploads': {'threads': 6}}, f)
+    assert Config.from_snapshot(snapshot_path, key='v1') is None
+
+    create_config(sources).dump_snapshot(snapshot_path)
+    assert Config.from_snapshot(snapshot_path).uploads.threads.value == 6
+
+    with open(sources[1], 'w') as f:
+        f.write('[uploads]\nthreads = 7\n')
+    assert Config.from_snapshot(snapshot_path) is None
+
+
+def test_snapshot_of_a_nested_config_cannot_be_created(sources, tmpdir):
+    config = create_config(sources)
+    with pytest.raises(ValueError):
+        config.uploads.db.dump_snapshot(tmpdir.join('config.snapshot').strpath)
+
+
+def test_invalid_snapshot_is_not_loaded(tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    with open(snapshot_path, 'wb') as f:
+        f.write(b'not a snapshot')
+    assert Config.from_snapshot(snapshot_path) is None
+
+
+def test_snapshot_is_not_loaded_if_environment_variables_of_envvar_source_changed(tmpdir, monkeypatch):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    monkeypatch.setenv('TESTAPP_THREADS', '5')
+
+    config = Config({'threads': 1}, load_sources=[EnvvarSource('TESTAPP_')], auto_load=True)
+    config.dump_snapshot(snapshot_path)
+    assert Config.from_snapshot(snapshot_path).threads.value == 5
+
+    monkeypatch.setenv('TESTAPP_THREADS', '6')
+    assert Config.from_snapshot(snapshot_path) is None
+
+
+def test_environment_variable_values_are_not_stored_in_snapshot(tmpdir, monkeypatch):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+    monkeypatch.setenv('TESTAPP_THREADS', '5')
+    monkeypatch.setenv('TESTAPP_API_TOKEN', 'very-secret-password')
+
+    # API_TOKEN has no item, so only the fingerprint of the source could leak it
+    config = Config({'threads': 1}, load_sources=[EnvvarSource('TESTAPP_')], auto_load=True)
+    config.dump_snapshot(snapshot_path)
+
+    with open(snapshot_path, 'rb') as f:
+        assert b'very-secret-password' not in f.read()
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX file permissions')
+def test_snapshot_writable_by_other_users_is_not_loaded(sources, tmpdir):
+    snapshot_path = tmpdir.join('config.snapshot').strpath
+
+    umask = os.umask(0o002)
+    try:
+        create_config(sources).dump_snapshot(snapshot_path)
+    finally:
+        os.umask(umask)
+    assert not os.stat(snapshot_path).st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    assert Config.from_snapshot(snapshot_path) is not None
+
+    os.chmod(snapshot_path, 0o664)
+    assert Config.from_snapshot(snapshot_path) is None
+
+    os.chmod(snapshot_path, 0o646)
+    assert Config.from_snapshot(snapshot_path) is None
@@ -0,0 +1,158 @@
+from configmanager import Config, Item
+
+
+def test_values_are_not_cached_by_default(monkeypatch):
+    config = Config({'uploads': {'threads': Item(default=1, envvar=True)}})
+
+    assert config.uploads.threads.value == 1
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    assert config.uploads.threads.value == 23
+
+
+def test_cached_value_invalidated_by_set_reset_and_default_change():
+    config = Config({'uploads': {'threads': 1}}, cache_values=True)
+    threads = config.uploads.threads
+
+    assert threads.value == 1
+    assert threads._cached_value == (1, 'default')
+
+    threads.value = 5
+    assert threads.value == 5
+    assert not threads.is_default
+
+    threads.default = 5
+    assert threads.is_default
+
+    threads.reset()
+    assert threads.value == 5
+
+    threads.default = 3
+    assert threads.value == 3
+    assert threads.has_value
+
+
+def test_cached_default_is_still_returned_as_a_copy():
+    config = Config({'hosts': ['a', 'b']}, cache_values=True)
+
+    config.hosts.value.append('c')
+    assert config.hosts.value == ['a', 'b']
+
+
+def test_envvar_lookups_are_cached_until_environment_refreshed(monkeypatch):
+    config = Config({'uploads': {'threads': Item(default=1, envvar=True)}}, cache_values=True)
+    threads = config.uploads.threads
+
+    assert threads.value == 1
+    assert threads._cached_envvar_name == 'UPLOADS_THREADS'
+
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    assert threads.value == 1
+    assert threads.is_default
+
+    config.refresh_environment()
+    assert threads.value == 23
+    assert not threads.is_default
+
+    threads.envvar_name = 'OTHER_UPLOADS_THREADS'
+    assert threads.value == 1
+
+    monkeypatch.setenv('OTHER_UPLOADS_THREADS', '42')
+    config.uploads.refresh_environment()
+    assert threads.value == 42
+
+
+def test_envvar_changes_are_visible_once_caching_is_disabled(monkeypatch):
+    config = Config({'uploads': {'threads': Item(default=1, envvar=True)}}, cache_values=True)
+
+    assert config.uploads.threads.value == 1
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    assert config.uploads.threads.value == 1
+
+    config.settings.cache_values = False
+    assert config.uploads.threads.value == 23
+
+    monkeypatch.setenv('UPLOADS_THREADS', '42')
+    assert config.uploads.threads.value == 42
+
+
+def test_cached_envvar_name_invalidated_when_section_moves(monkeypatch):
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    monkeypatch.setenv('APP_UPLOADS_THREADS', '42')
+
+    uploads = Config({'threads': Item(default=1, envvar=True)}, cache_values=True)
+    assert uploads.threads.value == 1
+
+    config = Config(cache_values=True)
+    config.add_section('uploads', uploads)
+    assert uploads.threads.value == 23
+
+    app = Config(cache_values=True)
+    app.add_section('app', config)
+    assert uploads.threads.value == 42
+
+
+def test_registering_dynamic_item_attribute_invalidates_cache(monkeypatch):
+    monkeypatch.setenv('TEST_UPLOADS_THREADS', '23')
+
+    config = Config({'uploads': {'threads': Item(default=1, envvar=True)}}, cache_values=True)
+    assert config.uploads.threads.value == 1
+
+    @config.item_attribute
+    def envvar_name(item=None, **kwargs):
+        return 'TEST_{}'.format('_'.join(item.get_path()).upper())
+
+    assert config.uploads.threads.value == 23
+
+
+def test_cached_envvar_name_of_nested_caching_config_invalidated_when_outer_section_moves(monkeypatch):
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    monkeypatch.setenv('APP_UPLOADS_THREADS', '42')
+
+    config = Config()
+    config.add_section('uploads', Config({'threads': Item(default=1, envvar=True)}, cache_values=True))
+    assert config.uploads.threads.value == 23
+
+    app = Config()
+    app.add_section('app', config)
+    assert config.uploads.threads.value == 42
+
+
+def test_dynamic_item_attribute_of_non_caching_config_invalidates_cache_of_nested_config(monkeypatch):
+    monkeypatch.setenv('TEST_UPLOADS_THREADS', '23')
+
+    config = Config()
+    config.add_section('uploads', Config({'threads': Item(default=1, envvar=True)}, cache_values=True))
+    assert config.uploads.threads.value == 1
+
+    @config.item_attribute
+    def envvar_name(item=None, **kwargs):
+        return 'TEST_{}'.format('_'.join(item.get_path()).upper())
+
+    assert config.uploads.threads.value == 23
+
+
+def test_changeset_reset_invalidates_cache():
+    config = Config({'uploads': {'threads': 1}}, cache_values=True)
+
+    with config.changeset_context() as ctx:
+        config.uploads.threads.value = 5
+        assert config.uploads.threads.value == 5
+
+    ctx.reset()
+    assert config.uploads.threads.value == 1
+
+
+def test_environment_is_not_refreshed_when_no_values_are_cached(monkeypatch):
+    from configmanager import Section
+
+    def refresh_environment(self):
+        raise AssertionError('Should not refresh environment')
+
+    monkeypatch.setattr(Section, 'refresh_environment', refresh_environment)
+
+    config = Config({'uploads': {'db': {'user': 'root'}}})
+    Config().add_section('app', config)
+
+    @config.item_attribute
+    def envvar_name(item=None, **kwargs):
+        return None
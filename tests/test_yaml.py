@@ -77,3 +77,66 @@ def test_config_written_to_and_read_from_yaml_string():
         'uploads', 'uploads.enabled', 'uploads.threads', 'uploads.db', 'uploads.db.user'
     ]
     assert config2.dump_values() == config.dump_values()
+
+
+def test_yaml_adapter_does_not_modify_global_yaml_registries():
+    import collections
+    import yaml
+
+    loader_constructors = dict(yaml.Loader.yaml_constructors)
+    dumper_representers = dict(yaml.Dumper.yaml_representers)
+
+    config = Config({'uploads': {'threads': 1}})
+    config.yaml.loads('uploads:\n  threads: 5\n')
+    assert config.uploads.threads.value == 5
+
+    assert yaml.Loader.yaml_constructors == loader_constructors
+    assert yaml.Dumper.yaml_representers == dumper_representers
+    assert collections.OrderedDict not in yaml.SafeDumper.yaml_representers
+
+
+def test_yaml_adapter_uses_safe_loader_and_dumper():
+    import yaml
+
+    config = Config({'hosts': ['a', 'b']}, frozen_values=True)
+    rw = config.yaml._rw
+
+    assert issubclass(rw.loader_cls, getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    assert issubclass(rw.dumper_cls, getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+
+    with pytest.raises(yaml.YAMLError):
+        config.yaml.loads('hosts: !!python/object/apply:os.getcwd []\n')
+
+    assert config.yaml.dumps(with_defaults=True) == 'hosts:\n- a\n- b\n'
+
+
+def test_yaml_merge_keys_are_supported():
+    config = Config({'base': {'user': 'root', 'host': 'localhost'}, 'db': {'user': 'root', 'host': 'localhost'}})
+    config.yaml.loads(
+        'base: &base\n'
+        '  user: admin\n'
+        '  host: example.com\n'
+        'db:\n'
+        '  <<: *base\n'
+        '  user: db_admin\n'
+    )
+    assert config.dump_values() == {
+        'base': {'user': 'admin', 'host': 'example.com'},
+        'db': {'user': 'db_admin', 'host': 'example.com'},
+    }
+
+
+def test_yaml_load_with_paths_constructs_only_selected_subtrees():
+    config = Config({'base': {'user': 'root'}, 'db': {'user': 'root', 'host': 'localhost'}, 'debug': False})
+    config.yaml.loads(
+        'base: &base\n'
+        '  user: admin\n'
+        '  host: example.com\n'
+        'db:\n'
+        '  <<: *base\n'
+        '  user: db_admin\n'
+        'other: !!python/object/apply:os.getcwd []\n'
+        'debug: true\n',
+        paths=['db.host', 'debug'],
+    )
+    assert config.dump_values(with_defaults=False) == {'db': {'host': 'example.com'}, 'debug': True}